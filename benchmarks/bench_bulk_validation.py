@@ -0,0 +1,46 @@
+"""Benchmark of BulkConfigValidator over a directory of config files.
+
+Compares validating the files in the calling process with the process pool.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+
+from configs import large_pipeline_config
+
+from glassflow.etl import BulkConfigValidator
+
+
+def _write_configs(directory: str, files: int) -> None:
+    config = large_pipeline_config(sources=5, fields=50)
+    for i in range(files):
+        config["pipeline_id"] = f"pipeline-{i}"
+        with open(os.path.join(directory, f"pipeline-{i}.json"), "w") as f:
+            json.dump(config, f)
+
+
+def _time(validator: BulkConfigValidator, directory: str) -> float:
+    started = time.perf_counter()
+    report = validator.validate([directory])
+    assert report.valid
+    return (time.perf_counter() - started) * 1000
+
+
+def main() -> None:
+    workers = os.cpu_count() or 1
+    for files in (100, 1000):
+        with tempfile.TemporaryDirectory() as directory:
+            _write_configs(directory, files)
+            sequential = _time(BulkConfigValidator(max_workers=1), directory)
+            parallel = _time(BulkConfigValidator(), directory)
+        print(f"{files} files")
+        print(f"  {'sequential':<16} {sequential:8.1f} ms")
+        print(f"  {f'{workers} workers':<16} {parallel:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
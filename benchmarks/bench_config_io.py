@@ -0,0 +1,71 @@
+"""Benchmark of reading and writing a bundle of pipeline configs.
+
+Compares ``config_io`` with the pure-Python pyyaml and standard library json
+calls previously used by ``Pipeline.to_yaml`` / ``from_yaml`` and
+``to_json`` / ``from_json``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import timeit
+from typing import List, Tuple
+
+import yaml
+from configs import large_pipeline_config
+
+from glassflow.etl import config_io
+
+REPEAT = 3
+
+
+def _time(func) -> float:
+    return min(timeit.repeat(func, number=REPEAT, repeat=3)) / REPEAT * 1000
+
+
+def _measure(directory: str, configs: List[dict]) -> List[Tuple[str, float]]:
+    yaml_path = os.path.join(directory, "bundle.yaml")
+    json_path = os.path.join(directory, "bundle.json")
+
+    def write_yaml_before():
+        with open(yaml_path, "w") as f:
+            yaml.dump_all(configs, f, default_flow_style=False)
+
+    def read_yaml_before():
+        with open(yaml_path) as f:
+            return list(yaml.safe_load_all(f))
+
+    def write_json_before():
+        with open(json_path, "w") as f:
+            json.dump(configs, f, indent=4)
+
+    def read_json_before():
+        with open(json_path) as f:
+            return json.load(f)
+
+    return [
+        ("yaml write before", _time(write_yaml_before)),
+        ("yaml write after", _time(lambda: config_io.save_bundle(yaml_path, configs))),
+        ("yaml read before", _time(read_yaml_before)),
+        ("yaml read after", _time(lambda: list(config_io.iter_documents(yaml_path)))),
+        ("json write before", _time(write_json_before)),
+        ("json write after", _time(lambda: config_io.save_bundle(json_path, configs))),
+        ("json read before", _time(read_json_before)),
+        ("json read after", _time(lambda: list(config_io.iter_documents(json_path)))),
+    ]
+
+
+def main() -> None:
+    print(f"yaml: {config_io._loader().__name__}, json: {config_io.jsonlib.BACKEND}")
+    configs = [large_pipeline_config(sources=5, fields=50) for _ in range(100)]
+    with tempfile.TemporaryDirectory() as directory:
+        rows = _measure(directory, configs)
+    print("100 configs x 5 sources x 50 fields")
+    for name, ms in rows:
+        print(f"  {name:<18} {ms:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
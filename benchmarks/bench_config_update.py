@@ -0,0 +1,48 @@
+"""Benchmark of applying patches to large pipeline configs.
+
+``validate=True`` re-runs only the checks reading the patched sections; the
+``config_errors()`` row is the cost of all the checks for comparison.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from configs import large_pipeline_config
+
+from glassflow.etl import models
+
+REPEAT = 20
+
+PATCHES = {
+    "name": models.PipelineConfigPatch(name="Renamed"),
+    "sink table": models.PipelineConfigPatch(
+        sink=models.SinkConfigPatch(table="events_v2")
+    ),
+    "resources": models.PipelineConfigPatch(
+        resources=models.PipelineResourcesConfig(sink=models.SinkResources(replicas=3))
+    ),
+}
+
+
+def _time(func) -> float:
+    return min(timeit.repeat(func, number=REPEAT, repeat=3)) / REPEAT * 1000
+
+
+def main() -> None:
+    for sources in (10, 100, 500):
+        config = models.PipelineConfig.model_validate(
+            large_pipeline_config(sources=sources, fields=50)
+        )
+        transforms = models.PipelineConfigPatch(transforms=config.transforms[::-1])
+        patches = {**PATCHES, "transforms": transforms}
+        print(f"{sources} sources x 50 fields")
+        print(f"  {'config_errors()':<24} {_time(config.config_errors):8.3f} ms")
+        for name, patch in patches.items():
+            update = _time(lambda c=config, p=patch: c.update(p))
+            validated = _time(lambda c=config, p=patch: c.update(p, validate=True))
+            print(f"  {name:<24} {update:8.3f} ms {validated:8.3f} ms validated")
+
+
+if __name__ == "__main__":
+    main()
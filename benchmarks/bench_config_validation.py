@@ -0,0 +1,40 @@
+"""Benchmark of PipelineConfig validation as the number of sources grows.
+
+``config_errors`` is the cross-reference check run by ``validate_config``;
+``model_validate`` is the full validation of the config dict.
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import List, Tuple
+
+from configs import large_pipeline_config
+
+from glassflow.etl import models
+
+REPEAT = 5
+
+
+def _time(func) -> float:
+    return min(timeit.repeat(func, number=REPEAT, repeat=3)) / REPEAT * 1000
+
+
+def _measure(config: dict) -> List[Tuple[str, float]]:
+    pipeline_config = models.PipelineConfig.model_validate(config)
+    return [
+        ("config_errors", _time(pipeline_config.config_errors)),
+        ("model_validate", _time(lambda: models.PipelineConfig.model_validate(config))),
+    ]
+
+
+def main() -> None:
+    for sources in (10, 100, 1000):
+        rows = _measure(large_pipeline_config(sources=sources, fields=20))
+        print(f"{sources} sources x 20 fields")
+        for name, ms in rows:
+            print(f"  {name:<16} {ms:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Benchmark of the import time of the SDK, checked against a budget.
+
+Every statement runs in a fresh interpreter; the time of starting an empty
+interpreter is subtracted. Exits with status 1 when a statement is over its
+budget, so the script can run in CI.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+
+RUNS = 10
+
+# Budgets in ms, generous enough for slow CI machines
+BUDGETS = {
+    "import glassflow.etl": 25.0,
+    "from glassflow.etl import PipelineConfig": 350.0,
+    "from glassflow.etl import Client": 450.0,
+}
+
+
+def _time(statement: str) -> float:
+    timings = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    baseline = _time("pass")
+    over_budget = False
+    for statement, budget in BUDGETS.items():
+        ms = _time(statement) - baseline
+        status = "ok" if ms <= budget else "OVER BUDGET"
+        over_budget = over_budget or ms > budget
+        print(f"  {statement:<42} {ms:8.1f} ms  (budget {budget:.0f} ms) {status}")
+    if over_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
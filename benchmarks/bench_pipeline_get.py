@@ -0,0 +1,69 @@
+"""Benchmark of loading server-returned configs with Pipeline.get().
+
+``lazy=True`` defers building and validating the config until it is first
+accessed, so callers that only need the status or the ID skip its cost.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import timeit
+from typing import List, Tuple
+
+os.environ.setdefault("GF_USAGESTATS_ENABLED", "false")
+
+import httpx  # noqa: E402
+from configs import large_pipeline_config  # noqa: E402
+
+from glassflow.etl import Pipeline, models  # noqa: E402
+
+REPEAT = 20
+
+
+def _pipeline(config: dict) -> Pipeline:
+    body = json.dumps(config).encode()
+    health = json.dumps(
+        {"pipeline_id": config["pipeline_id"], "overall_status": "Running"}
+    ).encode()
+    headers = {"content-type": "application/json"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/health"):
+            return httpx.Response(200, content=health, headers=headers)
+        return httpx.Response(200, content=body, headers=headers)
+
+    pipeline = Pipeline(host="http://localhost", pipeline_id=config["pipeline_id"])
+    pipeline.http_client = httpx.Client(
+        base_url="http://localhost", transport=httpx.MockTransport(handler)
+    )
+    return pipeline
+
+
+def _time(func) -> float:
+    return min(timeit.repeat(func, number=REPEAT, repeat=3)) / REPEAT * 1000
+
+
+def _measure(config: dict) -> List[Tuple[str, float]]:
+    pipeline = _pipeline(config)
+    return [
+        ("model_validate", _time(lambda: models.PipelineConfig.model_validate(config))),
+        ("get()", _time(lambda: pipeline.get())),
+        ("get(lazy=True)", _time(lambda: pipeline.get(lazy=True))),
+        (
+            "get(lazy=True).config",
+            _time(lambda: pipeline.get(lazy=True).config),
+        ),
+    ]
+
+
+def main() -> None:
+    for sources, fields in ((5, 20), (50, 200), (200, 500)):
+        rows = _measure(large_pipeline_config(sources=sources, fields=fields))
+        print(f"{sources} sources x {fields} fields")
+        for name, ms in rows:
+            print(f"  {name:<24} {ms:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
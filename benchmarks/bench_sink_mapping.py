@@ -0,0 +1,26 @@
+"""Benchmark of checking the sink mappings of a fleet of pipelines."""
+
+from __future__ import annotations
+
+import timeit
+
+from configs import large_pipeline_config
+
+from glassflow.etl import models
+from glassflow.etl.mapping import check_sink_mappings
+
+REPEAT = 5
+
+
+def main() -> None:
+    config = models.PipelineConfig.model_validate(
+        large_pipeline_config(sources=2, fields=200)
+    )
+    for pipelines in (10, 100, 1000):
+        fleet = [config] * pipelines
+        ms = min(timeit.repeat(lambda f=fleet: check_sink_mappings(f), number=REPEAT))
+        print(f"{pipelines:>5} pipelines x 200 mappings  {ms / REPEAT * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
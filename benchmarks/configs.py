@@ -0,0 +1,88 @@
+"""Synthetic pipeline configs for benchmarks."""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+
+def large_pipeline_config(
+    sources: int = 50, fields: int = 200, expressions: int = 20
+) -> Dict[str, Any]:
+    """Build a valid pipeline config dict.
+
+    Args:
+        sources: Number of Kafka sources, each with a dedup and a stateless
+            transform
+        fields: Number of schema fields per source and of sink mappings
+        expressions: Number of expressions per stateless transform
+    """
+    source_configs, transforms = [], []
+    for s in range(sources):
+        source_id = f"source-{s}"
+        source_configs.append(
+            {
+                "type": "kafka",
+                "source_id": source_id,
+                "topic": f"topic-{s}",
+                "connection_params": {
+                    "brokers": ["kafka-0:9092", "kafka-1:9092"],
+                    "protocol": "SASL_SSL",
+                    "mechanism": "PLAIN",
+                    "username": "user",
+                    "password": "password",
+                },
+                "schema_fields": [
+                    {"name": f"field_{i}", "type": "string" if i % 2 else "int64"}
+                    for i in range(fields)
+                ],
+            }
+        )
+        transforms.append(
+            {
+                "type": "dedup",
+                "source_id": source_id,
+                "config": {"key": "field_1", "time_window": "1h"},
+            }
+        )
+        transforms.append(
+            {
+                "type": "stateless",
+                "source_id": source_id,
+                "config": {
+                    "transforms": [
+                        {
+                            "expression": f"field_{i}",
+                            "output_name": f"output_{i}",
+                            "output_type": "string",
+                        }
+                        for i in range(expressions)
+                    ]
+                },
+            }
+        )
+    return {
+        "version": "v3",
+        "pipeline_id": "large-pipeline",
+        "sources": source_configs,
+        "transforms": transforms,
+        "sink": {
+            "type": "clickhouse",
+            "source_id": "source-0",
+            "connection_params": {
+                "host": "clickhouse",
+                "port": "9000",
+                "database": "default",
+                "username": "default",
+                "password": "password",
+            },
+            "table": "events",
+            "mapping": [
+                {
+                    "name": f"field_{i}",
+                    "column_name": f"column_{i}",
+                    "column_type": "String" if i % 2 else "Int64",
+                }
+                for i in range(fields)
+            ],
+        },
+    }
@@ -2,22 +2,102 @@
 GlassFlow SDK for creating data pipelines between Kafka and ClickHouse.
 """
 
-from .client import Client
-from .dlq import DLQ
-from .models import (
-    JoinConfig,
-    PipelineConfig,
-    SinkConfig,
-    SourceConfig,
-)
-from .pipeline import Pipeline
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .dlq import DLQ
+    from .dlq_fleet import DLQFleetEntry, DLQFleetReport, FleetDLQScanner
+    from .dlq_message import DLQMessage
+    from .dlq_monitor import DLQBacklogStats, DLQMonitor
+    from .dlq_redrive import DLQRedrive, RedriveCheckpoint, RedriveResult
+    from .dlq_triage import DLQTriage, DLQTriageReport
+    from .models import (
+        JoinConfig,
+        PipelineConfig,
+        SinkConfig,
+        SourceConfig,
+    )
+    from .pipeline import Pipeline
+    from .sinks import FileSink, InMemorySink, RedriveSink
+    from .validation import (
+        BulkConfigValidator,
+        ConfigFileResult,
+        ConfigIssue,
+        ConfigValidationReport,
+    )
+
+# Public names by the submodule defining them. Submodules are imported on first
+# access, so that importing the package alone does not load httpx, mixpanel,
+# yaml or the pydantic models.
+_EXPORTS = {
+    "Pipeline": ".pipeline",
+    "Client": ".client",
+    "DLQ": ".dlq",
+    "DLQFleetEntry": ".dlq_fleet",
+    "DLQFleetReport": ".dlq_fleet",
+    "FleetDLQScanner": ".dlq_fleet",
+    "DLQMessage": ".dlq_message",
+    "DLQMonitor": ".dlq_monitor",
+    "DLQBacklogStats": ".dlq_monitor",
+    "DLQRedrive": ".dlq_redrive",
+    "FileSink": ".sinks",
+    "InMemorySink": ".sinks",
+    "RedriveCheckpoint": ".dlq_redrive",
+    "RedriveResult": ".dlq_redrive",
+    "RedriveSink": ".sinks",
+    "DLQTriage": ".dlq_triage",
+    "DLQTriageReport": ".dlq_triage",
+    "PipelineConfig": ".models",
+    "SourceConfig": ".models",
+    "SinkConfig": ".models",
+    "JoinConfig": ".models",
+    "BulkConfigValidator": ".validation",
+    "ConfigFileResult": ".validation",
+    "ConfigIssue": ".validation",
+    "ConfigValidationReport": ".validation",
+}
 
 __all__ = [
     "Pipeline",
     "Client",
     "DLQ",
+    "DLQFleetEntry",
+    "DLQFleetReport",
+    "FleetDLQScanner",
+    "DLQMessage",
+    "DLQMonitor",
+    "DLQBacklogStats",
+    "DLQRedrive",
+    "FileSink",
+    "InMemorySink",
+    "RedriveCheckpoint",
+    "RedriveResult",
+    "RedriveSink",
+    "DLQTriage",
+    "DLQTriageReport",
     "PipelineConfig",
     "SourceConfig",
     "SinkConfig",
     "JoinConfig",
+    "BulkConfigValidator",
+    "ConfigFileResult",
+    "ConfigIssue",
+    "ConfigValidationReport",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_EXPORTS})
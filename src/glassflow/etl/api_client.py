@@ -1,13 +1,51 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable
 
 import httpx
 
 from . import errors
 from .models import GlassFlowConfig
-from .tracking import Tracking
+
+if TYPE_CHECKING:
+    from .tracking import Tracking
+
+
+class _LazyClassAttribute:
+    """
+    Class attribute whose value is created on first access.
+
+    On first access, from the class or from an instance, the descriptor replaces
+    itself with the value on the class it was defined on, so the value is shared
+    by every subclass and instance, and can be patched like a plain attribute.
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        self.factory = factory
+        self.__doc__ = factory.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        value = self.factory()
+        setattr(self.owner, self.name, value)
+        return value
+
+
+def _glassflow_config() -> GlassFlowConfig:
+    """Settings of the GlassFlow config file, read on first use."""
+    return GlassFlowConfig()
+
+
+def _tracking() -> Tracking:
+    """Tracking client shared by every API client, created on first use."""
+    # Imported here as mixpanel and its dependencies are slow to import
+    from .tracking import Tracking
+
+    return Tracking(APIClient.glassflow_config.analytics.distinct_id)
 
 
 class APIClient:
@@ -16,17 +54,23 @@ class APIClient:
     """
 
     version = "1"
-    glassflow_config = GlassFlowConfig()
-    _tracking = Tracking(glassflow_config.analytics.distinct_id)
+    glassflow_config = _LazyClassAttribute(_glassflow_config)
+    _tracking = _LazyClassAttribute(_tracking)
 
-    def __init__(self, host: str | None = None):
+    def __init__(
+        self, host: str | None = None, http_client: httpx.Client | None = None
+    ):
         """Initialize the API Client class.
 
         Args:
             host: Host URL of the GlassFlow Clickhouse ETL service
+            http_client: HTTP client to share with other API clients; a new one
+                is created when not provided
         """
         self.host = host if host else self.glassflow_config.glassflow.host
-        self.http_client = httpx.Client(base_url=self.host)
+        self.http_client = (
+            http_client if http_client is not None else httpx.Client(base_url=self.host)
+        )
 
     def _request(
         self, method: str, endpoint: str, **kwargs: Any
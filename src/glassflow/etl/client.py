@@ -4,6 +4,7 @@ from typing import Any, List
 
 from . import errors, models
 from .api_client import APIClient
+from .dlq_fleet import DLQFleetEntry, FleetDLQScanner
 from .pipeline import Pipeline
 
 
@@ -22,11 +23,14 @@ class Client(APIClient):
         """
         super().__init__(host=host)
 
-    def get_pipeline(self, pipeline_id: str):
+    def get_pipeline(self, pipeline_id: str, lazy: bool = False):
         """Fetch a pipeline by its ID.
 
         Args:
             pipeline_id: The ID of the pipeline to fetch
+            lazy: Whether to defer building and validating the config until it
+                is first accessed, which skips its cost for callers that never
+                read it
 
         Returns:
             Pipeline: A Pipeline instance for the given ID
@@ -35,7 +39,7 @@ class Client(APIClient):
             PipelineNotFoundError: If pipeline is not found
             APIError: If the API request fails
         """
-        return Pipeline(host=self.host, pipeline_id=pipeline_id).get()
+        return Pipeline(host=self.host, pipeline_id=pipeline_id).get(lazy=lazy)
 
     def list_pipelines(self) -> List[dict]:
         """Returns a list of available pipelines.
@@ -171,6 +175,36 @@ class Client(APIClient):
             )
             raise
 
+    def scan_dlqs(
+        self, limit: int | None = None, min_backlog: int = 1, max_workers: int = 16
+    ) -> List[DLQFleetEntry]:
+        """Find the pipelines with the largest DLQ backlogs.
+
+        The DLQ state of every pipeline is polled concurrently over this client's
+        HTTP connection pool. Use FleetDLQScanner directly for continuous scans
+        with backlog deltas.
+
+        Args:
+            limit: Maximum number of pipelines to return
+            min_backlog: Pipelines with a smaller backlog and no error are left
+                out of the result
+            max_workers: Number of concurrent state requests
+
+        Returns:
+            List[DLQFleetEntry]: Pipelines sorted by backlog, largest first
+
+        Raises:
+            APIError: If listing the pipelines fails
+        """
+        scanner = FleetDLQScanner(
+            self, max_workers=max_workers, min_backlog=min_backlog
+        )
+        try:
+            report = scanner.scan()
+        finally:
+            scanner.close()
+        return report.entries if limit is None else report.worst(limit)
+
     def disable_usagestats(self) -> None:
         """Disable tracking of pipeline events."""
         self._tracking.enabled = False
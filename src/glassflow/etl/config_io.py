@@ -0,0 +1,203 @@
+"""
+Reading and writing pipeline config files.
+
+YAML is parsed and emitted with libyaml (``CSafeLoader`` / ``CSafeDumper``)
+when pyyaml was built with it, falling back to the pure-Python implementation
+otherwise. JSON is read through ``jsonlib``, i.e. ``orjson`` when installed, and
+written with the standard library, indented by 4 spaces with non-ASCII
+characters escaped, so files written by earlier versions do not change.
+Files are written atomically: the content goes to a temporary file in the same
+directory which then replaces the target, so a reader never sees a partially
+written config.
+
+A bundle holds many pipeline configs in a single file, either as a YAML
+multi-document stream, JSON Lines (``.jsonl`` / ``.ndjson``) or a JSON array.
+YAML and JSON Lines bundles are read one config at a time.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import secrets
+import shutil
+from contextlib import contextmanager
+from typing import IO, Any, Iterable, Iterator, Union
+
+from pydantic import BaseModel
+
+from . import jsonlib
+from .models import PipelineConfig
+
+PathLike = Union[str, os.PathLike]
+
+JSON_LINES_SUFFIXES = (".jsonl", ".ndjson")
+
+
+def _yaml():
+    # Imported here as pyyaml is slow to import
+    import yaml
+
+    return yaml
+
+
+def _loader():
+    yaml = _yaml()
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _dumper():
+    yaml = _yaml()
+    return getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _suffix(path: PathLike) -> str:
+    return os.path.splitext(os.fspath(path))[1].lower()
+
+
+@contextmanager
+def _atomic_write(path: PathLike) -> Iterator[IO[bytes]]:
+    path = os.fspath(path)
+    tmp_path = f"{path}.{secrets.token_hex(4)}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _config_data(config: Union[PipelineConfig, dict]) -> Any:
+    if isinstance(config, BaseModel):
+        return config.model_dump(mode="json", by_alias=True, exclude_none=True)
+    return config
+
+
+def read_yaml(path: PathLike) -> Any:
+    """Read a single-document YAML file."""
+    with open(path, "rb") as f:
+        return _yaml().load(f, Loader=_loader())
+
+
+def read_json(path: PathLike) -> Any:
+    """Read a JSON file."""
+    with open(path, "rb") as f:
+        return jsonlib.loads(f.read())
+
+
+def write_yaml(path: PathLike, data: Any) -> None:
+    """Write data to a YAML file atomically."""
+    with _atomic_write(path) as f:
+        _yaml().dump(
+            data, f, Dumper=_dumper(), default_flow_style=False, encoding="utf-8"
+        )
+
+
+def write_json(path: PathLike, data: Any) -> None:
+    """Write data to a JSON file indented by 4 spaces, atomically."""
+    with _atomic_write(path) as f:
+        f.write(json.dumps(data, indent=4).encode("ascii"))
+
+
+def iter_documents(path: PathLike) -> Iterator[Any]:
+    """
+    Read the configs of a bundle, one at a time.
+
+    The format follows the file suffix: ``.json`` files hold a config or an
+    array of configs, ``.jsonl`` and ``.ndjson`` files a config per line and
+    any other file a YAML stream of configs separated by ``---``. A YAML
+    document holding a list yields each of its items.
+
+    Args:
+        path: Path to the bundle
+
+    Yields:
+        The data of each config, not validated
+    """
+    suffix = _suffix(path)
+    if suffix == ".json":
+        data = read_json(path)
+        yield from data if isinstance(data, list) else [data]
+        return
+
+    with open(path, "rb") as f:
+        if suffix in JSON_LINES_SUFFIXES:
+            for line in f:
+                if line.strip():
+                    yield jsonlib.loads(line)
+            return
+        for document in _yaml().load_all(f, Loader=_loader()):
+            if isinstance(document, list):
+                yield from document
+            elif document is not None:
+                yield document
+
+
+def load_bundle(path: PathLike) -> Iterator[PipelineConfig]:
+    """
+    Read and validate the pipeline configs of a bundle, one at a time.
+
+    See ``iter_documents`` for the supported formats.
+
+    Args:
+        path: Path to the bundle
+
+    Yields:
+        PipelineConfig: Each config of the bundle
+
+    Raises:
+        ValidationError: When reaching an invalid config
+    """
+    for data in iter_documents(path):
+        yield PipelineConfig.model_validate(data)
+
+
+def save_bundle(path: PathLike, configs: Iterable[Union[PipelineConfig, dict]]) -> int:
+    """
+    Write pipeline configs to a bundle atomically.
+
+    The format follows the file suffix like in ``iter_documents``. Configs are
+    serialized one at a time, except for ``.json`` bundles which are written as
+    a single array.
+
+    Args:
+        path: Path to the bundle
+        configs: Pipeline configs or their data
+
+    Returns:
+        int: Number of configs written
+    """
+    count = 0
+
+    def documents() -> Iterator[Any]:
+        nonlocal count
+        for config in configs:
+            count += 1
+            yield _config_data(config)
+
+    suffix = _suffix(path)
+    if suffix == ".json":
+        write_json(path, list(documents()))
+        return count
+
+    with _atomic_write(path) as f:
+        if suffix in JSON_LINES_SUFFIXES:
+            for data in documents():
+                f.write(jsonlib.dumps(data))
+                f.write(b"\n")
+        else:
+            _yaml().dump_all(
+                documents(),
+                f,
+                Dumper=_dumper(),
+                default_flow_style=False,
+                encoding="utf-8",
+            )
+    return count
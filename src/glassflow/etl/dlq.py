@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import os
+from typing import Any, Callable, Dict, Iterator, List
+
+import httpx
 
 from . import errors
 from .api_client import APIClient
+from .dlq_message import DLQMessage
+from .dlq_redrive import DLQRedrive, RedriveCheckpoint, RedriveResult
+from .dlq_triage import DLQTriage, DLQTriageReport
 from .errors import InvalidBatchSizeError
+from .sinks import CallableSink, RedriveSink
 
 
 class DLQ(APIClient):
@@ -12,11 +19,16 @@ class DLQ(APIClient):
     Dead Letter Queue client for managing failed messages.
     """
 
-    def __init__(self, pipeline_id: str, host: str | None = None):
-        super().__init__(host)
+    def __init__(
+        self,
+        pipeline_id: str,
+        host: str | None = None,
+        http_client: httpx.Client | None = None,
+    ):
+        super().__init__(host, http_client=http_client)
         self.pipeline_id = pipeline_id
         self.endpoint = f"/api/v1/pipeline/{self.pipeline_id}/dlq"
-        self._max_batch_size = 100
+        self.max_batch_size = 100
 
     def consume(self, batch_size: int = 100) -> List[Dict[str, Any]]:
         """
@@ -28,10 +40,168 @@ class DLQ(APIClient):
         Returns:
             List of messages from the DLQ
         """
+        response = self._consume(batch_size)
+        if response is None:
+            return []
+        return response.json()
+
+    def consume_messages(self, batch_size: int = 100) -> List[DLQMessage]:
+        """
+        Consume messages from the Dead Letter Queue as DLQMessage objects.
+
+        Unlike ``consume``, the original event payloads are not decoded until
+        they are accessed, which is considerably cheaper when only the error
+        reason of each message is needed.
+
+        Args:
+            batch_size: Number of messages to consume (between 1 and 100)
+
+        Returns:
+            List of DLQMessage objects from the DLQ
+        """
+        response = self._consume(batch_size)
+        if response is None:
+            return []
+        return DLQMessage.parse_batch(response.content)
+
+    def iter_messages(
+        self, batch_size: int = 100, max_messages: int | None = None
+    ) -> Iterator[DLQMessage]:
+        """
+        Stream messages from the Dead Letter Queue until it is empty.
+
+        Messages are consumed batch by batch, so only one batch is held in memory
+        at a time. Consumed messages are removed from the DLQ.
+
+        Args:
+            batch_size: Number of messages fetched per request (between 1 and 100)
+            max_messages: Maximum number of messages to consume; consumes until
+                the DLQ is empty when not provided
+
+        Yields:
+            DLQMessage objects in consumption order
+        """
+        for messages in self._iter_batches(batch_size, max_messages):
+            yield from messages
+
+    def _iter_batches(
+        self, batch_size: int, max_messages: int | None
+    ) -> Iterator[List[DLQMessage]]:
+        remaining = max_messages
+        while remaining is None or remaining > 0:
+            size = batch_size if remaining is None else min(batch_size, remaining)
+            messages = self.consume_messages(batch_size=size)
+            if not messages:
+                return
+            yield messages
+            if remaining is not None:
+                remaining -= len(messages)
+            if len(messages) < size:
+                return
+
+    def triage(
+        self,
+        sample_size: int = 100,
+        top_k: int = 10,
+        max_messages: int | None = None,
+        batch_size: int = 100,
+        seed: int | None = None,
+        sink: RedriveSink | Callable[[List[Any]], Any] | None = None,
+        drain: bool = False,
+    ) -> DLQTriageReport:
+        """
+        Triage the Dead Letter Queue with constant memory.
+
+        Streams messages from the DLQ and keeps a fixed-size random sample along
+        with counters per component and the most frequent error classes and
+        fields.
+
+        Consuming messages removes them from the DLQ and only the sample is kept,
+        so the caller has to bound or keep what is consumed: pass
+        ``max_messages``, a ``sink`` receiving every consumed message, or
+        ``drain=True`` to knowingly discard the whole backlog.
+
+        Args:
+            sample_size: Number of messages kept in the random sample
+            top_k: Number of error classes and fields to report
+            max_messages: Maximum number of messages to consume
+            batch_size: Number of messages fetched per request (between 1 and 100)
+            seed: Seed of the random generator used for sampling
+            sink: Sink or callable receiving each consumed batch as message dicts
+                (see ``DLQMessage.to_dict``) before it is triaged, e.g. a
+                ``FileSink`` archiving the backlog
+            drain: Consume until the DLQ is empty without keeping the messages
+
+        Returns:
+            DLQTriageReport: Counters, top error classes and fields and sample
+
+        Raises:
+            ValueError: If none of ``max_messages``, ``sink`` or ``drain`` is
+                given
+        """
+        if max_messages is None and sink is None and not drain:
+            raise ValueError(
+                "triage removes the messages it consumes from the DLQ; pass "
+                "max_messages, a sink keeping the consumed messages, or drain=True"
+            )
+        if sink is not None and not isinstance(sink, RedriveSink):
+            sink = CallableSink(sink)
+
+        triage = DLQTriage(sample_size=sample_size, top_k=top_k, seed=seed)
+        for messages in self._iter_batches(batch_size, max_messages):
+            if sink is not None:
+                sink.write([message.to_dict() for message in messages])
+            triage.add_many(messages)
+        return triage.report()
+
+    def redrive(
+        self,
+        sink: RedriveSink | Callable[[List[Any]], Any],
+        fix: Callable[[DLQMessage], Any] | None = None,
+        batch_size: int = 100,
+        max_in_flight: int = 1,
+        checkpoint: RedriveCheckpoint | str | os.PathLike | None = None,
+        max_messages: int | None = None,
+    ) -> RedriveResult:
+        """
+        Push DLQ messages back into ingestion through a batched sink.
+
+        Messages are consumed from the DLQ, optionally passed through a fix-up
+        function and written to the sink in batches. Consumed messages are
+        journaled to the checkpoint before they are sent, so batches that were
+        not accepted by the sink are sent again on the next run.
+
+        Args:
+            sink: Sink or callable receiving batches of payloads, e.g. a function
+                producing the payloads to a Kafka topic
+            fix: Function returning the payload to send for a message, or None
+                to skip it; the raw original event is sent when not provided
+            batch_size: Number of messages per sink batch
+            max_in_flight: Maximum number of batches written concurrently
+            checkpoint: Checkpoint or path of the checkpoint journal; kept in
+                memory only when not provided
+            max_messages: Maximum number of messages to consume; consumes until
+                the DLQ is empty when not provided
+
+        Returns:
+            RedriveResult: Counters of the redrive run
+        """
+        return DLQRedrive(
+            self,
+            sink,
+            fix=fix,
+            batch_size=batch_size,
+            max_in_flight=max_in_flight,
+            checkpoint=checkpoint,
+            max_messages=max_messages,
+        ).run()
+
+    def _consume(self, batch_size: int) -> httpx.Response | None:
+        """Send a consume request and return the response if it has content."""
         if (
             not isinstance(batch_size, int)
             or batch_size < 1
-            or batch_size > self._max_batch_size
+            or batch_size > self.max_batch_size
         ):
             raise ValueError("batch_size must be an integer between 1 and 100")
 
@@ -41,12 +211,12 @@ class DLQ(APIClient):
             )
             response.raise_for_status()
             if response.status_code == 204 or not response.content:
-                return []
-            return response.json()
+                return None
+            return response
         except errors.UnprocessableContentError as e:
             raise InvalidBatchSizeError(
                 f"Invalid batch size: batch size should be larger than 1 "
-                f"and smaller than {self._max_batch_size}"
+                f"and smaller than {self.max_batch_size}"
             ) from e
         except errors.APIError as e:
             raise e
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from .dlq import DLQ
+from .dlq_monitor import BacklogTrend, DLQMonitor
+
+
+class DLQFleetEntry(BaseModel):
+    """DLQ backlog of a single pipeline in a fleet scan."""
+
+    pipeline_id: str
+    name: Optional[str] = None
+    backlog: int = 0
+    total_messages: int = 0
+    backlog_delta: Optional[int] = None
+    ingress_rate: Optional[float] = None
+    trend: BacklogTrend = BacklogTrend.UNKNOWN
+    time_to_drain: Optional[float] = None
+    error: Optional[str] = None
+
+
+class DLQFleetReport(BaseModel):
+    """Result of a fleet DLQ scan, sorted from the largest backlog down."""
+
+    scanned_at: float
+    entries: List[DLQFleetEntry] = Field(default_factory=list)
+
+    @property
+    def total_backlog(self) -> int:
+        """Sum of the backlogs of every scanned pipeline."""
+        return sum(entry.backlog for entry in self.entries)
+
+    def worst(self, n: int = 10) -> List[DLQFleetEntry]:
+        """Get the ``n`` pipelines with the largest backlogs."""
+        return self.entries[:n]
+
+    def to_table(self, limit: int | None = 20) -> str:
+        """Render the report as a plain-text table."""
+        headers = ["PIPELINE", "BACKLOG", "DELTA", "IN/S", "TREND", "DRAIN", "ERROR"]
+        rows = [
+            [
+                entry.pipeline_id,
+                str(entry.backlog),
+                _format_delta(entry.backlog_delta),
+                _format_float(entry.ingress_rate),
+                str(entry.trend),
+                _format_duration(entry.time_to_drain),
+                entry.error or "",
+            ]
+            for entry in self.entries[:limit]
+        ]
+        widths = [
+            max(len(row[i]) for row in [headers, *rows]) for i in range(len(headers))
+        ]
+        lines = [
+            "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+            for row in [headers, *rows]
+        ]
+        return "\n".join(lines)
+
+
+def _format_delta(delta: int | None) -> str:
+    return "" if delta is None else f"{delta:+d}"
+
+
+def _format_float(value: float | None) -> str:
+    return "" if value is None else f"{value:.2f}"
+
+
+def _format_duration(seconds: float | None) -> str:
+    if seconds is None:
+        return ""
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    if seconds < 3600:
+        return f"{seconds / 60:.1f}m"
+    return f"{seconds / 3600:.1f}h"
+
+
+class FleetDLQScanner:
+    """
+    Polls the DLQ state of every pipeline returned by ``Client.list_pipelines()``.
+
+    State requests are issued concurrently on a thread pool and share the HTTP
+    client of the given Client, so scanning hundreds of pipelines neither opens a
+    connection pool per pipeline nor queries them one by one. Consecutive scans
+    report the backlog change of each pipeline since the previous scan.
+    """
+
+    def __init__(
+        self,
+        client,
+        max_workers: int = 16,
+        interval: float = 30.0,
+        window: int = 20,
+        min_backlog: int = 0,
+    ):
+        """Initialize the FleetDLQScanner class.
+
+        Args:
+            client: Client used to list pipelines and query their DLQs
+            max_workers: Number of concurrent state requests
+            interval: Minimum number of seconds between two requests to the same
+                pipeline, also the delay between scans in continuous mode
+            window: Number of samples kept per pipeline to derive rates
+            min_backlog: Pipelines with a smaller backlog and no error are left
+                out of the reports
+        """
+        self.client = client
+        self.min_backlog = min_backlog
+        self.monitor = DLQMonitor(
+            [], interval=interval, window=window, max_workers=max_workers
+        )
+        self._names: Dict[str, Optional[str]] = {}
+        self._previous: Dict[str, int] = {}
+
+    def _refresh_pipelines(self) -> None:
+        pipelines = self.client.list_pipelines()
+        names = {p["pipeline_id"]: p.get("name") for p in pipelines}
+        for pipeline_id in set(self.monitor.pipeline_ids) - set(names):
+            self.monitor.remove(pipeline_id)
+            self._previous.pop(pipeline_id, None)
+        for pipeline_id in set(names) - set(self.monitor.pipeline_ids):
+            self.monitor.add(
+                DLQ(
+                    pipeline_id=pipeline_id,
+                    host=self.client.host,
+                    http_client=self.client.http_client,
+                )
+            )
+        self._names = names
+
+    def scan(self) -> DLQFleetReport:
+        """
+        Scan the DLQs of every pipeline once.
+
+        Pipelines queried less than ``interval`` seconds ago are reported from
+        their last sample instead of being queried again.
+
+        Returns:
+            DLQFleetReport: Pipelines sorted by backlog, largest first
+        """
+        self._refresh_pipelines()
+        self.monitor.poll()
+
+        entries = []
+        for pipeline_id, stats in self.monitor.fleet_stats().items():
+            samples = self.monitor.samples(pipeline_id)
+            total = samples[-1].total_messages if samples else 0
+            previous = self._previous.get(pipeline_id)
+            if samples:
+                self._previous[pipeline_id] = stats.backlog
+            if stats.backlog < self.min_backlog and stats.last_error is None:
+                continue
+            entries.append(
+                DLQFleetEntry(
+                    pipeline_id=pipeline_id,
+                    name=self._names.get(pipeline_id),
+                    backlog=stats.backlog,
+                    total_messages=total,
+                    backlog_delta=(
+                        stats.backlog - previous
+                        if previous is not None and samples
+                        else None
+                    ),
+                    ingress_rate=stats.ingress_rate,
+                    trend=stats.trend,
+                    time_to_drain=stats.time_to_drain,
+                    error=stats.last_error,
+                )
+            )
+
+        entries.sort(key=lambda e: (-e.backlog, e.pipeline_id))
+        return DLQFleetReport(scanned_at=time.time(), entries=entries)
+
+    def watch(
+        self,
+        callback: Callable[[DLQFleetReport], Any],
+        iterations: int | None = None,
+    ) -> None:
+        """
+        Scan continuously, once per interval, and pass every report to a callback.
+
+        Args:
+            callback: Called with the report of every scan
+            iterations: Number of scans to run; runs until interrupted when not
+                provided
+        """
+        count = 0
+        while iterations is None or count < iterations:
+            started = time.monotonic()
+            callback(self.scan())
+            count += 1
+            if iterations is not None and count >= iterations:
+                break
+            elapsed = time.monotonic() - started
+            time.sleep(max(0.0, self.monitor.interval - elapsed))
+
+    def close(self) -> None:
+        """Shut down the pool of state requests."""
+        self.monitor.close()
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from . import jsonlib
+
+_UNSET = object()
+
+
+class DLQMessage:
+    """
+    A message consumed from the Dead Letter Queue.
+
+    The ``component`` and ``error`` fields are available immediately. When the
+    original event arrives as a JSON-encoded string, which is how the DLQ API
+    returns it, it is kept as raw bytes and only decoded the first time
+    ``original_message`` is accessed, so triaging a backlog by error reason does
+    not pay for decoding those payloads. An original event that arrives as a
+    JSON object or array is decoded along with the response body.
+    """
+
+    __slots__ = ("component", "error", "extra", "_raw", "_original")
+
+    def __init__(
+        self,
+        component: str | None = None,
+        error: str | None = None,
+        raw: bytes | None = None,
+        original_message: Any = _UNSET,
+        extra: Dict[str, Any] | None = None,
+    ):
+        """Initialize the DLQMessage class.
+
+        Args:
+            component: Pipeline component that sent the message to the DLQ
+            error: Error reason reported by the component
+            raw: Raw JSON bytes of the original event
+            original_message: Already decoded original event
+            extra: Any other fields returned by the API
+        """
+        self.component = component
+        self.error = error
+        self.extra = extra
+        self._raw = raw
+        self._original = original_message
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> DLQMessage:
+        """Build a message from a decoded DLQ item.
+
+        An ``original_message`` encoded as a JSON string is kept as bytes and
+        decoded lazily; any other value is kept as is.
+        """
+        data = dict(data)
+        component = data.pop("component", None)
+        error = data.pop("error", None)
+        original = data.pop("original_message", None)
+        extra = data or None
+        if isinstance(original, str):
+            return cls(component, error, raw=original.encode("utf-8"), extra=extra)
+        return cls(component, error, original_message=original, extra=extra)
+
+    @classmethod
+    def parse_batch(cls, content: jsonlib.JSONInput) -> List[DLQMessage]:
+        """Parse the body of a DLQ consume response into messages.
+
+        The body is decoded in full, so only ``original_message`` values that
+        are JSON-encoded strings stay undecoded; see ``from_dict``.
+        """
+        if not content:
+            return []
+        data = jsonlib.loads(content)
+        if not isinstance(data, list):
+            return []
+        return [cls.from_dict(item) for item in data]
+
+    @property
+    def raw(self) -> bytes:
+        """Raw JSON bytes of the original event."""
+        if self._raw is None:
+            original = None if self._original is _UNSET else self._original
+            self._raw = jsonlib.dumps(original)
+        return self._raw
+
+    @property
+    def original_message(self) -> Any:
+        """The original event, decoded on first access.
+
+        Payloads that are not valid JSON are returned as a string.
+        """
+        if self._original is _UNSET:
+            try:
+                self._original = jsonlib.loads(self._raw) if self._raw else None
+            except jsonlib.JSONDecodeError:
+                self._original = self._raw.decode("utf-8", errors="replace")
+        return self._original
+
+    @property
+    def is_decoded(self) -> bool:
+        """Whether the original event has already been decoded."""
+        return self._original is not _UNSET
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the message to a dictionary with the decoded original event."""
+        data = dict(self.extra) if self.extra else {}
+        data["component"] = self.component
+        data["error"] = self.error
+        data["original_message"] = self.original_message
+        return data
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DLQMessage):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"DLQMessage(component={self.component!r}, error={self.error!r})"
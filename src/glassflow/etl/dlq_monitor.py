@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
+
+from pydantic import BaseModel, Field
+
+from . import errors
+from .dlq import DLQ
+from .models.base import CaseInsensitiveStrEnum
+
+
+class BacklogTrend(CaseInsensitiveStrEnum):
+    GROWING = "growing"
+    DRAINING = "draining"
+    STABLE = "stable"
+    UNKNOWN = "unknown"
+
+
+class DLQSample(BaseModel):
+    """A single observation of a pipeline's DLQ state."""
+
+    pipeline_id: str
+    timestamp: float
+    total_messages: int
+    backlog: int
+    state: Dict[str, Any] = Field(default_factory=dict)
+
+    @classmethod
+    def from_state(
+        cls, pipeline_id: str, timestamp: float, state: Dict[str, Any]
+    ) -> DLQSample:
+        """Build a sample from a ``DLQ.state()`` response."""
+        backlog = state.get("unconsumed_messages", state.get("pending_messages", 0))
+        return cls(
+            pipeline_id=pipeline_id,
+            timestamp=timestamp,
+            total_messages=int(state.get("total_messages", 0) or 0),
+            backlog=int(backlog or 0),
+            state=state,
+        )
+
+
+class DLQBacklogStats(BaseModel):
+    """Rates and trend derived from the samples of a single DLQ.
+
+    Rates are expressed in messages per second. ``time_to_drain`` is expressed in
+    seconds and is ``None`` when the backlog is not draining.
+    """
+
+    pipeline_id: str
+    samples: int
+    backlog: int = 0
+    ingress_rate: Optional[float] = None
+    egress_rate: Optional[float] = None
+    growth_rate: Optional[float] = None
+    trend: BacklogTrend = BacklogTrend.UNKNOWN
+    time_to_drain: Optional[float] = None
+    last_sampled_at: Optional[float] = None
+    last_error: Optional[str] = None
+
+
+class DLQMonitor:
+    """
+    Periodically samples ``DLQ.state()`` for one or many pipelines and derives
+    ingress/egress rates, backlog trend and estimated time-to-drain.
+
+    Each pipeline keeps a ring buffer of its last ``window`` samples. Polling is
+    rate limited per pipeline, so no pipeline is queried more than once per
+    ``interval`` no matter how often ``poll`` is called.
+    """
+
+    def __init__(
+        self,
+        dlqs: DLQ | Iterable[DLQ],
+        interval: float = 30.0,
+        window: int = 20,
+        max_workers: int = 8,
+        stable_threshold: float = 0.01,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the DLQMonitor class.
+
+        Args:
+            dlqs: DLQ client or iterable of DLQ clients to monitor
+            interval: Minimum number of seconds between two requests to the same
+                pipeline
+            window: Number of samples kept per pipeline
+            max_workers: Number of threads of the pool shared by all state
+                requests
+            stable_threshold: Absolute backlog growth rate (messages per second)
+                below which the backlog is considered stable
+            clock: Monotonic clock used to timestamp samples
+        """
+        if interval <= 0:
+            raise ValueError("interval must be greater than 0")
+        if window < 2:
+            raise ValueError("window must be at least 2")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        if isinstance(dlqs, DLQ):
+            dlqs = [dlqs]
+        self._dlqs: Dict[str, DLQ] = {dlq.pipeline_id: dlq for dlq in dlqs}
+        self.interval = interval
+        self.window = window
+        self.max_workers = max_workers
+        self.stable_threshold = stable_threshold
+        self._clock = clock
+
+        self._samples: Dict[str, Deque[DLQSample]] = {
+            pipeline_id: deque(maxlen=window) for pipeline_id in self._dlqs
+        }
+        self._last_request: Dict[str, float] = {}
+        self._errors: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def pipeline_ids(self) -> List[str]:
+        """IDs of the monitored pipelines."""
+        return list(self._dlqs)
+
+    def add(self, dlq: DLQ) -> None:
+        """Start monitoring an additional DLQ."""
+        with self._lock:
+            self._dlqs[dlq.pipeline_id] = dlq
+            self._samples.setdefault(dlq.pipeline_id, deque(maxlen=self.window))
+
+    def remove(self, pipeline_id: str) -> None:
+        """Stop monitoring the DLQ of the given pipeline."""
+        with self._lock:
+            self._dlqs.pop(pipeline_id, None)
+            self._samples.pop(pipeline_id, None)
+            self._last_request.pop(pipeline_id, None)
+            self._errors.pop(pipeline_id, None)
+
+    def poll(self) -> Dict[str, DLQSample]:
+        """
+        Sample every DLQ that has not been queried during the current interval.
+
+        State requests are issued concurrently. Failed requests are recorded as
+        the pipeline's ``last_error`` and do not interrupt the other pipelines.
+
+        Returns:
+            Dictionary of new samples keyed by pipeline ID
+        """
+        now = self._clock()
+        with self._lock:
+            due = [
+                dlq
+                for pipeline_id, dlq in self._dlqs.items()
+                if now - self._last_request.get(pipeline_id, float("-inf"))
+                >= self.interval
+            ]
+            for dlq in due:
+                self._last_request[dlq.pipeline_id] = now
+
+        if not due:
+            return {}
+
+        if len(due) == 1 or self.max_workers == 1:
+            results = [self._sample(dlq) for dlq in due]
+        else:
+            results = list(self._get_executor().map(self._sample, due))
+
+        return {sample.pipeline_id: sample for sample in results if sample is not None}
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="dlq-monitor"
+            )
+        return self._executor
+
+    def _sample(self, dlq: DLQ) -> DLQSample | None:
+        try:
+            state = dlq.state()
+        except errors.GlassFlowError as e:
+            with self._lock:
+                self._errors[dlq.pipeline_id] = str(e)
+            return None
+
+        sample = DLQSample.from_state(dlq.pipeline_id, self._clock(), state)
+        with self._lock:
+            samples = self._samples.get(dlq.pipeline_id)
+            if samples is None:
+                return sample
+            if samples and sample.total_messages < samples[-1].total_messages:
+                # The DLQ was purged or its counters were reset
+                samples.clear()
+            samples.append(sample)
+            self._errors.pop(dlq.pipeline_id, None)
+        return sample
+
+    def samples(self, pipeline_id: str) -> List[DLQSample]:
+        """Get the buffered samples of a pipeline, oldest first."""
+        with self._lock:
+            return list(self._samples.get(pipeline_id, ()))
+
+    def stats(self, pipeline_id: str) -> DLQBacklogStats:
+        """
+        Compute backlog statistics for a single pipeline.
+
+        Args:
+            pipeline_id: ID of the monitored pipeline
+
+        Returns:
+            DLQBacklogStats: Rates, trend and time-to-drain estimation
+        """
+        if pipeline_id not in self._dlqs:
+            raise KeyError(f"Pipeline '{pipeline_id}' is not monitored")
+        with self._lock:
+            samples = list(self._samples.get(pipeline_id, ()))
+            last_error = self._errors.get(pipeline_id)
+        return compute_backlog_stats(
+            pipeline_id,
+            samples,
+            stable_threshold=self.stable_threshold,
+            last_error=last_error,
+        )
+
+    def fleet_stats(self) -> Dict[str, DLQBacklogStats]:
+        """Compute backlog statistics for every monitored pipeline."""
+        return {
+            pipeline_id: self.stats(pipeline_id) for pipeline_id in self.pipeline_ids
+        }
+
+    def run(
+        self,
+        callback: Callable[[Dict[str, DLQBacklogStats]], Any] | None = None,
+        iterations: int | None = None,
+    ) -> None:
+        """
+        Poll in a blocking loop, once per interval.
+
+        Args:
+            callback: Called with the fleet statistics after every poll
+            iterations: Number of polls to run; runs until ``stop`` is called
+                when not provided
+        """
+        count = 0
+        self._stop_event.clear()
+        while not self._stop_event.is_set():
+            started = self._clock()
+            self.poll()
+            if callback is not None:
+                callback(self.fleet_stats())
+            count += 1
+            if iterations is not None and count >= iterations:
+                break
+            elapsed = self._clock() - started
+            self._stop_event.wait(max(0.0, self.interval - elapsed))
+
+    def start(
+        self, callback: Callable[[Dict[str, DLQBacklogStats]], Any] | None = None
+    ) -> None:
+        """Run the polling loop in a background daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            raise RuntimeError("DLQ monitor is already running")
+        self._thread = threading.Thread(
+            target=self.run, kwargs={"callback": callback}, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the polling loop started with ``start``."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def close(self) -> None:
+        """Stop polling and shut down the pool of state requests."""
+        self.stop()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+def compute_backlog_stats(
+    pipeline_id: str,
+    samples: List[DLQSample],
+    stable_threshold: float = 0.01,
+    last_error: str | None = None,
+) -> DLQBacklogStats:
+    """
+    Derive rates and trend from a time-ordered list of DLQ samples.
+
+    The ingress rate is the growth of ``total_messages`` over the window and the
+    egress rate is the part of that ingress not reflected in the backlog growth.
+    The backlog growth rate is a least-squares slope over every sample, which is
+    less sensitive to a single noisy observation than the endpoints alone.
+    """
+    stats = DLQBacklogStats(
+        pipeline_id=pipeline_id, samples=len(samples), last_error=last_error
+    )
+    if not samples:
+        return stats
+
+    last = samples[-1]
+    stats.backlog = last.backlog
+    stats.last_sampled_at = last.timestamp
+
+    first = samples[0]
+    elapsed = last.timestamp - first.timestamp
+    if len(samples) < 2 or elapsed <= 0:
+        if last.backlog == 0:
+            stats.time_to_drain = 0.0
+        return stats
+
+    ingress = (last.total_messages - first.total_messages) / elapsed
+    backlog_delta = (last.backlog - first.backlog) / elapsed
+    stats.ingress_rate = ingress
+    stats.egress_rate = max(0.0, ingress - backlog_delta)
+
+    mean_t = sum(s.timestamp for s in samples) / len(samples)
+    mean_b = sum(s.backlog for s in samples) / len(samples)
+    var_t = sum((s.timestamp - mean_t) ** 2 for s in samples)
+    cov = sum((s.timestamp - mean_t) * (s.backlog - mean_b) for s in samples)
+    growth = cov / var_t
+    stats.growth_rate = growth
+
+    if abs(growth) <= stable_threshold:
+        stats.trend = BacklogTrend.STABLE
+    elif growth > 0:
+        stats.trend = BacklogTrend.GROWING
+    else:
+        stats.trend = BacklogTrend.DRAINING
+
+    if last.backlog == 0:
+        stats.time_to_drain = 0.0
+    elif stats.trend == BacklogTrend.DRAINING:
+        stats.time_to_drain = last.backlog / -growth
+
+    return stats
@@ -0,0 +1,392 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set
+
+from pydantic import BaseModel, Field
+
+from . import jsonlib
+from .dlq_message import DLQMessage
+from .sinks import (  # noqa: F401 - re-exported, the sinks were defined here
+    CallableSink,
+    FileSink,
+    InMemorySink,
+    RedriveSink,
+)
+
+if TYPE_CHECKING:
+    from .dlq import DLQ
+
+FixFunction = Callable[[DLQMessage], Any]
+
+
+class RedriveCheckpoint:
+    """
+    Journal of consumed DLQ messages that have not been acknowledged by the sink.
+
+    Consuming from the DLQ removes the messages from it, so every consumed page is
+    written to the journal before it is sent. Batches are acknowledged once the
+    sink accepted them; unacknowledged batches are sent again on the next run,
+    which gives at-least-once delivery across failures and restarts.
+
+    Without a path the journal is only kept in memory and does not survive the
+    process.
+    """
+
+    def __init__(self, path: str | os.PathLike | None = None, fsync: bool = True):
+        """Initialize the RedriveCheckpoint class.
+
+        Args:
+            path: Path of the journal file
+            fsync: Whether to fsync the journal after every write
+        """
+        self.path = Path(path) if path is not None else None
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._pending: Dict[int, List[Dict[str, Any]]] = {}
+        self._rejected: List[Dict[str, Any]] = []
+        # Positions of the rejected messages within each pending batch
+        self._rejected_indexes: Dict[int, Set[int]] = {}
+        self._next_seq = 0
+        self._file = None
+        if self.path is not None:
+            if self.path.exists():
+                self._load()
+
+    def _load(self) -> None:
+        with open(self.path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = jsonlib.loads(line)
+                except jsonlib.JSONDecodeError:
+                    # Torn write at the end of the journal
+                    continue
+                op = record.get("op")
+                seq = record.get("seq", 0)
+                self._next_seq = max(self._next_seq, seq + 1)
+                if op == "messages":
+                    self._pending.setdefault(seq, []).extend(record["messages"])
+                elif op == "ack":
+                    self._pending.pop(seq, None)
+                    self._rejected_indexes.pop(seq, None)
+                elif op == "rejected":
+                    self._rejected.append(record)
+                    if "index" in record:
+                        self._rejected_indexes.setdefault(seq, set()).add(
+                            record["index"]
+                        )
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        if self.path is None:
+            return
+        if self._file is None:
+            self._file = open(self.path, "ab")
+        self._file.write(jsonlib.dumps(record) + b"\n")
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def next_seq(self) -> int:
+        """Reserve the sequence number of a new batch."""
+        with self._lock:
+            seq = self._next_seq
+            self._next_seq += 1
+            return seq
+
+    def append(self, seq: int, messages: List[DLQMessage]) -> None:
+        """Record consumed messages as part of a batch."""
+        items = [_serialize_message(m) for m in messages]
+        with self._lock:
+            self._pending.setdefault(seq, []).extend(items)
+            self._write({"op": "messages", "seq": seq, "messages": items})
+
+    def ack(self, seq: int) -> None:
+        """Mark a batch as accepted by the sink."""
+        with self._lock:
+            self._pending.pop(seq, None)
+            self._rejected_indexes.pop(seq, None)
+            self._write({"op": "ack", "seq": seq})
+
+    def reject(self, seq: int, index: int, message: DLQMessage, error: str) -> bool:
+        """
+        Record a message that could not be fixed and was not sent.
+
+        Args:
+            seq: Sequence number of the batch of the message
+            index: Position of the message in its batch
+            message: The rejected message
+            error: Why the message was rejected
+
+        Returns:
+            bool: False if the message was already recorded as rejected, e.g.
+                by a previous run of a resumed batch
+        """
+        record = {
+            "op": "rejected",
+            "seq": seq,
+            "index": index,
+            "message": _serialize_message(message),
+            "error": error,
+        }
+        with self._lock:
+            indexes = self._rejected_indexes.setdefault(seq, set())
+            if index in indexes:
+                return False
+            indexes.add(index)
+            self._rejected.append(record)
+            self._write(record)
+            return True
+
+    def is_rejected(self, seq: int, index: int) -> bool:
+        """Whether the message at a position of a batch was rejected."""
+        with self._lock:
+            return index in self._rejected_indexes.get(seq, ())
+
+    def pending(self) -> Dict[int, List[DLQMessage]]:
+        """Get the batches that have not been acknowledged, by sequence number."""
+        with self._lock:
+            return {
+                seq: [DLQMessage.from_dict(item) for item in items]
+                for seq, items in sorted(self._pending.items())
+            }
+
+    def rejected(self) -> List[Dict[str, Any]]:
+        """Get the messages rejected by the fix-up function, with their errors."""
+        with self._lock:
+            return [
+                {"message": r["message"], "error": r["error"]} for r in self._rejected
+            ]
+
+    def compact(self) -> None:
+        """Rewrite the journal so it only holds pending batches and rejections."""
+        if self.path is None:
+            return
+        with self._lock:
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp_path, "wb") as f:
+                for seq, items in sorted(self._pending.items()):
+                    record = {"op": "messages", "seq": seq, "messages": items}
+                    f.write(jsonlib.dumps(record) + b"\n")
+                for record in self._rejected:
+                    f.write(jsonlib.dumps(record) + b"\n")
+                f.flush()
+                os.fsync(f.fileno())
+            if self._file is not None:
+                self._file.close()
+            os.replace(tmp_path, self.path)
+            self._file = open(self.path, "ab")
+
+    def close(self) -> None:
+        """Close the journal file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _serialize_message(message: DLQMessage) -> Dict[str, Any]:
+    data = dict(message.extra) if message.extra else {}
+    data["component"] = message.component
+    data["error"] = message.error
+    data["original_message"] = message.raw.decode("utf-8", errors="replace")
+    return data
+
+
+class RedriveResult(BaseModel):
+    """Counters of a redrive run."""
+
+    consumed: int = 0
+    resumed: int = 0
+    sent: int = 0
+    skipped: int = 0
+    rejected: int = 0
+    batches: int = 0
+    errors: List[str] = Field(default_factory=list)
+
+
+class DLQRedrive:
+    """
+    Streams DLQ messages through an optional fix-up function into a batched sink.
+
+    The fix-up function receives each DLQMessage and returns the payload to send;
+    returning ``None`` skips the message. Without a fix-up function the raw bytes
+    of the original event are sent. Messages for which the fix-up function raises
+    are recorded as rejected in the checkpoint and not sent.
+    """
+
+    def __init__(
+        self,
+        dlq: DLQ,
+        sink: RedriveSink | Callable[[List[Any]], Any],
+        fix: FixFunction | None = None,
+        batch_size: int = 100,
+        max_in_flight: int = 1,
+        checkpoint: RedriveCheckpoint | str | os.PathLike | None = None,
+        max_messages: int | None = None,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+    ):
+        """Initialize the DLQRedrive class.
+
+        Args:
+            dlq: DLQ client to consume messages from
+            sink: Sink or callable receiving batches of payloads
+            fix: Function returning the payload to send for a message
+            batch_size: Number of messages per sink batch
+            max_in_flight: Maximum number of batches written concurrently
+            checkpoint: Checkpoint or path of the checkpoint journal
+            max_messages: Maximum number of messages to consume from the DLQ
+            max_retries: Number of retries of a failed sink write
+            retry_backoff: Initial delay in seconds between retries, doubled
+                after every attempt
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+
+        self.dlq = dlq
+        self.sink = sink if isinstance(sink, RedriveSink) else CallableSink(sink)
+        self.fix = fix
+        self.batch_size = batch_size
+        self.max_in_flight = max_in_flight
+        self._owns_checkpoint = not isinstance(checkpoint, RedriveCheckpoint)
+        if self._owns_checkpoint:
+            checkpoint = RedriveCheckpoint(checkpoint)
+        self.checkpoint = checkpoint
+        self.max_messages = max_messages
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+        self._result = RedriveResult()
+        self._result_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._failed = threading.Event()
+
+    def run(self) -> RedriveResult:
+        """
+        Redrive pending checkpointed batches, then the DLQ until it is empty.
+
+        Returns:
+            RedriveResult: Counters of the run
+
+        Raises:
+            Exception: The last error of a sink write that failed after all
+                retries, or an error consuming from the DLQ. The batches that
+                were not sent stay pending in the checkpoint.
+        """
+        self._result = RedriveResult()
+        self._failed.clear()
+        futures: List[Future] = []
+
+        # Consumed messages are journaled before they are sent, so the checkpoint
+        # is saved even when consuming or sending fails
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+                for pending_seq, messages in self.checkpoint.pending().items():
+                    self._count(
+                        resumed=sum(
+                            not self.checkpoint.is_rejected(pending_seq, i)
+                            for i in range(len(messages))
+                        )
+                    )
+                    futures.append(self._submit(executor, pending_seq, messages))
+
+                seq: Optional[int] = None
+                batch: List[DLQMessage] = []
+                remaining = self.max_messages
+                while not self._failed.is_set() and (
+                    remaining is None or remaining > 0
+                ):
+                    size = min(self.dlq.max_batch_size, self.batch_size - len(batch))
+                    if remaining is not None:
+                        size = min(size, remaining)
+                    page = self.dlq.consume_messages(batch_size=size)
+                    if not page:
+                        break
+                    if seq is None:
+                        seq = self.checkpoint.next_seq()
+                    self.checkpoint.append(seq, page)
+                    self._count(consumed=len(page))
+                    if remaining is not None:
+                        remaining -= len(page)
+                    batch.extend(page)
+                    if len(batch) >= self.batch_size:
+                        futures.append(self._submit(executor, seq, batch))
+                        seq, batch = None, []
+                    if len(page) < size:
+                        break
+
+                if batch and not self._failed.is_set():
+                    futures.append(self._submit(executor, seq, batch))
+        finally:
+            self.checkpoint.compact()
+            if self._owns_checkpoint:
+                self.checkpoint.close()
+
+        error = None
+        for future in futures:
+            if future is not None and future.exception() is not None:
+                error = future.exception()
+        if error is not None:
+            raise error
+        return self._result
+
+    def _submit(
+        self, executor: ThreadPoolExecutor, seq: int, messages: List[DLQMessage]
+    ) -> Future | None:
+        payloads = []
+        for index, message in enumerate(messages):
+            # Rejected by a previous run of this batch
+            if self.checkpoint.is_rejected(seq, index):
+                continue
+            try:
+                payload = self.fix(message) if self.fix is not None else message.raw
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                if self.checkpoint.reject(seq, index, message, error):
+                    self._count(rejected=1)
+                continue
+            if payload is None:
+                self._count(skipped=1)
+                continue
+            payloads.append(payload)
+
+        if not payloads:
+            self.checkpoint.ack(seq)
+            return None
+
+        # Blocks until a slot is free, which applies backpressure to consumption
+        self._slots.acquire()
+        future = executor.submit(self._write, seq, payloads)
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _write(self, seq: int, payloads: List[Any]) -> None:
+        delay = self.retry_backoff
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.sink.write(payloads)
+                break
+            except Exception as e:
+                with self._result_lock:
+                    self._result.errors.append(f"{type(e).__name__}: {e}")
+                if attempt == self.max_retries:
+                    self._failed.set()
+                    raise
+                time.sleep(delay)
+                delay *= 2
+        self.checkpoint.ack(seq)
+        self._count(sent=len(payloads), batches=1)
+
+    def _count(self, **counters: int) -> None:
+        with self._result_lock:
+            for name, value in counters.items():
+                setattr(self._result, name, getattr(self._result, name) + value)
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import heapq
+import math
+import random
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from .dlq_message import DLQMessage
+
+_QUOTED = re.compile(r"'[^']*'|\"[^\"]*\"|`[^`]*`")
+_UUID = re.compile(
+    r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b"
+)
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?(?![\w.])")
+_FIELD = re.compile(
+    r"\b(?:field|key|column)s?\s*[:=]?\s*['\"`]?([A-Za-z_][\w.\-]*)", re.IGNORECASE
+)
+
+
+def error_class(error: str | None) -> str:
+    """
+    Normalise an error message into its error class.
+
+    Quoted values, UUIDs and numbers are replaced with placeholders so that
+    messages that only differ by the offending value are counted together.
+    """
+    if not error:
+        return ""
+    error = _QUOTED.sub("<value>", error)
+    error = _UUID.sub("<uuid>", error)
+    return _NUMBER.sub("<number>", error)
+
+
+def error_fields(error: str | None) -> List[str]:
+    """Extract the field names mentioned in an error message."""
+    if not error:
+        return []
+    return _FIELD.findall(error)
+
+
+class SpaceSavingCounter:
+    """
+    Approximate top-k counter with bounded memory (Space-Saving algorithm).
+
+    At most ``capacity`` distinct values are tracked. Counts are exact as long as
+    fewer distinct values are seen; otherwise they are upper bounds that
+    overestimate by at most ``total / capacity``.
+
+    The tracked values are kept in a min-heap of ``(count, value)`` entries, one
+    per value. Increments do not update the heap, so an entry may hold a lower
+    count than its value; such entries are refreshed when they reach the top,
+    which makes evictions O(log capacity) amortized.
+    """
+
+    __slots__ = ("capacity", "total", "_counts", "_heap")
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.total = 0
+        self._counts: Dict[str, int] = {}
+        self._heap: List[Tuple[int, str]] = []
+
+    def add(self, value: str, count: int = 1) -> None:
+        """Count an occurrence of a value."""
+        self.total += count
+        counts = self._counts
+        if value in counts:
+            counts[value] += count
+        elif len(counts) < self.capacity:
+            counts[value] = count
+            heapq.heappush(self._heap, (count, value))
+        else:
+            # Replace the least frequent value and inherit its count
+            heap = self._heap
+            low, victim = heap[0]
+            while counts[victim] != low:
+                heapq.heapreplace(heap, (counts[victim], victim))
+                low, victim = heap[0]
+            del counts[victim]
+            counts[value] = low + count
+            heapq.heapreplace(heap, (low + count, value))
+
+    def most_common(self, n: int | None = None) -> List[Tuple[str, int]]:
+        """Get the ``n`` most frequent values with their counts."""
+        items = sorted(self._counts.items(), key=lambda item: (-item[1], item[0]))
+        return items if n is None else items[:n]
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+
+class ReservoirSample:
+    """
+    Fixed-size uniform random sample of a stream of unknown length.
+
+    Uses Algorithm L, which draws a number of random values proportional to
+    ``size * log(n / size)`` instead of one per item.
+    """
+
+    __slots__ = ("size", "seen", "items", "_rng", "_w", "_next")
+
+    def __init__(self, size: int, seed: int | None = None):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+        self.seen = 0
+        self.items: List[DLQMessage] = []
+        self._rng = random.Random(seed)
+        self._w = 1.0
+        self._next = size
+
+    def add(self, item: DLQMessage) -> None:
+        """Offer an item to the sample."""
+        index = self.seen
+        self.seen += 1
+        if index < self.size:
+            self.items.append(item)
+            if self.seen == self.size:
+                self._advance()
+            return
+        if index == self._next:
+            self.items[self._rng.randrange(self.size)] = item
+            self._advance()
+
+    def _advance(self) -> None:
+        self._w *= math.exp(math.log(self._uniform()) / self.size)
+        skip = math.floor(math.log(self._uniform()) / math.log(1.0 - self._w))
+        self._next += skip + 1 if self.seen > self.size else skip
+
+    def _uniform(self) -> float:
+        """Draw a random value in the open interval (0, 1)."""
+        value = self._rng.random()
+        while value == 0.0:
+            value = self._rng.random()
+        return value
+
+
+class DLQTriageReport(BaseModel):
+    """Summary of a DLQ triage run.
+
+    ``top_errors`` and ``top_fields`` are approximate once the number of
+    distinct error classes or fields exceeds the tracking capacity.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    total_messages: int = 0
+    components: Dict[str, int] = Field(default_factory=dict)
+    top_errors: List[Tuple[str, int]] = Field(default_factory=list)
+    top_fields: List[Tuple[str, int]] = Field(default_factory=list)
+    sample: List[DLQMessage] = Field(default_factory=list)
+
+
+class DLQTriage:
+    """
+    Streaming DLQ triage with constant memory.
+
+    Keeps a uniform reservoir sample of the messages, exact counters per pipeline
+    component and bounded top-k counters of error classes and of the fields
+    mentioned in error messages. Original event payloads are never decoded.
+    """
+
+    def __init__(
+        self,
+        sample_size: int = 100,
+        top_k: int = 10,
+        capacity: int | None = None,
+        seed: int | None = None,
+    ):
+        """Initialize the DLQTriage class.
+
+        Args:
+            sample_size: Number of messages kept in the reservoir sample
+            top_k: Number of error classes and fields reported
+            capacity: Number of distinct error classes and fields tracked,
+                defaults to ``50 * top_k``
+            seed: Seed of the random generator used for sampling
+        """
+        if top_k < 1:
+            raise ValueError("top_k must be at least 1")
+        capacity = capacity if capacity is not None else 50 * top_k
+        if capacity < top_k:
+            raise ValueError("capacity must be greater than or equal to top_k")
+        self.top_k = top_k
+        self.total_messages = 0
+        self.components: Dict[str, int] = {}
+        self.errors = SpaceSavingCounter(capacity)
+        self.fields = SpaceSavingCounter(capacity)
+        self.reservoir = ReservoirSample(sample_size, seed=seed)
+
+    def add(self, message: DLQMessage) -> None:
+        """Account for a single DLQ message."""
+        self.total_messages += 1
+        component = message.component or ""
+        self.components[component] = self.components.get(component, 0) + 1
+        self.errors.add(error_class(message.error))
+        for field in error_fields(message.error):
+            self.fields.add(field)
+        self.reservoir.add(message)
+
+    def add_many(self, messages: Iterable[DLQMessage]) -> DLQTriage:
+        """Account for every message of an iterable."""
+        for message in messages:
+            self.add(message)
+        return self
+
+    def report(self, top_k: Optional[int] = None) -> DLQTriageReport:
+        """Build a report of the messages seen so far."""
+        top_k = top_k or self.top_k
+        return DLQTriageReport(
+            total_messages=self.total_messages,
+            components=dict(sorted(self.components.items(), key=lambda item: -item[1])),
+            top_errors=self.errors.most_common(top_k),
+            top_fields=self.fields.most_common(top_k),
+            sample=list(self.reservoir.items),
+        )
@@ -69,6 +69,18 @@ class InvalidBatchSizeError(GlassFlowError):
     """Exception raised when a batch size is invalid."""
 
 
+class ExpressionError(GlassFlowError):
+    """Base for errors of transform expressions."""
+
+
+class InvalidExpressionError(ExpressionError):
+    """Exception raised when a transform expression cannot be parsed."""
+
+
+class ExpressionEvaluationError(ExpressionError):
+    """Raised when an expression cannot be evaluated for a given event."""
+
+
 # Status validation error classes for 400 Bad Request responses
 class TerminalStateViolationError(ValidationError):
     """Raised when attempting to transition from a terminal state to another state."""
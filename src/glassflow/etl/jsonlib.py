@@ -0,0 +1,56 @@
+"""
+JSON encoding helpers.
+
+Uses ``orjson`` when it is installed (``pip install glassflow[fast]``) and falls
+back to the standard library ``json`` module otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+JSONInput = Union[bytes, bytearray, memoryview, str]
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+# orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: JSONInput) -> Any:
+    """Decode a JSON document from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Encode an object as UTF-8 JSON bytes.
+
+    Args:
+        obj: Object to encode
+        indent: Whether to pretty-print the output
+        sort_keys: Whether to sort dictionary keys
+    """
+    if orjson is not None:
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        sort_keys=sort_keys,
+        separators=None if indent else (",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
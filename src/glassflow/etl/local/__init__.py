@@ -0,0 +1,82 @@
+"""
+Offline engines that reproduce pipeline transforms locally.
+
+They let pipeline configurations be tested and sized against sample or replayed
+events without deploying them.
+"""
+
+from .batching import (
+    SinkBatchingReport,
+    SinkBatchingSimulator,
+    bursty_arrivals,
+    constant_arrivals,
+    find_sink_batch_settings,
+    poisson_arrivals,
+    replayed_arrivals,
+)
+from .clickhouse import (
+    ClickhouseCoercer,
+    CoercionReport,
+    ColumnCoercionStats,
+    TruncationError,
+    clickhouse_converter,
+)
+from .coercion import kafka_coercer
+from .dedup import DedupEngine, DedupStats
+from .expressions import (
+    CompiledExpression,
+    CompiledRecord,
+    ExpressionEvaluationError,
+    compile_expression,
+)
+from .filter import FilterEngine, FilterStats
+from .generator import EventGenerator, GeneratorStats
+from .join import JoinEngine, JoinSideStats, JoinStats
+from .otlp import OTLPFlattener, OTLPStats, decode_otlp, read_otlp
+from .runner import DryRunReport, PipelineDryRun, StageStats, read_events
+from .schema import FieldViolations, SchemaReport, SchemaValidator
+from .stateless import StatelessEngine, StatelessStats
+from .timeutils import parse_duration
+
+__all__ = [
+    "ClickhouseCoercer",
+    "CoercionReport",
+    "ColumnCoercionStats",
+    "CompiledExpression",
+    "CompiledRecord",
+    "DryRunReport",
+    "DedupEngine",
+    "DedupStats",
+    "EventGenerator",
+    "ExpressionEvaluationError",
+    "FieldViolations",
+    "FilterEngine",
+    "FilterStats",
+    "GeneratorStats",
+    "JoinEngine",
+    "JoinSideStats",
+    "JoinStats",
+    "OTLPFlattener",
+    "OTLPStats",
+    "PipelineDryRun",
+    "SchemaReport",
+    "SchemaValidator",
+    "SinkBatchingReport",
+    "SinkBatchingSimulator",
+    "StageStats",
+    "StatelessEngine",
+    "StatelessStats",
+    "TruncationError",
+    "bursty_arrivals",
+    "clickhouse_converter",
+    "compile_expression",
+    "constant_arrivals",
+    "decode_otlp",
+    "find_sink_batch_settings",
+    "kafka_coercer",
+    "parse_duration",
+    "poisson_arrivals",
+    "read_events",
+    "read_otlp",
+    "replayed_arrivals",
+]
@@ -0,0 +1,367 @@
+from __future__ import annotations
+
+import math
+import random
+from typing import Iterable, List, Optional, Sequence
+
+from pydantic import BaseModel
+
+from ..models import SinkConfig
+from .timeutils import parse_duration, to_seconds
+
+DEFAULT_MAX_BATCH_SIZE = 1000
+DEFAULT_MAX_DELAY_TIME = "1m"
+
+DEFAULT_BATCH_SIZES = (1, 10, 100, 500, 1000, 5000, 10000, 50000, 100000)
+DEFAULT_DELAY_TIMES = ("100ms", "500ms", "1s", "5s", "10s", "30s", "1m", "5m")
+
+
+def constant_arrivals(rate: float, duration: float) -> List[float]:
+    """Arrival times of events at a constant rate.
+
+    Args:
+        rate: Events per second
+        duration: Length of the profile in seconds
+    """
+    if rate <= 0:
+        return []
+    interval = 1.0 / rate
+    return [i * interval for i in range(int(rate * duration))]
+
+
+def poisson_arrivals(
+    rate: float, duration: float, seed: int | None = None
+) -> List[float]:
+    """Arrival times of a Poisson process.
+
+    Args:
+        rate: Mean events per second
+        duration: Length of the profile in seconds
+        seed: Seed of the random generator
+    """
+    rng = random.Random(seed)
+    arrivals = []
+    t = rng.expovariate(rate) if rate > 0 else math.inf
+    while t < duration:
+        arrivals.append(t)
+        t += rng.expovariate(rate)
+    return arrivals
+
+
+def bursty_arrivals(
+    base_rate: float,
+    burst_rate: float,
+    burst_duration: float,
+    period: float,
+    duration: float,
+    seed: int | None = None,
+) -> List[float]:
+    """Arrival times alternating between a base rate and periodic bursts.
+
+    Each ``period`` starts with ``burst_duration`` seconds at ``burst_rate``
+    followed by the base rate; arrivals are Poisson within each phase.
+
+    Args:
+        base_rate: Mean events per second outside of bursts
+        burst_rate: Mean events per second during bursts
+        burst_duration: Length of each burst in seconds
+        period: Seconds between the starts of two bursts
+        duration: Length of the profile in seconds
+        seed: Seed of the random generator
+    """
+    if period <= 0 or not 0 <= burst_duration <= period:
+        raise ValueError("burst_duration must be between 0 and period")
+    rng = random.Random(seed)
+    arrivals = []
+    start = 0.0
+    while start < duration:
+        phases = (
+            (start, start + burst_duration, burst_rate),
+            (start + burst_duration, start + period, base_rate),
+        )
+        for begin, end, rate in phases:
+            if rate <= 0:
+                continue
+            end = min(end, duration)
+            t = begin + rng.expovariate(rate)
+            while t < end:
+                arrivals.append(t)
+                t += rng.expovariate(rate)
+        start += period
+    return arrivals
+
+
+def replayed_arrivals(timestamps: Iterable) -> List[float]:
+    """Arrival times replayed from recorded event times, relative to the first.
+
+    Timestamps can be epoch seconds, datetimes or ISO 8601 strings.
+    """
+    times = sorted(to_seconds(t) for t in timestamps)
+    if not times:
+        return []
+    first = times[0]
+    return [t - first for t in times]
+
+
+def _percentile(sorted_values: Sequence[float], percentile: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(
+        len(sorted_values) - 1,
+        max(0, math.ceil(percentile / 100 * len(sorted_values)) - 1),
+    )
+    return sorted_values[index]
+
+
+# Latency percentiles kept in a SinkBatchingReport
+REPORTED_PERCENTILES = (50, 90, 99, 100)
+
+
+def _check_percentile(percentile: float) -> None:
+    if percentile not in REPORTED_PERCENTILES:
+        raise ValueError(
+            f"Unsupported latency percentile {percentile!r}, "
+            f"expected one of {', '.join(map(str, REPORTED_PERCENTILES))}"
+        )
+
+
+class SinkBatchingReport(BaseModel):
+    """Outcome of a sink batching simulation."""
+
+    max_batch_size: int
+    max_delay_time: float
+    events: int = 0
+    batches: int = 0
+    size_flushes: int = 0
+    delay_flushes: int = 0
+    duration: float = 0.0
+    batch_size_mean: float = 0.0
+    batch_size_p50: float = 0.0
+    batch_size_p90: float = 0.0
+    batch_size_min: int = 0
+    batch_size_max: int = 0
+    latency_mean: float = 0.0
+    latency_p50: float = 0.0
+    latency_p90: float = 0.0
+    latency_p99: float = 0.0
+    latency_max: float = 0.0
+    sink_utilization: float = 0.0
+
+    @property
+    def inserts_per_second(self) -> float:
+        """Average number of inserts issued per second."""
+        return self.batches / self.duration if self.duration else 0.0
+
+    @property
+    def flush_interval(self) -> float:
+        """Average number of seconds between two inserts."""
+        return self.duration / self.batches if self.batches else 0.0
+
+    def latency(self, percentile: float) -> float:
+        """
+        Latency at one of the reported percentiles.
+
+        Raises:
+            ValueError: If the percentile is not one of 50, 90, 99 or 100
+        """
+        _check_percentile(percentile)
+        return {
+            50: self.latency_p50,
+            90: self.latency_p90,
+            99: self.latency_p99,
+            100: self.latency_max,
+        }[percentile]
+
+
+class SinkBatchingSimulator:
+    """
+    Discrete-event simulation of how the sink batches events.
+
+    A batch is flushed when it reaches ``max_batch_size`` events or when
+    ``max_delay_time`` has passed since its first event, whichever comes first.
+    Inserts are issued one at a time: a batch flushed while the previous insert is
+    still running waits for it, and each insert takes ``insert_overhead`` seconds
+    plus ``insert_row_cost`` seconds per row. The latency of an event is the time
+    from its arrival to the end of the insert that writes it.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_delay_time: str | float = DEFAULT_MAX_DELAY_TIME,
+        insert_overhead: float = 0.0,
+        insert_row_cost: float = 0.0,
+    ):
+        """Initialize the SinkBatchingSimulator class.
+
+        Args:
+            max_batch_size: Maximum number of events per insert
+            max_delay_time: Maximum time an event waits for its batch to fill, as
+                a duration string or seconds
+            insert_overhead: Fixed duration of an insert in seconds
+            insert_row_cost: Duration of an insert per row in seconds
+
+        Raises:
+            ValueError: If the settings are not positive
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if isinstance(max_delay_time, str):
+            max_delay_time = parse_duration(max_delay_time)
+        if max_delay_time <= 0:
+            raise ValueError("max_delay_time must be positive")
+        if insert_overhead < 0 or insert_row_cost < 0:
+            raise ValueError("insert costs cannot be negative")
+        self.max_batch_size = max_batch_size
+        self.max_delay_time = float(max_delay_time)
+        self.insert_overhead = insert_overhead
+        self.insert_row_cost = insert_row_cost
+
+    @classmethod
+    def from_config(
+        cls,
+        config: SinkConfig,
+        insert_overhead: float = 0.0,
+        insert_row_cost: float = 0.0,
+    ) -> SinkBatchingSimulator:
+        """Create a simulator with the batching settings of a sink config."""
+        return cls(
+            max_batch_size=config.max_batch_size or DEFAULT_MAX_BATCH_SIZE,
+            max_delay_time=config.max_delay_time or DEFAULT_MAX_DELAY_TIME,
+            insert_overhead=insert_overhead,
+            insert_row_cost=insert_row_cost,
+        )
+
+    def run(self, arrivals: Iterable[float]) -> SinkBatchingReport:
+        """
+        Simulate the batching of events arriving at the given times.
+
+        Args:
+            arrivals: Arrival times in seconds
+
+        Returns:
+            SinkBatchingReport: Batch size, flush and latency statistics
+        """
+        times = arrivals if isinstance(arrivals, list) else list(arrivals)
+        if any(b < a for a, b in zip(times, times[1:])):
+            times = sorted(times)
+
+        max_size = self.max_batch_size
+        delay = self.max_delay_time
+        overhead, row_cost = self.insert_overhead, self.insert_row_cost
+
+        sizes: List[int] = []
+        latencies: List[float] = []
+        size_flushes = delay_flushes = 0
+        busy = 0.0
+        sink_free_at = -math.inf
+        start = 0  # index of the first event of the pending batch
+
+        def flush(end: int, trigger: float) -> None:
+            nonlocal sink_free_at, busy
+            begin = max(trigger, sink_free_at)
+            cost = overhead + row_cost * (end - start)
+            done = begin + cost
+            sink_free_at = done
+            busy += cost
+            sizes.append(end - start)
+            latencies.extend(done - t for t in times[start:end])
+
+        n = len(times)
+        while start < n:
+            deadline = times[start] + delay
+            # Index of the event that fills the batch, if it arrives in time
+            full = start + max_size - 1
+            if full < n and times[full] < deadline:
+                flush(full + 1, times[full])
+                size_flushes += 1
+                start = full + 1
+                continue
+            # The batch is flushed by the timer with the events received so far
+            end = start
+            while end < n and times[end] < deadline:
+                end += 1
+            flush(end, deadline)
+            delay_flushes += 1
+            start = end
+
+        report = SinkBatchingReport(
+            max_batch_size=max_size,
+            max_delay_time=delay,
+            events=n,
+            batches=len(sizes),
+            size_flushes=size_flushes,
+            delay_flushes=delay_flushes,
+        )
+        if not n:
+            return report
+
+        duration = max(sink_free_at, times[-1]) - times[0]
+        sizes.sort()
+        latencies.sort()
+        report.duration = duration
+        report.batch_size_mean = n / len(sizes)
+        report.batch_size_p50 = _percentile(sizes, 50)
+        report.batch_size_p90 = _percentile(sizes, 90)
+        report.batch_size_min = sizes[0]
+        report.batch_size_max = sizes[-1]
+        report.latency_mean = sum(latencies) / n
+        report.latency_p50 = _percentile(latencies, 50)
+        report.latency_p90 = _percentile(latencies, 90)
+        report.latency_p99 = _percentile(latencies, 99)
+        report.latency_max = latencies[-1]
+        report.sink_utilization = busy / duration if duration else 1.0
+        return report
+
+
+def find_sink_batch_settings(
+    arrivals: Iterable[float],
+    latency_slo: float,
+    percentile: float = 99,
+    batch_sizes: Sequence[int] = DEFAULT_BATCH_SIZES,
+    delay_times: Sequence[str | float] = DEFAULT_DELAY_TIMES,
+    insert_overhead: float = 0.0,
+    insert_row_cost: float = 0.0,
+) -> Optional[SinkBatchingReport]:
+    """
+    Search for the batching settings that meet a latency SLO with fewest inserts.
+
+    Every combination of the candidate batch sizes and delays is simulated:
+    latency is not monotonic in the batch size once inserts have a fixed cost,
+    as small batches queue up behind each other and large ones wait to fill.
+    Among the settings meeting the SLO, the one issuing the fewest inserts per
+    second wins, ties going to the lowest latency.
+
+    Args:
+        arrivals: Arrival times in seconds
+        latency_slo: Maximum latency in seconds at the given percentile
+        percentile: Latency percentile the SLO applies to (50, 90, 99 or 100)
+        batch_sizes: Candidate values of ``max_batch_size``
+        delay_times: Candidate values of ``max_delay_time``
+        insert_overhead: Fixed duration of an insert in seconds
+        insert_row_cost: Duration of an insert per row in seconds
+
+    Returns:
+        SinkBatchingReport | None: Report of the best settings, or None when no
+            candidate meets the SLO
+
+    Raises:
+        ValueError: If the percentile is not one of 50, 90, 99 or 100
+    """
+    _check_percentile(percentile)
+    times = sorted(arrivals)
+    best: Optional[SinkBatchingReport] = None
+    best_key = None
+    for delay in delay_times:
+        for size in sorted(set(batch_sizes)):
+            simulator = SinkBatchingSimulator(
+                size, delay, insert_overhead, insert_row_cost
+            )
+            report = simulator.run(times)
+            latency = report.latency(percentile)
+            if latency > latency_slo:
+                continue
+            key = (report.inserts_per_second, latency)
+            if best_key is None or key < best_key:
+                best, best_key = report, key
+    return best
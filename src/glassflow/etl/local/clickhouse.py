@@ -0,0 +1,645 @@
+"""Conversion of values to the ClickHouse column types of a sink mapping."""
+
+from __future__ import annotations
+
+import decimal
+import ipaddress
+import json
+import math
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from pydantic import BaseModel, Field
+
+from ..models import (
+    ANY_COLUMN_TYPE_CONTEXT,
+    ClickhouseType,
+    SinkConfig,
+    SinkFieldMapping,
+    parse_clickhouse_type,
+)
+from .coercion import (
+    FLOAT32_MAX,
+    TruncationError,
+    float_converter,
+    integer_converter,
+    to_string,
+)
+from .timeutils import field_getter, to_seconds
+
+CLICKHOUSE_INTEGER_BOUNDS: Dict[str, Tuple[int, int]] = {
+    "Int8": (-(2**7), 2**7 - 1),
+    "Int16": (-(2**15), 2**15 - 1),
+    "Int32": (-(2**31), 2**31 - 1),
+    "Int64": (-(2**63), 2**63 - 1),
+    "UInt8": (0, 2**8 - 1),
+    "UInt16": (0, 2**16 - 1),
+    "UInt32": (0, 2**32 - 1),
+    "UInt64": (0, 2**64 - 1),
+    "Int128": (-(2**127), 2**127 - 1),
+    "Int256": (-(2**255), 2**255 - 1),
+    "UInt128": (0, 2**128 - 1),
+    "UInt256": (0, 2**256 - 1),
+}
+
+# Precision of the Decimal types taking only a scale
+DECIMAL_PRECISION = {"Decimal32": 9, "Decimal64": 18, "Decimal128": 38}
+DECIMAL_PRECISION["Decimal256"] = 76
+
+DATETIME_BOUNDS = (0, 2**32 - 1)
+# 1900-01-01 00:00:00 to 2299-12-31 23:59:59 UTC
+DATETIME64_BOUNDS = (-2208988800, 10413791999)
+DEFAULT_DATETIME64_PRECISION = 3
+DATE_BOUNDS = (date(1970, 1, 1), date(2149, 6, 6))
+DATE32_BOUNDS = (date(1900, 1, 1), date(2299, 12, 31))
+# Largest finite BFloat16, which keeps the exponent range of Float32
+BFLOAT16_MAX = 3.3895313892515355e38
+
+_TRUE = {"true", "1"}
+_FALSE = {"false", "0"}
+
+
+def _fixed_string(length: Optional[int]) -> Callable[[Any], Any]:
+    def convert(value: Any) -> Any:
+        value = to_string(value)
+        if value is None or length is None:
+            return value
+        if len(value.encode()) > length:
+            raise TruncationError(
+                f"{value!r} is longer than {length} bytes for FixedString({length})"
+            )
+        return value
+
+    return convert
+
+
+def _bool(value: Any) -> Any:
+    if value is True or value is False or value is None:
+        return value
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE:
+            return True
+        if lowered in _FALSE:
+            return False
+    elif isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+    raise ValueError(f"{value!r} is not a boolean")
+
+
+def _uuid(value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, bytes) and len(value) == 16:
+        return str(uuid.UUID(bytes=value))
+    if isinstance(value, str):
+        return str(uuid.UUID(value))
+    raise TypeError(f"cannot convert {type(value).__name__} to UUID")
+
+
+def _datetime(value: Any) -> Any:
+    if value.__class__ is int and 0 <= value <= DATETIME_BOUNDS[1]:
+        return value
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        raise TypeError("cannot convert bool to DateTime")
+    seconds = to_seconds(value)
+    low, high = DATETIME_BOUNDS
+    if seconds < low or seconds > high:
+        raise OverflowError(f"{value!r} is out of range for DateTime")
+    if not seconds.is_integer():
+        raise TruncationError(f"{value!r} would be truncated to whole seconds")
+    return int(seconds)
+
+
+def _datetime64(precision: int) -> Callable[[Any], Any]:
+    name = f"DateTime64({precision})"
+
+    def convert(value: Any) -> Any:
+        if value is None:
+            return None
+        if isinstance(value, bool):
+            raise TypeError(f"cannot convert bool to {name}")
+        seconds = to_seconds(value)
+        low, high = DATETIME64_BOUNDS
+        if seconds < low or seconds > high:
+            raise OverflowError(f"{value!r} is out of range for {name}")
+        if round(seconds, precision) != seconds:
+            raise TruncationError(f"{value!r} is more precise than {name}")
+        return seconds
+
+    return convert
+
+
+def _date(name: str, low: date, high: date) -> Callable[[Any], Any]:
+    epoch = date(1970, 1, 1)
+
+    def convert(value: Any) -> Any:
+        if value is None:
+            return None
+        if isinstance(value, bool):
+            raise TypeError(f"cannot convert bool to {name}")
+        if isinstance(value, int):
+            # Numbers are days since the epoch, as in ClickHouse
+            day = epoch + timedelta(days=value)
+        elif isinstance(value, date) and not isinstance(value, datetime):
+            day = value
+        else:
+            seconds = to_seconds(value)
+            if seconds % 86400:
+                raise TruncationError(f"{value!r} would be truncated to a {name}")
+            day = epoch + timedelta(seconds=seconds)
+        if day < low or day > high:
+            raise OverflowError(f"{value!r} is out of range for {name}")
+        return day
+
+    return convert
+
+
+def _decimal(name: str, precision: int, scale: int) -> Callable[[Any], Any]:
+    limit = decimal.Decimal(10) ** (precision - scale)
+    quantum = decimal.Decimal(1).scaleb(-scale)
+    context = decimal.Context(prec=precision + 1)
+
+    def convert(value: Any) -> Any:
+        if value is None:
+            return None
+        if isinstance(value, bool):
+            raise TypeError(f"cannot convert bool to {name}")
+        if isinstance(value, float):
+            # The shortest repr, so that 0.1 is not taken as 0.1000000000000000055
+            value = repr(value)
+        elif not isinstance(value, (int, str, decimal.Decimal)):
+            raise TypeError(f"cannot convert {type(value).__name__} to {name}")
+        try:
+            number = decimal.Decimal(value.strip() if isinstance(value, str) else value)
+        except decimal.InvalidOperation:
+            raise ValueError(f"{value!r} is not a number") from None
+        if not number.is_finite():
+            raise ValueError(f"{value!r} is not a finite number")
+        if abs(number) >= limit:
+            raise OverflowError(f"{value} is out of range for {name}")
+        rounded = number.quantize(quantum, context=context)
+        if rounded != number:
+            raise TruncationError(f"{value!r} has more than {scale} decimal places")
+        return rounded
+
+    return convert
+
+
+def _ip(name: str, version: int) -> Callable[[Any], Any]:
+    def convert(value: Any) -> Any:
+        if value is None:
+            return None
+        if isinstance(value, bool) or not isinstance(value, (str, int, bytes)):
+            raise TypeError(f"cannot convert {type(value).__name__} to {name}")
+        address = ipaddress.ip_address(
+            value.strip() if isinstance(value, str) else value
+        )
+        if address.version != version:
+            if version == 6:
+                address = ipaddress.IPv6Address(f"::ffff:{address}")
+            else:
+                raise ValueError(f"{value!r} is not an IPv4 address")
+        return str(address)
+
+    return convert
+
+
+def _enum(
+    name: str, low: int, high: int, members: Tuple[Tuple[str, Optional[int]], ...]
+) -> Callable[[Any], Any]:
+    names = {member for member, _ in members}
+    numbers = {number for _, number in members if number is not None}
+
+    def convert(value: Any) -> Any:
+        if value is None:
+            return value
+        if value.__class__ is str:
+            if names and value not in names:
+                raise ValueError(f"{value!r} is not a member of {name}")
+            return value
+        if isinstance(value, int) and not isinstance(value, bool):
+            if value < low or value > high:
+                raise OverflowError(f"{value} is out of range for {name}")
+            if numbers and value not in numbers:
+                raise ValueError(f"{value} is not a member of {name}")
+            return value
+        raise TypeError(f"cannot convert {type(value).__name__} to {name}")
+
+    return convert
+
+
+def _tuple(
+    elements: Sequence[Callable[[Any], Any]], names: Sequence[str]
+) -> Callable[[Any], Any]:
+    def convert(value: Any) -> Any:
+        if value is None:
+            return None
+        if isinstance(value, str):
+            value = json.loads(value)
+        if isinstance(value, Mapping) and names:
+            value = [value.get(name) for name in names]
+        if not isinstance(value, (list, tuple)):
+            raise TypeError(f"cannot convert {type(value).__name__} to Tuple")
+        if len(value) != len(elements):
+            raise ValueError(
+                f"expected {len(elements)} Tuple elements, got {len(value)}"
+            )
+        return tuple(element(item) for element, item in zip(elements, value))
+
+    return convert
+
+
+def _array(element: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def convert(value: Any) -> Any:
+        if value is None:
+            return None
+        if isinstance(value, str):
+            value = json.loads(value)
+        if not isinstance(value, (list, tuple)):
+            raise TypeError(f"cannot convert {type(value).__name__} to Array")
+        return [element(item) for item in value]
+
+    return convert
+
+
+def _map(key: Callable[[Any], Any], item: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def convert(value: Any) -> Any:
+        if value is None:
+            return None
+        if isinstance(value, str):
+            value = json.loads(value)
+        if not isinstance(value, Mapping):
+            raise TypeError(f"cannot convert {type(value).__name__} to Map")
+        return {key(k): item(v) for k, v in value.items()}
+
+    return convert
+
+
+@lru_cache(maxsize=1024)
+def clickhouse_converter(column_type: str) -> Callable[[Any], Any]:
+    """
+    Get the function converting values to a ClickHouse column type.
+
+    The returned function returns values that already fit the column unchanged,
+    converts compatible values (e.g. ``"42"`` to ``Int8`` or an ISO 8601 string
+    to ``DateTime``) and raises when the value cannot be stored as it is:
+
+    * ``OverflowError`` for numbers and times out of the range of the type
+    * ``TruncationError`` for values that would lose a fractional part,
+      sub-second precision or bytes of a ``FixedString``
+    * ``ValueError`` or ``TypeError`` for values that cannot be parsed
+
+    ``None`` is passed through. Numbers are taken as epoch seconds for
+    ``DateTime`` and ``DateTime64`` and as days since the epoch for ``Date`` and
+    ``Date32``, which convert to ``datetime.date``. Decimals convert to
+    ``decimal.Decimal``, IP addresses to their string form and tuples to Python
+    tuples, read from objects by element name for named tuples.
+
+    Args:
+        column_type: ClickHouse type, e.g. ``Int8``, ``FixedString(16)``,
+            ``DateTime64(6)`` or ``Array(LowCardinality(String))``
+
+    Returns:
+        Callable[[Any], Any]: Conversion function
+
+    Raises:
+        ValueError: If the type is not supported
+    """
+    return _converter(parse_clickhouse_type(column_type), column_type)
+
+
+@lru_cache(maxsize=1024)
+def _converter(t: ClickhouseType, column_type: str) -> Callable[[Any], Any]:
+    name, args, params = t.name, t.arguments, t.parameters
+    if name in ("LowCardinality", "Nullable"):
+        return _converter(args[0], column_type)
+    if name == "Array":
+        return _array(_converter(args[0], column_type))
+    if name == "Map":
+        return _map(_converter(args[0], column_type), _converter(args[1], column_type))
+    if name == "Tuple":
+        return _tuple([_converter(a, column_type) for a in args], params)
+    if name in CLICKHOUSE_INTEGER_BOUNDS:
+        return integer_converter(name, *CLICKHOUSE_INTEGER_BOUNDS[name])
+    if name == "Float32":
+        return float_converter(name, FLOAT32_MAX)
+    if name == "BFloat16":
+        return float_converter(name, BFLOAT16_MAX)
+    if name == "Float64":
+        return float_converter(name)
+    if name == "String":
+        return to_string
+    if name == "FixedString":
+        return _fixed_string(params[0] if params else None)
+    if name == "Bool":
+        return _bool
+    if name == "UUID":
+        return _uuid
+    if name == "DateTime":
+        return _datetime
+    if name == "DateTime64":
+        return _datetime64(params[0] if params else DEFAULT_DATETIME64_PRECISION)
+    if name == "Date":
+        return _date(name, *DATE_BOUNDS)
+    if name == "Date32":
+        return _date(name, *DATE32_BOUNDS)
+    if name == "Decimal":
+        precision, scale = (list(params) + [0])[:2]
+        return _decimal(str(t), precision, scale)
+    if name in DECIMAL_PRECISION:
+        return _decimal(str(t), DECIMAL_PRECISION[name], params[0])
+    if name in ("IPv4", "IPv6"):
+        return _ip(name, int(name[-1]))
+    if name == "Enum8":
+        return _enum(name, *CLICKHOUSE_INTEGER_BOUNDS["Int8"], params)
+    if name == "Enum16":
+        return _enum(name, *CLICKHOUSE_INTEGER_BOUNDS["Int16"], params)
+    raise ValueError(f"Unsupported ClickHouse type: {column_type!r}")
+
+
+@lru_cache(maxsize=None)
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _vector_check(t: ClickhouseType) -> Optional[Callable[[Any], Optional[list]]]:
+    """
+    Get a NumPy check of a whole column of a numeric type, if NumPy is installed.
+
+    The returned function returns the converted column when every value is a
+    number of the right kind within the range of the type, which is then what
+    the converter of the type would return, and None otherwise, e.g. for
+    columns holding nulls or strings, which go through the converter instead.
+    """
+    np = _numpy()
+    while t.name in ("LowCardinality", "Nullable"):
+        t = t.arguments[0]
+    if np is None or t.name not in (*CLICKHOUSE_INTEGER_BOUNDS, "Float32", "Float64"):
+        return None
+
+    if t.name in CLICKHOUSE_INTEGER_BOUNDS:
+        low, high = CLICKHOUSE_INTEGER_BOUNDS[t.name]
+        kinds = "iu"
+    else:
+        limit = FLOAT32_MAX if t.name == "Float32" else math.inf
+        kinds = "f"
+
+    def check(values: Any) -> Optional[list]:
+        try:
+            array = np.asarray(values)
+        except (ValueError, TypeError, OverflowError):
+            return None
+        if array.ndim != 1 or array.dtype.kind not in kinds:
+            return None
+        if array.size:
+            if kinds == "iu":
+                if int(array.min()) < low or int(array.max()) > high:
+                    return None
+            elif limit != math.inf:
+                finite = array[np.isfinite(array)]
+                if finite.size and float(np.abs(finite).max()) > limit:
+                    return None
+        return array.tolist()
+
+    return check
+
+
+def _failure_kind(error: Exception) -> str:
+    if isinstance(error, OverflowError):
+        return "overflow"
+    if isinstance(error, TruncationError):
+        return "truncated"
+    return "invalid"
+
+
+class ColumnCoercionStats(BaseModel):
+    """Conversion outcome of one sink column."""
+
+    name: str
+    column_name: str
+    column_type: str
+    values: int = 0
+    nulls: int = 0
+    overflow: int = 0
+    truncated: int = 0
+    invalid: int = 0
+    examples: List[str] = Field(default_factory=list)
+
+    @property
+    def failures(self) -> int:
+        """Number of values that cannot be stored in the column as they are."""
+        return self.overflow + self.truncated + self.invalid
+
+    @property
+    def failure_rate(self) -> float:
+        """Fraction of the non-null values that cannot be stored."""
+        converted = self.values - self.nulls
+        return self.failures / converted if converted else 0.0
+
+
+class CoercionReport(BaseModel):
+    """Result of converting rows to the columns of a sink mapping."""
+
+    rows: int = 0
+    failed_rows: int = 0
+    columns: List[ColumnCoercionStats] = Field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether every value fits its column."""
+        return self.failed_rows == 0
+
+    @property
+    def throughput(self) -> float:
+        """Converted rows per second."""
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def failures(self) -> Dict[str, ColumnCoercionStats]:
+        """Columns with at least one failed value, keyed by column name."""
+        return {c.column_name: c for c in self.columns if c.failures}
+
+
+class ClickhouseCoercer:
+    """
+    Converts sample values to the ClickHouse column types of a sink mapping.
+
+    Values are converted a column at a time. Each column first goes through a
+    single ``map`` of its converter, which is all valid data pays for; columns
+    with failures are converted again value by value to count overflows,
+    truncations and parse failures. Failed values are replaced by ``None`` in
+    the converted columns.
+
+    Every type of ``clickhouse_converter`` is supported, with its parameters,
+    e.g. the length of a ``FixedString(16)`` or the scale of a
+    ``Decimal(18, 4)``. That includes types no Kafka type maps to, which
+    ``SinkFieldMapping`` rejects by default: mappings given as dicts are
+    validated with ``ANY_COLUMN_TYPE_CONTEXT``. The types of some columns can be
+    overridden with ``column_types``, e.g. ``{"id": "FixedString(16)"}``, to
+    check values against a table that differs from the mapping.
+
+    Values are converted by plain Python functions, as NumPy is not a
+    dependency of the SDK. When it is installed (``pip install
+    glassflow[numpy]``), integer and float columns are first checked as a whole
+    with NumPy, and only converted value by value when that check fails.
+    """
+
+    def __init__(
+        self,
+        mapping: SinkConfig | Sequence[SinkFieldMapping | Mapping[str, str]],
+        column_types: Mapping[str, str] | None = None,
+        max_examples: int = 3,
+    ):
+        """Initialize the ClickhouseCoercer class.
+
+        Args:
+            mapping: Sink config or its field mappings
+            column_types: Column types overriding those of the mapping, keyed by
+                column name
+            max_examples: Number of failed values kept per column
+
+        Raises:
+            ValueError: If the sink has no mapping or a column type is not
+                supported
+        """
+        if isinstance(mapping, SinkConfig):
+            if not mapping.mapping:
+                raise ValueError("Sink config has no mapping")
+            mapping = mapping.mapping
+        self.mapping: List[SinkFieldMapping] = [
+            m
+            if isinstance(m, SinkFieldMapping)
+            else SinkFieldMapping.model_validate(m, context=ANY_COLUMN_TYPE_CONTEXT)
+            for m in mapping
+        ]
+        column_types = column_types or {}
+        self.column_types = [
+            column_types.get(m.column_name, str(m.column_type)) for m in self.mapping
+        ]
+        self._converters = [clickhouse_converter(t) for t in self.column_types]
+        self._vector_checks = [
+            _vector_check(parse_clickhouse_type(t)) for t in self.column_types
+        ]
+        self._getters = [field_getter(m.name) for m in self.mapping]
+        self.max_examples = max_examples
+        self.reset()
+
+    def convert_columns(
+        self, columns: Mapping[str, Sequence[Any]], length: int | None = None
+    ) -> Dict[str, List[Any]]:
+        """Convert a columnar batch.
+
+        Args:
+            columns: Mapping of field name to the values of that field, one per
+                row; arrays with a ``tolist`` method (e.g. NumPy arrays) are
+                accepted, and fields missing from the mapping are null
+            length: Number of rows, required when no mapped field is present in
+                ``columns``
+
+        Returns:
+            Dict[str, List[Any]]: Converted values keyed by column name
+        """
+        started = time.perf_counter()
+        if length is None:
+            present = [columns[m.name] for m in self.mapping if m.name in columns]
+            if not present:
+                raise ValueError("length is required without any mapped column")
+            length = len(present[0])
+
+        failed_rows: set = set()
+        converted: Dict[str, List[Any]] = {}
+        for i, m in enumerate(self.mapping):
+            stats = self._stats[i]
+            values = columns.get(m.name)
+            if values is None:
+                converted[m.column_name] = [None] * length
+                stats.values += length
+                stats.nulls += length
+                continue
+            stats.values += len(values)
+            failures = stats.failures
+            check = self._vector_checks[i]
+            output = check(values) if check is not None else None
+            if output is None:
+                if hasattr(values, "tolist"):
+                    values = values.tolist()
+                try:
+                    output = list(map(self._converters[i], values))
+                except (ValueError, TypeError, OverflowError):
+                    output = self._convert_slowly(i, values, failed_rows)
+            # Failed values are replaced by None as well
+            stats.nulls += output.count(None) - (stats.failures - failures)
+            converted[m.column_name] = output
+
+        self._rows += length
+        self._failed_rows += len(failed_rows)
+        self._elapsed += time.perf_counter() - started
+        return converted
+
+    def _convert_slowly(
+        self, i: int, values: Sequence[Any], failed_rows: set
+    ) -> List[Any]:
+        convert, stats = self._converters[i], self._stats[i]
+        output = []
+        for index, value in enumerate(values):
+            try:
+                output.append(convert(value))
+            except (ValueError, TypeError, OverflowError) as e:
+                kind = _failure_kind(e)
+                setattr(stats, kind, getattr(stats, kind) + 1)
+                if len(stats.examples) < self.max_examples:
+                    stats.examples.append(repr(value))
+                failed_rows.add(index)
+                output.append(None)
+        return output
+
+    def convert_events(self, events: Sequence[Mapping[str, Any]]) -> List[List[Any]]:
+        """Convert events to sink rows.
+
+        Args:
+            events: Event dicts
+
+        Returns:
+            List[List[Any]]: Rows with one value per mapped column, in mapping
+                order
+        """
+        columns = {
+            m.name: [get(event) for event in events]
+            for m, get in zip(self.mapping, self._getters)
+        }
+        converted = self.convert_columns(columns, length=len(events))
+        return [list(row) for row in zip(*converted.values())]
+
+    @property
+    def report(self) -> CoercionReport:
+        """Conversion outcome of the rows converted so far."""
+        return CoercionReport(
+            rows=self._rows,
+            failed_rows=self._failed_rows,
+            columns=[stats.model_copy(deep=True) for stats in self._stats],
+            elapsed=self._elapsed,
+        )
+
+    def reset(self) -> None:
+        """Clear the report."""
+        self._rows = 0
+        self._failed_rows = 0
+        self._elapsed = 0.0
+        self._stats = [
+            ColumnCoercionStats(
+                name=m.name, column_name=m.column_name, column_type=column_type
+            )
+            for m, column_type in zip(self.mapping, self.column_types)
+        ]
@@ -0,0 +1,208 @@
+"""Conversion of values to the Kafka data types used in pipeline schemas."""
+
+from __future__ import annotations
+
+import json
+import math
+from functools import lru_cache
+from typing import Any, Callable, Dict, Tuple
+
+from ..models.data_types import KafkaDataType
+
+INTEGER_BOUNDS: Dict[KafkaDataType, Tuple[int, int]] = {
+    KafkaDataType.INT8: (-(2**7), 2**7 - 1),
+    KafkaDataType.INT16: (-(2**15), 2**15 - 1),
+    KafkaDataType.INT32: (-(2**31), 2**31 - 1),
+    KafkaDataType.INT64: (-(2**63), 2**63 - 1),
+    KafkaDataType.INT: (-(2**63), 2**63 - 1),
+    KafkaDataType.UINT8: (0, 2**8 - 1),
+    KafkaDataType.UINT16: (0, 2**16 - 1),
+    KafkaDataType.UINT32: (0, 2**32 - 1),
+    KafkaDataType.UINT64: (0, 2**64 - 1),
+    KafkaDataType.UINT: (0, 2**64 - 1),
+}
+
+FLOAT32_MAX = 3.4028234663852886e38
+
+_TRUE = {"true", "1", "t", "yes"}
+_FALSE = {"false", "0", "f", "no", ""}
+
+
+class TruncationError(ValueError):
+    """A value can only be converted by losing part of it."""
+
+
+def integer_converter(name: str, low: int, high: int) -> Callable[[Any], Any]:
+    """
+    Get a function converting values to an integer type of the given range.
+
+    Integral floats and numeric strings are converted; other floats raise
+    ``TruncationError`` and values outside of ``[low, high]`` ``OverflowError``.
+
+    Args:
+        name: Name of the type, used in error messages
+        low: Smallest value of the type
+        high: Largest value of the type
+
+    Returns:
+        Callable[[Any], Any]: Conversion function passing ``None`` through
+    """
+
+    def convert(value: Any) -> Any:
+        if value.__class__ is not int:
+            if value is None:
+                return None
+            if isinstance(value, str):
+                text = value.strip()
+                try:
+                    value = int(text)
+                except ValueError:
+                    value = float(text)
+            if isinstance(value, bool):
+                value = int(value)
+            elif isinstance(value, float):
+                if math.isnan(value):
+                    raise ValueError(f"{value!r} is not a number")
+                if math.isinf(value):
+                    raise OverflowError(f"{value} is out of range for {name}")
+                if not value.is_integer():
+                    raise TruncationError(f"{value!r} would be truncated to {name}")
+                value = int(value)
+            elif isinstance(value, int):
+                value = int(value)
+            else:
+                raise TypeError(f"cannot convert {type(value).__name__} to {name}")
+        if value < low or value > high:
+            raise OverflowError(f"{value} is out of range for {name}")
+        return value
+
+    return convert
+
+
+def float_converter(name: str, limit: float = math.inf) -> Callable[[Any], Any]:
+    """
+    Get a function converting values to a float type.
+
+    Args:
+        name: Name of the type, used in error messages
+        limit: Largest finite magnitude of the type; larger finite values raise
+            ``OverflowError``
+
+    Returns:
+        Callable[[Any], Any]: Conversion function passing ``None`` through
+    """
+
+    def convert(value: Any) -> Any:
+        if value.__class__ is not float:
+            if value is None:
+                return None
+            if isinstance(value, (int, str)):
+                value = float(value)
+            elif isinstance(value, float):
+                value = float(value)
+            else:
+                raise TypeError(f"cannot convert {type(value).__name__} to {name}")
+        if abs(value) > limit and not math.isinf(value):
+            raise OverflowError(f"{value} is out of range for {name}")
+        return value
+
+    return convert
+
+
+def to_string(value: Any) -> Any:
+    """Convert a value to a string, dicts and lists to compact JSON."""
+    if value.__class__ is str or value is None:
+        return value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, bytes):
+        return value.decode()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(",", ":"))
+    return str(value)
+
+
+def _bool(value: Any) -> Any:
+    if value is True or value is False or value is None:
+        return value
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE:
+            return True
+        if lowered in _FALSE:
+            return False
+        raise ValueError(f"{value!r} is not a boolean")
+    if isinstance(value, (int, float)):
+        return value != 0
+    raise TypeError(f"cannot convert {type(value).__name__} to bool")
+
+
+def _bytes(value: Any) -> Any:
+    if value.__class__ is bytes or value is None:
+        return value
+    if isinstance(value, str):
+        return value.encode()
+    if isinstance(value, (bytearray, memoryview)):
+        return bytes(value)
+    raise TypeError(f"cannot convert {type(value).__name__} to bytes")
+
+
+def _array(value: Any) -> Any:
+    if value.__class__ is list or value is None:
+        return value
+    if isinstance(value, (tuple, list)):
+        return list(value)
+    if isinstance(value, str):
+        decoded = json.loads(value)
+        if isinstance(decoded, list):
+            return decoded
+    raise TypeError(f"cannot convert {type(value).__name__} to array")
+
+
+def _map(value: Any) -> Any:
+    if value.__class__ is dict or value is None:
+        return value
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, str):
+        decoded = json.loads(value)
+        if isinstance(decoded, dict):
+            return decoded
+    raise TypeError(f"cannot convert {type(value).__name__} to map")
+
+
+@lru_cache(maxsize=None)
+def kafka_coercer(data_type: KafkaDataType | str) -> Callable[[Any], Any]:
+    """
+    Get the function converting values to a Kafka data type.
+
+    The returned function returns values that already have the right Python type
+    unchanged, converts compatible values (e.g. ``"42"`` or ``42.0`` to an
+    integer type) and raises for values that cannot be represented, including
+    integers that overflow the width of the type (``OverflowError``) and floats
+    with a fractional part for integer types (``TruncationError``). ``None`` is
+    passed through.
+
+    Args:
+        data_type: Kafka data type, e.g. ``int32`` or ``string``
+
+    Returns:
+        Callable[[Any], Any]: Conversion function
+
+    Raises:
+        ValueError: If the data type is not a Kafka data type
+    """
+    data_type = KafkaDataType(data_type)
+    if data_type in INTEGER_BOUNDS:
+        return integer_converter(data_type.value, *INTEGER_BOUNDS[data_type])
+    if data_type == KafkaDataType.FLOAT32:
+        return float_converter(data_type.value, FLOAT32_MAX)
+    if data_type in (KafkaDataType.FLOAT, KafkaDataType.FLOAT64):
+        return float_converter(data_type.value)
+    return {
+        KafkaDataType.BOOL: _bool,
+        KafkaDataType.STRING: to_string,
+        KafkaDataType.BYTES: _bytes,
+        KafkaDataType.ARRAY: _array,
+        KafkaDataType.MAP: _map,
+    }[data_type]
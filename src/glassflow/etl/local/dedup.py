@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from pydantic import BaseModel
+
+from ..models import DedupTransform, DedupTransformConfig
+from .timeutils import field_getter, format_bytes, parse_duration, to_seconds
+
+# Approximate bookkeeping cost of a stored key on top of its own bytes
+ENTRY_OVERHEAD = 64
+
+
+class DedupStats(BaseModel):
+    """Counters of a local deduplication run."""
+
+    evaluated: int = 0
+    unique: int = 0
+    duplicates: int = 0
+    missing_keys: int = 0
+    expired: int = 0
+    evicted: int = 0
+    keys: int = 0
+    peak_keys: int = 0
+    key_bytes: int = 0
+    peak_bytes: int = 0
+
+    @property
+    def duplicate_rate(self) -> float:
+        """Fraction of evaluated events dropped as duplicates."""
+        return self.duplicates / self.evaluated if self.evaluated else 0.0
+
+    @property
+    def estimated_bytes(self) -> int:
+        """Estimated peak size of the deduplication state."""
+        return self.peak_bytes
+
+
+def _key_size(key: Any) -> int:
+    return (len(key) if isinstance(key, str) else len(str(key))) + ENTRY_OVERHEAD
+
+
+class DedupEngine:
+    """
+    Deduplicates events locally the way a dedup transform does.
+
+    The first event with a given key is kept and any other event with the same
+    key less than ``time_window`` later is dropped. Seen keys are stored in a hash
+    map with their first-seen time, for O(1) lookups, and grouped into time
+    buckets of a fraction of the window so expired keys are removed a bucket at a
+    time as time advances.
+
+    Event times come from ``time_field`` when given, so replayed traffic is
+    deduplicated against its original timeline, and from the wall clock at the
+    time each batch is processed otherwise, as in the pipeline.
+
+    With ``max_keys`` set, the oldest buckets are evicted early once the state
+    grows past that many keys. Duplicates of evicted keys are then missed, which
+    is reported through the ``evicted`` counter.
+    """
+
+    def __init__(
+        self,
+        config: DedupTransform | DedupTransformConfig,
+        time_field: str | None = None,
+        buckets: int = 16,
+        max_keys: int | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the DedupEngine class.
+
+        Args:
+            config: Dedup transform or its config
+            time_field: Field holding the event time, as epoch seconds, a
+                datetime or an ISO 8601 string
+            buckets: Number of expiry buckets per time window
+            max_keys: Maximum number of keys kept in the state
+            clock: Source of processing time when ``time_field`` is not set
+
+        Raises:
+            ValueError: If the time window is not a valid positive duration or
+                the bucket or key limits are not positive
+        """
+        if isinstance(config, DedupTransform):
+            config = config.config
+        if buckets < 1:
+            raise ValueError("buckets must be at least 1")
+        if max_keys is not None and max_keys < 1:
+            raise ValueError("max_keys must be at least 1")
+        self.window = parse_duration(config.time_window)
+        if self.window <= 0:
+            raise ValueError("time_window must be a positive duration")
+
+        self.key = config.key
+        self.time_field = time_field
+        self.max_keys = max_keys
+        self.clock = clock
+        self._get_key = field_getter(config.key)
+        self._get_time = field_getter(time_field) if time_field else None
+        self._bucket_width = self.window / buckets
+
+        self._seen: Dict[Any, float] = {}
+        self._buckets: Deque[Tuple[int, Set[Any]]] = deque()
+        self._bucket_end = -math.inf
+        self._expires_at = math.inf
+        self._watermark = -math.inf
+        self.stats = DedupStats()
+
+    def _timestamps(
+        self, events: Sequence[Mapping[str, Any]], timestamps: Iterable[Any] | None
+    ) -> Iterable[float]:
+        if timestamps is not None:
+            return [to_seconds(t) for t in timestamps]
+        if self._get_time is not None:
+            get_time = self._get_time
+            return [to_seconds(get_time(event)) for event in events]
+        now = self.clock()
+        return [now] * len(events)
+
+    def mask(
+        self,
+        events: Iterable[Mapping[str, Any]],
+        timestamps: Iterable[Any] | None = None,
+    ) -> List[bool]:
+        """Get whether each event of a batch is kept.
+
+        Args:
+            events: Event dicts, in arrival order
+            timestamps: Event times overriding ``time_field`` and the clock
+
+        Returns:
+            List[bool]: True for events kept, False for duplicates
+
+        Raises:
+            ValueError: If an event time cannot be interpreted
+        """
+        events = events if isinstance(events, Sequence) else list(events)
+        times = self._timestamps(events, timestamps)
+
+        seen = self._seen
+        get_key = self._get_key
+        window = self.window
+        max_keys = self.max_keys
+        stats = self.stats
+        watermark = self._watermark
+        bucket = self._buckets[-1][1] if self._buckets else None
+        bucket_end = self._bucket_end
+        expires_at = self._expires_at
+        key_bytes = stats.key_bytes
+        peak_keys = stats.peak_keys
+        peak_bytes = stats.peak_bytes
+        unique = duplicates = missing = expired = evicted = 0
+
+        mask = []
+        keep = mask.append
+        for event, ts in zip(events, times):
+            key = get_key(event)
+            if key is None:
+                missing += 1
+                keep(True)
+                continue
+            if ts > watermark:
+                watermark = ts
+                if ts >= expires_at:
+                    count, freed = self._expire(ts - window)
+                    expired += count
+                    key_bytes -= freed
+                    expires_at = self._expires_at
+                if ts >= bucket_end:
+                    bucket = self._new_bucket(ts)
+                    bucket_end = self._bucket_end
+                    expires_at = self._expires_at
+            first = seen.get(key)
+            if first is not None and ts - first < window:
+                duplicates += 1
+                keep(False)
+                continue
+            seen[key] = ts
+            # Late events go to the newest bucket, which only delays their expiry
+            bucket.add(key)
+            unique += 1
+            keep(True)
+            if first is None:
+                key_bytes += _key_size(key)
+                if len(seen) > peak_keys:
+                    peak_keys = len(seen)
+                if key_bytes > peak_bytes:
+                    peak_bytes = key_bytes
+                if max_keys is not None and len(seen) > max_keys:
+                    count, freed = self._evict()
+                    evicted += count
+                    key_bytes -= freed
+                    if not self._buckets:
+                        bucket = self._new_bucket(watermark)
+                        bucket_end = self._bucket_end
+                    expires_at = self._expires_at
+
+        self._watermark = watermark
+        stats.evaluated += len(mask)
+        stats.unique += unique
+        stats.duplicates += duplicates
+        stats.missing_keys += missing
+        stats.expired += expired
+        stats.evicted += evicted
+        stats.keys = len(seen)
+        stats.key_bytes = key_bytes
+        stats.peak_keys = peak_keys
+        stats.peak_bytes = peak_bytes
+        return mask
+
+    def apply(
+        self,
+        events: Iterable[Mapping[str, Any]],
+        timestamps: Iterable[Any] | None = None,
+    ) -> List[Mapping[str, Any]]:
+        """Deduplicate a batch of events, returning the events that are kept."""
+        events = events if isinstance(events, Sequence) else list(events)
+        return [
+            event for event, keep in zip(events, self.mask(events, timestamps)) if keep
+        ]
+
+    def _new_bucket(self, ts: float) -> Set[Any]:
+        width = self._bucket_width
+        index = int(ts // width)
+        keys: Set[Any] = set()
+        self._buckets.append((index, keys))
+        self._bucket_end = (index + 1) * width
+        self._update_expiry()
+        return keys
+
+    def _update_expiry(self) -> None:
+        if self._buckets:
+            oldest = self._buckets[0][0]
+            self._expires_at = (oldest + 1) * self._bucket_width + self.window
+        else:
+            self._expires_at = math.inf
+
+    def _expire(self, horizon: float) -> Tuple[int, int]:
+        dropped = freed = 0
+        width = self._bucket_width
+        while self._buckets and (self._buckets[0][0] + 1) * width <= horizon:
+            count, size = self._drop_bucket(horizon)
+            dropped += count
+            freed += size
+        self._update_expiry()
+        return dropped, freed
+
+    def _evict(self) -> Tuple[int, int]:
+        dropped = freed = 0
+        while self._buckets and len(self._seen) > self.max_keys:
+            index = self._buckets[0][0]
+            count, size = self._drop_bucket((index + 1) * self._bucket_width)
+            dropped += count
+            freed += size
+        if not self._buckets:
+            self._bucket_end = -math.inf
+        self._update_expiry()
+        return dropped, freed
+
+    def _drop_bucket(self, horizon: float) -> Tuple[int, int]:
+        _, keys = self._buckets.popleft()
+        seen = self._seen
+        dropped = freed = 0
+        for key in keys:
+            first = seen.get(key)
+            # Keys seen again since were moved to a newer bucket
+            if first is not None and first <= horizon:
+                del seen[key]
+                freed += _key_size(key)
+                dropped += 1
+        return dropped, freed
+
+    def recommended_storage(self, headroom: float = 2.0) -> str:
+        """
+        Suggest a ``TransformResourceEntry.storage`` size for the observed state.
+
+        Args:
+            headroom: Factor applied to the estimated peak state size
+
+        Returns:
+            str: Storage size, e.g. ``256Mi``
+        """
+        return format_bytes(max(self.stats.estimated_bytes * headroom, 2**20))
+
+    def reset(self) -> None:
+        """Clear the state and the counters."""
+        self._seen.clear()
+        self._buckets.clear()
+        self._bucket_end = -math.inf
+        self._expires_at = math.inf
+        self._watermark = -math.inf
+        self.stats = DedupStats()
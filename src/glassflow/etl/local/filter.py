@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Mapping, Sequence
+
+from pydantic import BaseModel
+
+from ..models import FilterTransform, FilterTransformConfig
+from .expressions import CompiledExpression, compile_expression
+
+_ERROR = object()
+
+
+class FilterStats(BaseModel):
+    """Counters of a local filter run."""
+
+    evaluated: int = 0
+    matched: int = 0
+    passed: int = 0
+    dropped: int = 0
+    errors: int = 0
+
+    @property
+    def selectivity(self) -> float:
+        """Fraction of evaluated events that passed the filter."""
+        return self.passed / self.evaluated if self.evaluated else 0.0
+
+    @property
+    def drop_rate(self) -> float:
+        """Fraction of evaluated events removed by the filter."""
+        return self.dropped / self.evaluated if self.evaluated else 0.0
+
+
+class FilterEngine:
+    """
+    Evaluates a filter transform locally over batches of events.
+
+    Events for which the expression evaluates to true are filtered out, as the
+    GlassFlow filter transform does; pass ``drop_matching=False`` to keep them
+    instead. Events the expression cannot be evaluated on are dropped and counted
+    as errors, since the pipeline would send them to the DLQ.
+    """
+
+    def __init__(
+        self,
+        config: FilterTransform | FilterTransformConfig | str,
+        drop_matching: bool = True,
+    ):
+        """Initialize the FilterEngine class.
+
+        Args:
+            config: Filter transform, its config or the expression itself
+            drop_matching: Whether events matching the expression are dropped
+
+        Raises:
+            InvalidExpressionError: If the expression is not valid
+        """
+        if isinstance(config, FilterTransform):
+            config = config.config
+        expression = config.expression if isinstance(config, BaseModel) else config
+        self.expression: CompiledExpression = compile_expression(expression)
+        self.drop_matching = drop_matching
+        self.stats = FilterStats()
+
+    def mask(self, events: Iterable[Mapping[str, Any]]) -> List[bool]:
+        """Get whether each event of a batch passes the filter."""
+        results, failures = self.expression.evaluate_batch(events, default=_ERROR)
+        return self._mask(results, failures)
+
+    def mask_columns(
+        self, columns: Mapping[str, Sequence[Any]], length: int | None = None
+    ) -> List[bool]:
+        """Get whether each event of a columnar batch passes the filter."""
+        results, failures = self.expression.evaluate_columns(
+            columns, length=length, default=_ERROR
+        )
+        return self._mask(results, failures)
+
+    def _mask(self, results: List[Any], failures: int) -> List[bool]:
+        drop_matching = self.drop_matching
+        if failures:
+            mask = [
+                r is not _ERROR and (not r if drop_matching else bool(r))
+                for r in results
+            ]
+        elif drop_matching:
+            mask = [not r for r in results]
+        else:
+            mask = [bool(r) for r in results]
+
+        passed = sum(mask)
+        stats = self.stats
+        stats.evaluated += len(results)
+        stats.errors += failures
+        stats.passed += passed
+        stats.dropped += len(results) - passed
+        matched = len(results) - passed - failures
+        stats.matched += matched if drop_matching else passed
+        return mask
+
+    def apply(self, events: Iterable[Mapping[str, Any]]) -> List[Mapping[str, Any]]:
+        """Filter a batch of events, returning the events that pass."""
+        events = events if isinstance(events, Sequence) else list(events)
+        return [event for event, keep in zip(events, self.mask(events)) if keep]
+
+    def apply_columns(
+        self, columns: Mapping[str, Sequence[Any]], length: int | None = None
+    ) -> Dict[str, List[Any]]:
+        """Filter a columnar batch, returning the columns of the events that pass."""
+        mask = self.mask_columns(columns, length=length)
+        return {
+            name: [value for value, keep in zip(values, mask) if keep]
+            for name, values in columns.items()
+        }
+
+    def reset(self) -> None:
+        """Reset the counters."""
+        self.stats = FilterStats()
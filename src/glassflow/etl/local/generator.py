@@ -0,0 +1,467 @@
+"""Synthetic events matching the schema of a Kafka source."""
+
+from __future__ import annotations
+
+import itertools
+import math
+import os
+import random
+import time
+from collections import deque
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Mapping, Sequence
+
+from pydantic import BaseModel
+
+from .. import jsonlib
+from ..models import KafkaField, KafkaSource
+from ..models.data_types import KafkaDataType
+from .coercion import INTEGER_BOUNDS
+
+_FLOAT_TYPES = {KafkaDataType.FLOAT, KafkaDataType.FLOAT32, KafkaDataType.FLOAT64}
+
+Column = Callable[[random.Random, int], List[Any]]
+
+
+def _positions(rng: random.Random, rate: float, n: int) -> Iterator[int]:
+    """Indices below ``n`` each picked with probability ``rate``.
+
+    Gaps between picked indices are drawn from a geometric distribution, so the
+    cost is proportional to the number of picked indices rather than to ``n``.
+    """
+    if rate <= 0:
+        return
+    if rate >= 1:
+        yield from range(n)
+        return
+    log_q = math.log(1.0 - rate)
+    i = -1
+    while True:
+        i += int(math.log(1.0 - rng.random()) / log_q) + 1
+        if i >= n:
+            return
+        yield i
+
+
+def _random_column(data_type: KafkaDataType) -> Column:
+    if data_type in INTEGER_BOUNDS:
+        low, high = INTEGER_BOUNDS[data_type]
+        bits = (high - low).bit_length()
+        return lambda rng, n: [low + rng.getrandbits(bits) for _ in range(n)]
+    if data_type in _FLOAT_TYPES:
+        return lambda rng, n: [rng.random() * 1000.0 for _ in range(n)]
+    if data_type == KafkaDataType.BOOL:
+        return lambda rng, n: [rng.getrandbits(1) == 1 for _ in range(n)]
+    if data_type == KafkaDataType.ARRAY:
+        return lambda rng, n: [
+            list(rng.randbytes(rng.getrandbits(2))) for _ in range(n)
+        ]
+    if data_type == KafkaDataType.MAP:
+        return lambda rng, n: [
+            {"key": format(rng.getrandbits(16), "x")} for _ in range(n)
+        ]
+    return lambda rng, n: [format(rng.getrandbits(40), "010x") for _ in range(n)]
+
+
+def _vector_column(np: Any, data_type: KafkaDataType) -> Callable | None:
+    """Column of the given type drawn from a NumPy generator, if NumPy can draw it."""
+    if data_type in INTEGER_BOUNDS:
+        low, high = INTEGER_BOUNDS[data_type]
+        dtype = np.uint64 if high > 2**63 - 1 else np.int64
+        return lambda rng, n: rng.integers(
+            low, high, size=n, dtype=dtype, endpoint=True
+        ).tolist()
+    if data_type in _FLOAT_TYPES:
+        return lambda rng, n: (rng.random(n) * 1000.0).tolist()
+    if data_type == KafkaDataType.BOOL:
+        return lambda rng, n: (rng.random(n) < 0.5).tolist()
+    return None
+
+
+def _bad_values(data_type: KafkaDataType) -> Sequence[Any]:
+    """Values a field of the given type can be corrupted with."""
+    if data_type in INTEGER_BOUNDS:
+        return (INTEGER_BOUNDS[data_type][1] + 1, "not-a-number", 1.5)
+    if data_type == KafkaDataType.FLOAT32:
+        return (1e39, "not-a-number")
+    if data_type in _FLOAT_TYPES:
+        return ("not-a-number", True)
+    if data_type == KafkaDataType.BOOL:
+        return ("maybe", 2)
+    if data_type == KafkaDataType.ARRAY:
+        return ("not-an-array", {"key": 1})
+    if data_type == KafkaDataType.MAP:
+        return ("not-a-map", [1])
+    return (12345, ["not", "a", "string"])
+
+
+def _key_value(data_type: KafkaDataType, name: str, key: int) -> Any:
+    if data_type in INTEGER_BOUNDS:
+        return min(key, INTEGER_BOUNDS[data_type][1])
+    if data_type in _FLOAT_TYPES:
+        return float(key)
+    return f"{name}-{key}"
+
+
+@lru_cache(maxsize=4096)
+def _iso_second(second: int) -> str:
+    return datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _iso(t: float) -> str:
+    # Consecutive events share their second, so only its formatting is cached
+    second = math.floor(t)
+    return f"{_iso_second(second)}.{int((t - second) * 1e6):06d}+00:00"
+
+
+def _time_value(data_type: KafkaDataType) -> Callable[[float], Any]:
+    if data_type in INTEGER_BOUNDS:
+        return int
+    if data_type in _FLOAT_TYPES:
+        return float
+    return _iso
+
+
+class GeneratorStats(BaseModel):
+    """Counters of generated events."""
+
+    events: int = 0
+    duplicates: int = 0
+    nulls: int = 0
+    bad_values: int = 0
+    late: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Generated events per second."""
+        return self.events / self.elapsed if self.elapsed else 0.0
+
+
+class EventGenerator:
+    """
+    Generates synthetic events matching the ``schema_fields`` of a Kafka source.
+
+    Events are generated a batch at a time, one column per schema field, and can
+    be shaped to exercise the pipeline:
+
+    * ``dedup_key`` values are unique, except for ``duplicate_rate`` of the
+      events, which are resends of one of the last ``duplicate_window`` events
+    * ``key_cardinality`` fields, such as join keys, take one of that many values
+      with Zipf-distributed frequencies of exponent ``key_skew``
+    * ``null_rate`` and ``bad_value_rate`` of the values of every field but the
+      time field are replaced by null or by a value that does not fit the field
+      type, such as an integer overflowing its width or a value of another type
+    * ``time_field`` holds event times advancing at ``rate`` events per second
+      from ``start_time``; ``late_rate`` of the events are moved up to
+      ``max_lateness`` seconds back to produce disorder
+
+    Generation is deterministic for a given ``seed``.
+
+    Values are drawn with the standard ``random`` module in pure-Python loops and
+    NumPy is not used. With ``vectorized=True``, integer, float and boolean
+    columns are drawn from a NumPy generator instead, which requires the
+    ``glassflow[numpy]`` extra and yields different, still seeded, values.
+    """
+
+    def __init__(
+        self,
+        schema: KafkaSource | Sequence[KafkaField | Mapping[str, str]],
+        seed: int | None = None,
+        dedup_key: str | None = None,
+        duplicate_rate: float = 0.0,
+        duplicate_window: int = 1000,
+        key_cardinality: Mapping[str, int] | None = None,
+        key_skew: float = 1.0,
+        null_rate: float = 0.0,
+        bad_value_rate: float = 0.0,
+        time_field: str | None = None,
+        start_time: float | None = None,
+        rate: float = 1000.0,
+        late_rate: float = 0.0,
+        max_lateness: float = 0.0,
+        vectorized: bool = False,
+    ):
+        """Initialize the EventGenerator class.
+
+        Args:
+            schema: Kafka source or its schema fields
+            seed: Seed of the random generator
+            dedup_key: Field holding a unique event ID
+            duplicate_rate: Fraction of the events that are duplicates
+            duplicate_window: Number of recent events duplicates are drawn from
+            key_cardinality: Number of distinct values of skewed key fields
+            key_skew: Zipf exponent of the key frequencies, 0 for uniform keys
+            null_rate: Fraction of the values replaced by null
+            bad_value_rate: Fraction of the values replaced by invalid values
+            time_field: Field holding the event time
+            start_time: Epoch seconds of the first event, now by default
+            rate: Events per second of event time
+            late_rate: Fraction of the events arriving late
+            max_lateness: Maximum lateness of late events in seconds
+            vectorized: Draw numeric and boolean columns with NumPy
+
+        Raises:
+            ValueError: If a field is not part of the schema or a rate is not
+                between 0 and 1
+            ImportError: If ``vectorized`` is set and NumPy is not installed
+        """
+        if isinstance(schema, KafkaSource):
+            if schema.schema_fields is None:
+                raise ValueError(f"Source '{schema.source_id}' has no schema_fields")
+            schema = schema.schema_fields
+        self.fields: List[KafkaField] = [
+            f if isinstance(f, KafkaField) else KafkaField(**f) for f in schema
+        ]
+        types = {f.name: f.type for f in self.fields}
+        key_cardinality = dict(key_cardinality or {})
+        for name in (dedup_key, time_field, *key_cardinality):
+            if name is not None and name not in types:
+                raise ValueError(f"Field '{name}' is not part of the schema")
+        for name, value in (
+            ("duplicate_rate", duplicate_rate),
+            ("null_rate", null_rate),
+            ("bad_value_rate", bad_value_rate),
+            ("late_rate", late_rate),
+        ):
+            if not 0 <= value <= 1:
+                raise ValueError(f"{name} must be between 0 and 1")
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if any(cardinality < 1 for cardinality in key_cardinality.values()):
+            raise ValueError("key cardinality must be at least 1")
+
+        self.seed = seed
+        self.dedup_key = dedup_key
+        self.duplicate_rate = duplicate_rate
+        self.duplicate_window = max(1, duplicate_window)
+        self.null_rate = null_rate
+        self.bad_value_rate = bad_value_rate
+        self.time_field = time_field
+        self.start_time = time.time() if start_time is None else start_time
+        self.rate = rate
+        self.late_rate = late_rate
+        self.max_lateness = max_lateness
+        self._np = _import_numpy() if vectorized else None
+
+        self._names = [f.name for f in self.fields]
+        self._columns: List[Callable[[int, int], List[Any]]] = []
+        self._bad = [_bad_values(f.type) for f in self.fields]
+        for f in self.fields:
+            if f.name == time_field:
+                self._columns.append(self._time_column(f.type))
+            elif f.name == dedup_key:
+                self._columns.append(self._id_column(f.type))
+            elif f.name in key_cardinality:
+                cardinality = key_cardinality[f.name]
+                self._columns.append(
+                    self._key_column(f.type, f.name, cardinality, key_skew)
+                )
+            else:
+                self._columns.append(self._random_column(f.type))
+        self.reset()
+
+    def _random_column(self, data_type: KafkaDataType) -> Callable:
+        if self._np is not None:
+            vector = _vector_column(self._np, data_type)
+            if vector is not None:
+                return lambda offset, n: vector(self._np_rng, n)
+        column = _random_column(data_type)
+        return lambda offset, n: column(self._rng, n)
+
+    def _key_column(
+        self, data_type: KafkaDataType, name: str, cardinality: int, skew: float
+    ) -> Callable:
+        values = [_key_value(data_type, name, k) for k in range(1, cardinality + 1)]
+        weights = [1.0 / k**skew for k in range(1, cardinality + 1)]
+        cum_weights = list(itertools.accumulate(weights))
+        return lambda offset, n: self._rng.choices(values, cum_weights=cum_weights, k=n)
+
+    def _id_column(self, data_type: KafkaDataType) -> Callable:
+        if data_type in INTEGER_BOUNDS or data_type in _FLOAT_TYPES:
+            return lambda offset, n: list(range(offset, offset + n))
+        return lambda offset, n: [str(i) for i in range(offset, offset + n)]
+
+    def _time_column(self, data_type: KafkaDataType) -> Callable:
+        convert = _time_value(data_type)
+
+        def column(offset: int, n: int) -> List[Any]:
+            start, interval = self.start_time, 1.0 / self.rate
+            times = [start + (offset + i) * interval for i in range(n)]
+            rng = self._rng
+            for i in _positions(rng, self.late_rate, n):
+                times[i] -= rng.random() * self.max_lateness
+                self._late += 1
+            return list(map(convert, times))
+
+        return column
+
+    def batch(self, size: int) -> List[Dict[str, Any]]:
+        """Generate the next batch of events.
+
+        Args:
+            size: Number of events
+
+        Returns:
+            List[Dict[str, Any]]: Events, one key per schema field
+        """
+        started = time.perf_counter()
+        rng, offset = self._rng, self._offset
+        columns = []
+        for i, (name, column) in enumerate(zip(self._names, self._columns)):
+            values = column(offset, size)
+            if name != self.time_field:
+                for index in _positions(rng, self.null_rate, size):
+                    values[index] = None
+                    self._nulls += 1
+                bad = self._bad[i]
+                for index in _positions(rng, self.bad_value_rate, size):
+                    values[index] = rng.choice(bad)
+                    self._bad_values += 1
+            columns.append(values)
+
+        names = self._names
+        events = [dict(zip(names, row)) for row in zip(*columns)]
+        if not columns:
+            events = [{} for _ in range(size)]
+
+        recent, window = self._recent, self.duplicate_window
+        for index in _positions(rng, self.duplicate_rate, size):
+            if index:
+                source = events[index - 1 - rng.randrange(min(index, window))]
+            elif recent:
+                source = recent[rng.randrange(len(recent))]
+            else:
+                continue
+            events[index] = dict(source)
+            self._duplicates += 1
+        recent.extend(events[-window:])
+
+        self._offset += size
+        self._elapsed += time.perf_counter() - started
+        return events
+
+    def batches(self, count: int, batch_size: int = 10000) -> Iterator[List[Dict]]:
+        """Generate events in batches.
+
+        Args:
+            count: Total number of events
+            batch_size: Maximum number of events per batch
+        """
+        remaining = count
+        while remaining > 0:
+            size = min(batch_size, remaining)
+            yield self.batch(size)
+            remaining -= size
+
+    def events(self, count: int, batch_size: int = 10000) -> Iterator[Dict[str, Any]]:
+        """Generate events one at a time, generating them in batches."""
+        for batch in self.batches(count, batch_size):
+            yield from batch
+
+    def arrow_batches(self, count: int, batch_size: int = 10000) -> Iterator[Any]:
+        """Generate events as ``pyarrow.RecordBatch`` objects.
+
+        Bad values of another type than their field cannot be represented in an
+        Arrow column, so ``bad_value_rate`` should be 0.
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        pa = _import_pyarrow()
+        for batch in self.batches(count, batch_size):
+            yield pa.RecordBatch.from_pylist(batch)
+
+    def write(
+        self, path: str | os.PathLike, count: int, batch_size: int = 10000
+    ) -> int:
+        """Write generated events to a file.
+
+        Files ending in ``.parquet`` are written with ``pyarrow``; any other file
+        is written as JSON lines.
+
+        Args:
+            path: Path of the file
+            count: Number of events
+            batch_size: Number of events generated and written at a time
+
+        Returns:
+            int: Number of events written
+
+        Raises:
+            ImportError: If a Parquet file is requested and pyarrow is not
+                installed
+        """
+        path = Path(path)
+        written = 0
+        if path.suffix == ".parquet":
+            pa = _import_pyarrow()
+            import pyarrow.parquet as pq
+
+            writer = None
+            try:
+                for batch in self.batches(count, batch_size):
+                    table = pa.Table.from_pylist(batch)
+                    if writer is None:
+                        writer = pq.ParquetWriter(path, table.schema)
+                    writer.write_table(table)
+                    written += len(batch)
+            finally:
+                if writer is not None:
+                    writer.close()
+            return written
+
+        dumps = jsonlib.dumps
+        with open(path, "wb") as f:
+            for batch in self.batches(count, batch_size):
+                f.write(b"\n".join(map(dumps, batch)))
+                f.write(b"\n")
+                written += len(batch)
+        return written
+
+    @property
+    def stats(self) -> GeneratorStats:
+        """Counters of the events generated so far."""
+        return GeneratorStats(
+            events=self._offset,
+            duplicates=self._duplicates,
+            nulls=self._nulls,
+            bad_values=self._bad_values,
+            late=self._late,
+            elapsed=self._elapsed,
+        )
+
+    def reset(self) -> None:
+        """Restart generation from the first event, with the same seed."""
+        self._rng = random.Random(self.seed)
+        if self._np is not None:
+            self._np_rng = self._np.random.default_rng(self.seed)
+        self._offset = 0
+        self._recent: Deque[Dict[str, Any]] = deque(maxlen=self.duplicate_window)
+        self._duplicates = 0
+        self._nulls = 0
+        self._bad_values = 0
+        self._late = 0
+        self._elapsed = 0.0
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Generating Arrow data requires pyarrow: pip install pyarrow"
+        ) from e
+    return pyarrow
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "Vectorized generation requires numpy: pip install glassflow[numpy]"
+        ) from e
+    return numpy
@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from pydantic import BaseModel, Field
+
+from ..models import JoinConfig, JoinSourceConfig
+from .timeutils import field_getter, parse_duration, to_seconds
+
+
+class JoinSideStats(BaseModel):
+    """Counters of one side of a local join."""
+
+    events: int = 0
+    matched: int = 0
+    missing_keys: int = 0
+    expired: int = 0
+    expired_unmatched: int = 0
+    buffered: int = 0
+    peak_buffered: int = 0
+    peak_keys: int = 0
+
+    @property
+    def match_rate(self) -> float:
+        """Fraction of the events of this side joined with at least one event."""
+        return self.matched / self.events if self.events else 0.0
+
+
+class JoinStats(BaseModel):
+    """Counters of a local join run."""
+
+    left: JoinSideStats = Field(default_factory=JoinSideStats)
+    right: JoinSideStats = Field(default_factory=JoinSideStats)
+    joined: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def events(self) -> int:
+        """Number of events received on both sides."""
+        return self.left.events + self.right.events
+
+    @property
+    def match_rate(self) -> float:
+        """Fraction of the received events joined with at least one event."""
+        matched = self.left.matched + self.right.matched
+        return matched / self.events if self.events else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Received events per second spent in the engine."""
+        return self.events / self.elapsed if self.elapsed else 0.0
+
+
+class _Side:
+    """Keyed window buffer of one join source."""
+
+    __slots__ = (
+        "source_id",
+        "window",
+        "get_key",
+        "get_time",
+        "projection",
+        "buffer",
+        "order",
+        "events",
+        "matched",
+        "missing_keys",
+        "expired",
+        "expired_unmatched",
+        "peak_buffered",
+        "peak_keys",
+    )
+
+    def __init__(
+        self,
+        config: JoinSourceConfig,
+        time_field: Optional[str],
+        projection: List[Tuple[Callable[[Mapping[str, Any]], Any], str]],
+    ):
+        self.source_id = config.source_id
+        self.window = parse_duration(config.time_window)
+        if self.window <= 0:
+            raise ValueError(
+                f"time_window of join source '{config.source_id}' must be a "
+                "positive duration"
+            )
+        self.get_key = field_getter(config.key)
+        self.get_time = field_getter(time_field) if time_field else None
+        self.projection = projection
+        # key -> buffered entries, each [event time, event, matched]
+        self.buffer: Dict[Any, Deque[List[Any]]] = {}
+        # (event time, key) in arrival order, for eviction
+        self.order: Deque[Tuple[float, Any]] = deque()
+        self.reset()
+
+    def reset(self) -> None:
+        self.buffer.clear()
+        self.order.clear()
+        self.events = self.matched = self.missing_keys = 0
+        self.expired = self.expired_unmatched = 0
+        self.peak_buffered = self.peak_keys = 0
+
+    def snapshot(self) -> JoinSideStats:
+        return JoinSideStats(
+            events=self.events,
+            matched=self.matched,
+            missing_keys=self.missing_keys,
+            expired=self.expired,
+            expired_unmatched=self.expired_unmatched,
+            buffered=len(self.order),
+            peak_buffered=self.peak_buffered,
+            peak_keys=self.peak_keys,
+        )
+
+    def expire(self, watermark: float) -> None:
+        horizon = watermark - self.window
+        order, buffer = self.order, self.buffer
+        if not order or order[0][0] > horizon:
+            return
+        expired = unmatched = 0
+        while order and order[0][0] <= horizon:
+            _, key = order.popleft()
+            entries = buffer[key]
+            entry = entries.popleft()
+            expired += 1
+            if not entry[2]:
+                unmatched += 1
+            if not entries:
+                del buffer[key]
+        self.expired += expired
+        self.expired_unmatched += unmatched
+
+    def project(self, event: Mapping[str, Any], output: Dict[str, Any]) -> None:
+        for get, output_name in self.projection:
+            output[output_name] = get(event)
+
+
+class JoinEngine:
+    """
+    Joins two event streams locally the way a temporal join does.
+
+    Each side keeps the events it received in a buffer keyed by its join key for
+    its ``time_window``. An incoming event is joined with every buffered event
+    of the other side that has the same key and is still within that side's
+    window, then buffered itself. Joined events contain the fields selected by
+    ``output_fields``, renamed to their ``output_name``.
+
+    Event times come from ``time_field`` when given, so replayed traffic is
+    joined against its original timeline, and from the wall clock at the time
+    each batch is processed otherwise.
+    """
+
+    def __init__(
+        self,
+        config: JoinConfig,
+        time_field: str | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the JoinEngine class.
+
+        Args:
+            config: Join config
+            time_field: Field holding the event time on both sides, as epoch
+                seconds, a datetime or an ISO 8601 string
+            clock: Source of processing time when ``time_field`` is not set
+
+        Raises:
+            ValueError: If the join is not enabled, an output field does not
+                belong to a joined source or a time window is not valid
+        """
+        if not config.enabled:
+            raise ValueError("join is not enabled")
+        left, right = config.left_source, config.right_source
+        if left.source_id == right.source_id:
+            raise ValueError("left and right sources of a join must be different")
+
+        projections: Dict[str, List[Tuple[Callable, str]]] = {
+            left.source_id: [],
+            right.source_id: [],
+        }
+        for field in config.output_fields:
+            if field.source_id not in projections:
+                raise ValueError(
+                    f"Output field '{field.name}' references source "
+                    f"'{field.source_id}', which is not part of the join"
+                )
+            projections[field.source_id].append(
+                (field_getter(field.name), field.output_name or field.name)
+            )
+
+        self.config = config
+        self.clock = clock
+        self._watermark = -math.inf
+        self._joined = 0
+        self._elapsed = 0.0
+        self.left = _Side(left, time_field, projections[left.source_id])
+        self.right = _Side(right, time_field, projections[right.source_id])
+        self._sides = {
+            left.source_id: (self.left, self.right),
+            right.source_id: (self.right, self.left),
+        }
+
+    def process(
+        self,
+        source_id: str,
+        events: Iterable[Mapping[str, Any]],
+        timestamps: Iterable[Any] | None = None,
+    ) -> List[Dict[str, Any]]:
+        """Process a batch of events of one side of the join.
+
+        Args:
+            source_id: Source the events come from
+            events: Event dicts, in arrival order
+            timestamps: Event times overriding ``time_field`` and the clock
+
+        Returns:
+            List[Dict[str, Any]]: Joined events produced by the batch
+
+        Raises:
+            ValueError: If the source is not part of the join or an event time
+                cannot be interpreted
+        """
+        try:
+            side, other = self._sides[source_id]
+        except KeyError:
+            raise ValueError(f"Source '{source_id}' is not part of the join") from None
+
+        started = time.perf_counter()
+        events = events if isinstance(events, Sequence) else list(events)
+        if timestamps is not None:
+            times = [to_seconds(t) for t in timestamps]
+        elif side.get_time is not None:
+            get_time = side.get_time
+            times = [to_seconds(get_time(event)) for event in events]
+        else:
+            times = [self.clock()] * len(events)
+
+        left_first = side is self.left
+        get_key = side.get_key
+        buffer, order = side.buffer, side.order
+        other_buffer, other_window = other.buffer, other.window
+        matched_events = matched_entries = missing = 0
+        peak_buffered, peak_keys = side.peak_buffered, side.peak_keys
+        outputs = []
+        emit = outputs.append
+        for event, ts in zip(events, times):
+            key = get_key(event)
+            if key is None:
+                missing += 1
+                continue
+            if ts > self._watermark:
+                self._watermark = ts
+                self.left.expire(ts)
+                self.right.expire(ts)
+
+            matched = False
+            for entry in other_buffer.get(key, ()):
+                if abs(ts - entry[0]) >= other_window:
+                    continue
+                output: Dict[str, Any] = {}
+                if left_first:
+                    side.project(event, output)
+                    other.project(entry[1], output)
+                else:
+                    other.project(entry[1], output)
+                    side.project(event, output)
+                emit(output)
+                if not entry[2]:
+                    entry[2] = True
+                    matched_entries += 1
+                matched = True
+            if matched:
+                matched_events += 1
+
+            entries = buffer.get(key)
+            if entries is None:
+                entries = buffer[key] = deque()
+            entries.append([ts, event, matched])
+            order.append((ts, key))
+            if len(order) > peak_buffered:
+                peak_buffered = len(order)
+            if len(buffer) > peak_keys:
+                peak_keys = len(buffer)
+
+        side.events += len(events)
+        side.matched += matched_events
+        side.missing_keys += missing
+        other.matched += matched_entries
+        side.peak_buffered = peak_buffered
+        side.peak_keys = peak_keys
+        self._joined += len(outputs)
+        self._elapsed += time.perf_counter() - started
+        return outputs
+
+    def process_stream(
+        self, stream: Iterable[Tuple[str, Mapping[str, Any]]], batch_size: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """Process interleaved events of both sides in arrival order.
+
+        Args:
+            stream: Pairs of source ID and event
+            batch_size: Maximum number of consecutive events of the same source
+                processed together
+
+        Returns:
+            List[Dict[str, Any]]: Joined events
+        """
+        outputs: List[Dict[str, Any]] = []
+        current: Optional[str] = None
+        pending: List[Mapping[str, Any]] = []
+        for source_id, event in stream:
+            if source_id != current or len(pending) >= batch_size:
+                if pending:
+                    outputs.extend(self.process(current, pending))
+                current, pending = source_id, []
+            pending.append(event)
+        if pending:
+            outputs.extend(self.process(current, pending))
+        return outputs
+
+    @property
+    def stats(self) -> JoinStats:
+        """Counters of the events processed so far."""
+        return JoinStats(
+            left=self.left.snapshot(),
+            right=self.right.snapshot(),
+            joined=self._joined,
+            elapsed=self._elapsed,
+        )
+
+    def reset(self) -> None:
+        """Clear the buffers and the counters."""
+        self._watermark = -math.inf
+        self._joined = 0
+        self._elapsed = 0.0
+        self.left.reset()
+        self.right.reset()
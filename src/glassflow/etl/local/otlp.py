@@ -0,0 +1,806 @@
+"""Offline decoding and flattening of OTLP logs, metrics and traces."""
+
+from __future__ import annotations
+
+import base64
+import os
+import struct
+import time
+from operator import methodcaller
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Union
+
+from pydantic import BaseModel, Field
+
+from .. import jsonlib
+from ..models import OTLPSource
+from ..models.source import SourceType
+
+OTLPInput = Union[str, os.PathLike, Iterable[Union[Mapping[str, Any], bytes]]]
+
+_SIGNALS = {
+    "logs": SourceType.OTLP_LOGS,
+    "metrics": SourceType.OTLP_METRICS,
+    "traces": SourceType.OTLP_TRACES,
+}
+
+_PROTOBUF_SUFFIXES = {".pb", ".binpb", ".proto", ".protobuf"}
+
+# Protobuf schemas of the OTLP messages, as field number -> (JSON name, kind,
+# repeated). Messages are decoded to the dicts of the OTLP/JSON encoding, so
+# both encodings share the flattening code.
+_Schema = Dict[int, tuple]
+
+_ANY_VALUE: _Schema = {}
+_KEY_VALUE: _Schema = {1: ("key", "string", False), 2: ("value", _ANY_VALUE, False)}
+_ARRAY_VALUE: _Schema = {1: ("values", _ANY_VALUE, True)}
+_KV_LIST: _Schema = {1: ("values", _KEY_VALUE, True)}
+_ANY_VALUE.update(
+    {
+        1: ("stringValue", "string", False),
+        2: ("boolValue", "bool", False),
+        3: ("intValue", "int64", False),
+        4: ("doubleValue", "double", False),
+        5: ("arrayValue", _ARRAY_VALUE, False),
+        6: ("kvlistValue", _KV_LIST, False),
+        7: ("bytesValue", "base64", False),
+    }
+)
+_ATTRIBUTES = ("attributes", _KEY_VALUE, True)
+_RESOURCE: _Schema = {1: _ATTRIBUTES, 2: ("droppedAttributesCount", "uint", False)}
+_SCOPE: _Schema = {
+    1: ("name", "string", False),
+    2: ("version", "string", False),
+    3: _ATTRIBUTES,
+    4: ("droppedAttributesCount", "uint", False),
+}
+
+_LOG_RECORD: _Schema = {
+    1: ("timeUnixNano", "fixed64", False),
+    11: ("observedTimeUnixNano", "fixed64", False),
+    2: ("severityNumber", "uint", False),
+    3: ("severityText", "string", False),
+    5: ("body", _ANY_VALUE, False),
+    6: _ATTRIBUTES,
+    7: ("droppedAttributesCount", "uint", False),
+    8: ("flags", "fixed32", False),
+    9: ("traceId", "hex", False),
+    10: ("spanId", "hex", False),
+    12: ("eventName", "string", False),
+}
+
+_SPAN_EVENT: _Schema = {
+    1: ("timeUnixNano", "fixed64", False),
+    2: ("name", "string", False),
+    3: _ATTRIBUTES,
+    4: ("droppedAttributesCount", "uint", False),
+}
+_SPAN_LINK: _Schema = {
+    1: ("traceId", "hex", False),
+    2: ("spanId", "hex", False),
+    3: ("traceState", "string", False),
+    4: _ATTRIBUTES,
+    5: ("droppedAttributesCount", "uint", False),
+    6: ("flags", "fixed32", False),
+}
+_SPAN: _Schema = {
+    1: ("traceId", "hex", False),
+    2: ("spanId", "hex", False),
+    3: ("traceState", "string", False),
+    4: ("parentSpanId", "hex", False),
+    16: ("flags", "fixed32", False),
+    5: ("name", "string", False),
+    6: ("kind", "uint", False),
+    7: ("startTimeUnixNano", "fixed64", False),
+    8: ("endTimeUnixNano", "fixed64", False),
+    9: _ATTRIBUTES,
+    10: ("droppedAttributesCount", "uint", False),
+    11: ("events", _SPAN_EVENT, True),
+    12: ("droppedEventsCount", "uint", False),
+    13: ("links", _SPAN_LINK, True),
+    14: ("droppedLinksCount", "uint", False),
+    15: (
+        "status",
+        {2: ("message", "string", False), 3: ("code", "uint", False)},
+        False,
+    ),
+}
+
+_NUMBER_POINT: _Schema = {
+    7: _ATTRIBUTES,
+    2: ("startTimeUnixNano", "fixed64", False),
+    3: ("timeUnixNano", "fixed64", False),
+    4: ("asDouble", "double", False),
+    6: ("asInt", "sfixed64", False),
+    8: ("flags", "uint", False),
+}
+_HISTOGRAM_POINT: _Schema = {
+    9: _ATTRIBUTES,
+    2: ("startTimeUnixNano", "fixed64", False),
+    3: ("timeUnixNano", "fixed64", False),
+    4: ("count", "fixed64", False),
+    5: ("sum", "double", False),
+    6: ("bucketCounts", "fixed64", True),
+    7: ("explicitBounds", "double", True),
+    10: ("flags", "uint", False),
+    11: ("min", "double", False),
+    12: ("max", "double", False),
+}
+_BUCKETS: _Schema = {
+    1: ("offset", "sint", False),
+    2: ("bucketCounts", "uint", True),
+}
+_EXPONENTIAL_POINT: _Schema = {
+    1: _ATTRIBUTES,
+    2: ("startTimeUnixNano", "fixed64", False),
+    3: ("timeUnixNano", "fixed64", False),
+    4: ("count", "fixed64", False),
+    5: ("sum", "double", False),
+    6: ("scale", "sint", False),
+    7: ("zeroCount", "fixed64", False),
+    8: ("positive", _BUCKETS, False),
+    9: ("negative", _BUCKETS, False),
+    10: ("flags", "uint", False),
+    12: ("min", "double", False),
+    13: ("max", "double", False),
+    14: ("zeroThreshold", "double", False),
+}
+_SUMMARY_POINT: _Schema = {
+    7: _ATTRIBUTES,
+    2: ("startTimeUnixNano", "fixed64", False),
+    3: ("timeUnixNano", "fixed64", False),
+    4: ("count", "fixed64", False),
+    5: ("sum", "double", False),
+    6: (
+        "quantileValues",
+        {1: ("quantile", "double", False), 2: ("value", "double", False)},
+        True,
+    ),
+    8: ("flags", "uint", False),
+}
+
+
+def _aggregation(points: _Schema, monotonic: bool = False) -> _Schema:
+    schema = {
+        1: ("dataPoints", points, True),
+        2: ("aggregationTemporality", "uint", False),
+    }
+    if monotonic:
+        schema[3] = ("isMonotonic", "bool", False)
+    return schema
+
+
+_METRIC: _Schema = {
+    1: ("name", "string", False),
+    2: ("description", "string", False),
+    3: ("unit", "string", False),
+    5: ("gauge", {1: ("dataPoints", _NUMBER_POINT, True)}, False),
+    7: ("sum", _aggregation(_NUMBER_POINT, monotonic=True), False),
+    9: ("histogram", _aggregation(_HISTOGRAM_POINT), False),
+    10: ("exponentialHistogram", _aggregation(_EXPONENTIAL_POINT), False),
+    11: ("summary", {1: ("dataPoints", _SUMMARY_POINT, True)}, False),
+}
+
+
+def _resource_schema(scope_key: str, records_key: str, record: _Schema) -> _Schema:
+    scoped = {
+        1: ("scope", _SCOPE, False),
+        2: (records_key, record, True),
+        3: ("schemaUrl", "string", False),
+    }
+    return {
+        1: ("resource", _RESOURCE, False),
+        2: (scope_key, scoped, True),
+        3: ("schemaUrl", "string", False),
+    }
+
+
+_REQUESTS: Dict[SourceType, tuple] = {
+    SourceType.OTLP_LOGS: (
+        "resourceLogs",
+        "scopeLogs",
+        "logRecords",
+        _LOG_RECORD,
+    ),
+    SourceType.OTLP_METRICS: (
+        "resourceMetrics",
+        "scopeMetrics",
+        "metrics",
+        _METRIC,
+    ),
+    SourceType.OTLP_TRACES: (
+        "resourceSpans",
+        "scopeSpans",
+        "spans",
+        _SPAN,
+    ),
+}
+_REQUEST_SCHEMAS: Dict[SourceType, _Schema] = {
+    signal: {1: (key, _resource_schema(scope_key, records_key, record), True)}
+    for signal, (key, scope_key, records_key, record) in _REQUESTS.items()
+}
+
+_DOUBLE = struct.Struct("<d")
+_FIXED64 = struct.Struct("<Q")
+_SFIXED64 = struct.Struct("<q")
+_FIXED32 = struct.Struct("<I")
+
+
+def _varint(buf: bytes, pos: int) -> tuple:
+    result = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _scalar(kind: str, wire: int, buf: bytes, pos: int, end: int) -> Any:
+    # Decodes one scalar whose bytes are buf[pos:end]
+    if kind == "string":
+        return buf[pos:end].decode("utf-8")
+    if kind == "hex":
+        return buf[pos:end].hex()
+    if kind == "base64":
+        return base64.b64encode(buf[pos:end]).decode("ascii")
+    if kind == "double":
+        return _DOUBLE.unpack_from(buf, pos)[0]
+    if kind == "fixed64":
+        return _FIXED64.unpack_from(buf, pos)[0]
+    if kind == "sfixed64":
+        return _SFIXED64.unpack_from(buf, pos)[0]
+    if kind == "fixed32":
+        return _FIXED32.unpack_from(buf, pos)[0]
+    raise ValueError(f"unexpected wire type {wire} for {kind}")
+
+
+def _from_varint(kind: str, value: int) -> Any:
+    if kind == "bool":
+        return bool(value)
+    if kind == "sint":
+        return (value >> 1) ^ -(value & 1)
+    if kind == "int64" and value >= 1 << 63:
+        return value - (1 << 64)
+    return value
+
+
+_WIDTHS = {"double": 8, "fixed64": 8, "sfixed64": 8, "fixed32": 4}
+
+
+def _decode_message(buf: bytes, pos: int, end: int, schema: _Schema) -> Dict:
+    message: Dict[str, Any] = {}
+    while pos < end:
+        key, pos = _varint(buf, pos)
+        number, wire = key >> 3, key & 7
+        spec = schema.get(number)
+        if wire == 0:
+            raw, pos = _varint(buf, pos)
+            start = stop = pos
+        elif wire == 1:
+            start, stop = pos, pos + 8
+        elif wire == 2:
+            length, pos = _varint(buf, pos)
+            start, stop = pos, pos + length
+        elif wire == 5:
+            start, stop = pos, pos + 4
+        else:
+            raise ValueError(f"unsupported protobuf wire type {wire}")
+        pos = stop
+        if spec is None:
+            continue
+
+        name, kind, repeated = spec
+        if isinstance(kind, dict):
+            value: Any = _decode_message(buf, start, stop, kind)
+        elif wire == 0:
+            value = _from_varint(kind, raw)
+        elif wire == 2 and kind in _WIDTHS:
+            # Packed repeated fixed-width values
+            width = _WIDTHS[kind]
+            message.setdefault(name, []).extend(
+                _scalar(kind, 1, buf, i, i + width) for i in range(start, stop, width)
+            )
+            continue
+        elif wire == 2 and kind in ("uint", "sint", "int64", "bool"):
+            values = message.setdefault(name, [])
+            while start < stop:
+                raw, start = _varint(buf, start)
+                values.append(_from_varint(kind, raw))
+            continue
+        else:
+            value = _scalar(kind, wire, buf, start, stop)
+
+        if repeated:
+            message.setdefault(name, []).append(value)
+        else:
+            message[name] = value
+    return message
+
+
+def otlp_signal(source: OTLPSource | SourceType | str) -> SourceType:
+    """
+    Get the OTLP source type of a source, source type or signal name.
+
+    Raises:
+        ValueError: If it is not an OTLP signal
+    """
+    if isinstance(source, OTLPSource):
+        return SourceType(source.type)
+    signal = _SIGNALS.get(str(source).lower())
+    if signal is None:
+        signal = SourceType(source)
+    if signal not in _REQUESTS:
+        raise ValueError(f"{source!r} is not an OTLP signal")
+    return signal
+
+
+def decode_otlp(
+    data: bytes | str | Mapping[str, Any],
+    signal: OTLPSource | SourceType | str,
+    encoding: str = "json",
+) -> Dict[str, Any]:
+    """
+    Decode an OTLP export request.
+
+    Protobuf requests are decoded to the dicts of the OTLP/JSON encoding, with
+    trace and span IDs as hex strings.
+
+    Args:
+        data: Encoded request, or an already decoded OTLP/JSON dict
+        signal: Signal of the request
+        encoding: ``json`` or ``protobuf``
+
+    Raises:
+        ValueError: If the encoding is unknown or the data cannot be decoded
+    """
+    if isinstance(data, Mapping):
+        return dict(data)
+    if encoding == "json":
+        return jsonlib.loads(data)
+    if encoding == "protobuf":
+        if isinstance(data, str):
+            raise ValueError("protobuf requests must be bytes")
+        buf = bytes(data)
+        try:
+            schema = _REQUEST_SCHEMAS[otlp_signal(signal)]
+            return _decode_message(buf, 0, len(buf), schema)
+        except (IndexError, struct.error, UnicodeDecodeError) as e:
+            raise ValueError(f"invalid protobuf OTLP request: {e}") from e
+    raise ValueError(f"Unknown OTLP encoding: {encoding!r}")
+
+
+def read_otlp(
+    source: OTLPInput,
+    signal: OTLPSource | SourceType | str,
+    encoding: str | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream OTLP export requests from a file or an iterable.
+
+    JSON files hold one request per line, as written by the collector file
+    exporter, or a single request. Protobuf files hold requests each prefixed
+    by their length as a 4-byte big-endian integer. The encoding of a file is
+    guessed from its suffix when not given: ``.pb``, ``.binpb``, ``.proto`` and
+    ``.protobuf`` are protobuf, anything else JSON.
+
+    Args:
+        source: Path of a file, or an iterable of encoded or decoded requests
+        signal: Signal of the requests
+        encoding: ``json`` or ``protobuf``
+    """
+    if not isinstance(source, (str, os.PathLike)):
+        for request in source:
+            yield decode_otlp(request, signal, encoding or "json")
+        return
+
+    path = Path(source)
+    if encoding is None:
+        protobuf = path.suffix.lower() in _PROTOBUF_SUFFIXES
+        encoding = "protobuf" if protobuf else "json"
+    with open(path, "rb") as f:
+        if encoding == "protobuf":
+            while True:
+                header = f.read(4)
+                if not header:
+                    return
+                if len(header) < 4:
+                    raise ValueError(f"truncated OTLP protobuf file: {path}")
+                data = f.read(int.from_bytes(header, "big"))
+                yield decode_otlp(data, signal, encoding)
+        first = True
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                request = jsonlib.loads(line)
+            except jsonlib.JSONDecodeError:
+                if not first:
+                    raise
+                # A single request spread over several lines
+                f.seek(0)
+                yield jsonlib.loads(f.read())
+                return
+            first = False
+            yield request
+
+
+def any_value(value: Optional[Mapping[str, Any]]) -> Any:
+    """Convert an OTLP/JSON ``AnyValue`` to a Python value."""
+    if not value:
+        return None
+    if "stringValue" in value:
+        return value["stringValue"]
+    if "intValue" in value:
+        return int(value["intValue"])
+    if "doubleValue" in value:
+        return float(value["doubleValue"])
+    if "boolValue" in value:
+        return value["boolValue"]
+    if "arrayValue" in value:
+        return [any_value(v) for v in value["arrayValue"].get("values", ())]
+    if "kvlistValue" in value:
+        return attributes(value["kvlistValue"].get("values"))
+    if "bytesValue" in value:
+        return value["bytesValue"]
+    return None
+
+
+def attributes(key_values: Optional[Iterable[Mapping[str, Any]]]) -> Dict[str, Any]:
+    """Convert a list of OTLP/JSON ``KeyValue`` to a dict."""
+    if not key_values:
+        return {}
+    return {kv["key"]: any_value(kv.get("value")) for kv in key_values}
+
+
+def _int(value: Any) -> Optional[int]:
+    return None if value is None else int(value)
+
+
+def _log_row(record: Mapping[str, Any]) -> Dict[str, Any]:
+    return {
+        "timestamp": _int(record.get("timeUnixNano")),
+        "observed_timestamp": _int(record.get("observedTimeUnixNano")),
+        "severity_number": record.get("severityNumber", 0),
+        "severity_text": record.get("severityText", ""),
+        "body": any_value(record.get("body")),
+        "trace_id": record.get("traceId", ""),
+        "span_id": record.get("spanId", ""),
+        "flags": record.get("flags", 0),
+        "event_name": record.get("eventName", ""),
+        "attributes": attributes(record.get("attributes")),
+    }
+
+
+def _span_row(span: Mapping[str, Any]) -> Dict[str, Any]:
+    start = _int(span.get("startTimeUnixNano"))
+    end = _int(span.get("endTimeUnixNano"))
+    status = span.get("status") or {}
+    return {
+        "trace_id": span.get("traceId", ""),
+        "span_id": span.get("spanId", ""),
+        "parent_span_id": span.get("parentSpanId", ""),
+        "trace_state": span.get("traceState", ""),
+        "name": span.get("name", ""),
+        "kind": span.get("kind", 0),
+        "start_timestamp": start,
+        "end_timestamp": end,
+        "duration_ns": end - start if start is not None and end is not None else None,
+        "status_code": status.get("code", 0),
+        "status_message": status.get("message", ""),
+        "attributes": attributes(span.get("attributes")),
+        "events": [
+            {
+                "timestamp": _int(event.get("timeUnixNano")),
+                "name": event.get("name", ""),
+                "attributes": attributes(event.get("attributes")),
+            }
+            for event in span.get("events", ())
+        ],
+        "links": [
+            {
+                "trace_id": link.get("traceId", ""),
+                "span_id": link.get("spanId", ""),
+                "trace_state": link.get("traceState", ""),
+                "attributes": attributes(link.get("attributes")),
+            }
+            for link in span.get("links", ())
+        ],
+    }
+
+
+_METRIC_TYPES = {
+    "gauge": "gauge",
+    "sum": "sum",
+    "histogram": "histogram",
+    "exponentialHistogram": "exponential_histogram",
+    "summary": "summary",
+}
+
+
+def _point_row(
+    metric_type: str, data: Mapping[str, Any], point: Mapping[str, Any]
+) -> Dict[str, Any]:
+    row: Dict[str, Any] = {
+        "metric_type": metric_type,
+        "start_timestamp": _int(point.get("startTimeUnixNano")),
+        "timestamp": _int(point.get("timeUnixNano")),
+        "flags": point.get("flags", 0),
+        "attributes": attributes(point.get("attributes")),
+    }
+    if "aggregationTemporality" in data:
+        row["aggregation_temporality"] = data["aggregationTemporality"]
+    if metric_type in ("gauge", "sum"):
+        if "asInt" in point:
+            row["value"] = int(point["asInt"])
+        else:
+            row["value"] = float(point.get("asDouble", 0.0))
+        if metric_type == "sum":
+            row["is_monotonic"] = data.get("isMonotonic", False)
+        return row
+
+    row["count"] = _int(point.get("count", 0))
+    row["sum"] = point.get("sum")
+    if metric_type == "summary":
+        row["quantile_values"] = [
+            {"quantile": q.get("quantile", 0.0), "value": q.get("value", 0.0)}
+            for q in point.get("quantileValues", ())
+        ]
+        return row
+    row["min"] = point.get("min")
+    row["max"] = point.get("max")
+    if metric_type == "histogram":
+        row["bucket_counts"] = [int(c) for c in point.get("bucketCounts", ())]
+        row["explicit_bounds"] = list(point.get("explicitBounds", ()))
+    else:
+        row["scale"] = point.get("scale", 0)
+        row["zero_count"] = _int(point.get("zeroCount", 0))
+        for side in ("positive", "negative"):
+            buckets = point.get(side) or {}
+            row[f"{side}_offset"] = buckets.get("offset", 0)
+            row[f"{side}_bucket_counts"] = [
+                int(c) for c in buckets.get("bucketCounts", ())
+            ]
+    return row
+
+
+def _metric_rows(metric: Mapping[str, Any]) -> Iterator[Dict[str, Any]]:
+    header = {
+        "metric_name": metric.get("name", ""),
+        "metric_description": metric.get("description", ""),
+        "metric_unit": metric.get("unit", ""),
+    }
+    for key, metric_type in _METRIC_TYPES.items():
+        data = metric.get(key)
+        if data is None:
+            continue
+        for point in data.get("dataPoints", ()):
+            row = dict(header)
+            row.update(_point_row(metric_type, data, point))
+            yield row
+
+
+def _record_rows(signal: SourceType, record: Mapping[str, Any]) -> Iterable[Dict]:
+    if signal == SourceType.OTLP_LOGS:
+        return (_log_row(record),)
+    if signal == SourceType.OTLP_TRACES:
+        return (_span_row(record),)
+    return _metric_rows(record)
+
+
+def _kafka_type(types: Set[type]) -> str:
+    types = types - {type(None)}
+    if not types:
+        return "string"
+    if types == {bool}:
+        return "bool"
+    if types == {int}:
+        return "int64"
+    if types <= {int, float}:
+        return "float64"
+    if types == {list}:
+        return "array"
+    if types == {dict}:
+        return "map"
+    return "string"
+
+
+class OTLPStats(BaseModel):
+    """Counters of decoded and flattened OTLP requests."""
+
+    signal: SourceType
+    requests: int = 0
+    rows: int = 0
+    input_bytes: int = 0
+    row_bytes: int = 0
+    elapsed: float = 0.0
+    columns: Dict[str, str] = Field(default_factory=dict)
+
+    @property
+    def rows_per_second(self) -> float:
+        """Flattened rows per second spent decoding and flattening."""
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def rows_per_request(self) -> float:
+        """Average number of rows per export request."""
+        return self.rows / self.requests if self.requests else 0.0
+
+    @property
+    def bytes_per_row(self) -> float:
+        """Average JSON size of a flattened row."""
+        return self.row_bytes / self.rows if self.rows else 0.0
+
+
+class OTLPFlattener:
+    """
+    Flattens OTLP export requests into rows locally.
+
+    Every log record, span or metric data point becomes one row carrying the
+    attributes of its resource and instrumentation scope next to its own:
+
+    * logs: ``timestamp``, ``observed_timestamp``, ``severity_number``,
+      ``severity_text``, ``body``, ``trace_id``, ``span_id``, ``flags``,
+      ``event_name`` and ``attributes``
+    * traces: ``trace_id``, ``span_id``, ``parent_span_id``, ``trace_state``,
+      ``name``, ``kind``, ``start_timestamp``, ``end_timestamp``,
+      ``duration_ns``, ``status_code``, ``status_message``, ``attributes``,
+      ``events`` and ``links``
+    * metrics: ``metric_name``, ``metric_description``, ``metric_unit``,
+      ``metric_type``, the timestamps and ``attributes`` of the data point and
+      its value fields, which depend on the metric type
+
+    plus ``resource_attributes``, ``resource_schema_url``, ``scope_name``,
+    ``scope_version``, ``scope_attributes`` and ``scope_schema_url``.
+    Timestamps are nanoseconds since the epoch and IDs hex strings.
+
+    The stats report throughput, sizes and the Kafka data type of every column
+    seen, to plan sink mappings.
+    """
+
+    def __init__(
+        self, signal: OTLPSource | SourceType | str, measure_sizes: bool = True
+    ):
+        """Initialize the OTLPFlattener class.
+
+        Args:
+            signal: OTLP source, source type or signal name (``logs``,
+                ``metrics`` or ``traces``)
+            measure_sizes: Whether to measure the JSON size of the rows, which
+                costs an encoding of every row
+
+        Raises:
+            ValueError: If the signal is not an OTLP signal
+        """
+        self.signal = otlp_signal(signal)
+        self.measure_sizes = measure_sizes
+        self._keys = _REQUESTS[self.signal][:3]
+        self.reset()
+
+    def flatten(
+        self, request: bytes | str | Mapping[str, Any], encoding: str = "json"
+    ) -> List[Dict[str, Any]]:
+        """Flatten one export request.
+
+        Args:
+            request: Encoded request, or an already decoded OTLP/JSON dict
+            encoding: Encoding of ``request`` when it is not decoded
+
+        Returns:
+            List[Dict[str, Any]]: One row per record
+        """
+        started = time.perf_counter()
+        if not isinstance(request, Mapping):
+            self._input_bytes += len(request)
+        rows = self._flatten(decode_otlp(request, self.signal, encoding))
+        self._record(rows)
+        self._elapsed += time.perf_counter() - started
+        return rows
+
+    def _flatten(self, request: Mapping[str, Any]) -> List[Dict[str, Any]]:
+        resources_key, scopes_key, records_key = self._keys
+        signal = self.signal
+        rows = []
+        for resource_entry in request.get(resources_key, ()):
+            resource = resource_entry.get("resource") or {}
+            resource_columns = {
+                "resource_attributes": attributes(resource.get("attributes")),
+                "resource_schema_url": resource_entry.get("schemaUrl", ""),
+            }
+            for scope_entry in resource_entry.get(scopes_key, ()):
+                scope = scope_entry.get("scope") or {}
+                columns = dict(resource_columns)
+                columns["scope_name"] = scope.get("name", "")
+                columns["scope_version"] = scope.get("version", "")
+                columns["scope_attributes"] = attributes(scope.get("attributes"))
+                columns["scope_schema_url"] = scope_entry.get("schemaUrl", "")
+                for record in scope_entry.get(records_key, ()):
+                    for row in _record_rows(signal, record):
+                        row.update(columns)
+                        rows.append(row)
+        return rows
+
+    def _record(self, rows: List[Dict[str, Any]]) -> None:
+        self._requests += 1
+        self._rows += len(rows)
+        keys: Set[str] = set()
+        for row in rows:
+            keys.update(row)
+        types = self._types
+        for key in keys:
+            seen = types.get(key)
+            if seen is None:
+                seen = types[key] = set()
+            seen.update(map(type, map(methodcaller("get", key), rows)))
+        if self.measure_sizes:
+            self._row_bytes += sum(len(jsonlib.dumps(row)) for row in rows)
+
+    def read(
+        self, source: OTLPInput, encoding: str | None = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream the rows of every request of a file or an iterable.
+
+        Args:
+            source: Path of a file, or an iterable of encoded or decoded requests
+            encoding: ``json`` or ``protobuf``, guessed from the file suffix
+                when not given
+
+        Yields:
+            List[Dict[str, Any]]: Rows of one request
+        """
+        if isinstance(source, (str, os.PathLike)):
+            self._input_bytes += os.path.getsize(source)
+        requests = read_otlp(source, self.signal, encoding)
+        while True:
+            started = time.perf_counter()
+            request = next(requests, None)
+            if request is None:
+                return
+            rows = self._flatten(request)
+            self._record(rows)
+            self._elapsed += time.perf_counter() - started
+            yield rows
+
+    def preview(
+        self, source: OTLPInput, encoding: str | None = None, sample: int = 5
+    ) -> List[Dict[str, Any]]:
+        """Flatten every request of a source and keep a sample of rows.
+
+        Args:
+            source: Path of a file, or an iterable of encoded or decoded requests
+            encoding: ``json`` or ``protobuf``, guessed from the file suffix
+                when not given
+            sample: Number of rows to return
+
+        Returns:
+            List[Dict[str, Any]]: First rows; throughput, sizes and columns are
+                in ``stats``
+        """
+        rows: List[Dict[str, Any]] = []
+        for batch in self.read(source, encoding):
+            if len(rows) < sample:
+                rows.extend(batch[: sample - len(rows)])
+        return rows
+
+    @property
+    def stats(self) -> OTLPStats:
+        """Counters of the requests flattened so far."""
+        return OTLPStats(
+            signal=self.signal,
+            requests=self._requests,
+            rows=self._rows,
+            input_bytes=self._input_bytes,
+            row_bytes=self._row_bytes,
+            elapsed=self._elapsed,
+            columns={key: _kafka_type(seen) for key, seen in self._types.items()},
+        )
+
+    def reset(self) -> None:
+        """Clear the counters."""
+        self._requests = 0
+        self._rows = 0
+        self._input_bytes = 0
+        self._row_bytes = 0
+        self._elapsed = 0.0
+        self._types: Dict[str, Set[type]] = {}
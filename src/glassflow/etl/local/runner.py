@@ -0,0 +1,448 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import os
+import time
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pydantic import BaseModel, Field
+
+from .. import jsonlib
+from ..models import (
+    DedupTransform,
+    FilterTransform,
+    PipelineConfig,
+    StatelessTransform,
+)
+from ..sinks import FileSink, InMemorySink, RedriveSink
+from .batching import DEFAULT_MAX_BATCH_SIZE
+from .dedup import DedupEngine
+from .filter import FilterEngine
+from .join import JoinEngine
+from .stateless import StatelessEngine
+from .timeutils import field_getter, to_seconds
+
+EventSource = Union[str, os.PathLike, Iterable[Mapping[str, Any]]]
+
+
+def read_events(source: EventSource, batch_size: int = 1000) -> Iterator[List[Any]]:
+    """
+    Read events in batches from a file or an iterable.
+
+    Files ending in ``.parquet`` are read with ``pyarrow``; any other file is
+    read as JSON lines.
+
+    Args:
+        source: Path of a JSONL or Parquet file, or an iterable of event dicts
+        batch_size: Maximum number of events per batch
+
+    Raises:
+        ImportError: If a Parquet file is given and pyarrow is not installed
+    """
+    if isinstance(source, (str, os.PathLike)):
+        path = Path(source)
+        if path.suffix == ".parquet":
+            yield from _read_parquet(path, batch_size)
+            return
+        with open(path, "rb") as f:
+            lines = (line for line in f if line.strip())
+            while True:
+                chunk = itertools.islice(lines, batch_size)
+                batch = [jsonlib.loads(line) for line in chunk]
+                if not batch:
+                    return
+                yield batch
+
+    iterator = iter(source)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _read_parquet(path: Path, batch_size: int) -> Iterator[List[Any]]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Reading Parquet files requires pyarrow: pip install pyarrow"
+        ) from e
+    for record_batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size):
+        yield record_batch.to_pylist()
+
+
+def _tagged(source_id: str, batches: Iterator[List[Any]]) -> Iterator[Tuple[str, Any]]:
+    for batch in batches:
+        for event in batch:
+            yield source_id, event
+
+
+class StageStats(BaseModel):
+    """Counters and timing of one stage of a dry run."""
+
+    stage: str
+    source_id: Optional[str] = None
+    events_in: int = 0
+    events_out: int = 0
+    errors: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Input events per second spent in the stage."""
+        return self.events_in / self.elapsed if self.elapsed else 0.0
+
+
+class DryRunReport(BaseModel):
+    """Result of a local dry run of a pipeline."""
+
+    pipeline_id: str
+    stages: List[StageStats] = Field(default_factory=list)
+    rows: int = 0
+    batches: int = 0
+    elapsed: float = 0.0
+
+    def stage(self, stage: str, source_id: str | None = None) -> StageStats:
+        """Get the stats of a stage, optionally of a given source.
+
+        Raises:
+            KeyError: If there is no such stage
+        """
+        for stats in self.stages:
+            if stats.stage == stage and (
+                source_id is None or stats.source_id == source_id
+            ):
+                return stats
+        raise KeyError(stage if source_id is None else f"{stage} ({source_id})")
+
+    def to_table(self) -> str:
+        """Render the stage stats as a plain-text table."""
+        headers = ["STAGE", "SOURCE", "IN", "OUT", "ERRORS", "SECONDS", "EVENTS/S"]
+        rows = [
+            [
+                s.stage,
+                s.source_id or "",
+                str(s.events_in),
+                str(s.events_out),
+                str(s.errors),
+                f"{s.elapsed:.3f}",
+                f"{s.throughput:.0f}",
+            ]
+            for s in self.stages
+        ]
+        widths = [
+            max(len(row[i]) for row in [headers, *rows]) for i in range(len(headers))
+        ]
+        return "\n".join(
+            "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+            for row in [headers, *rows]
+        )
+
+
+class _Stage:
+    """Runs one engine over batches and times it."""
+
+    def __init__(self, stats: StageStats, apply: Callable[[List[Any]], List[Any]]):
+        self.stats = stats
+        self.apply = apply
+        self.engine: Any = None
+
+    def __call__(self, events: List[Any]) -> List[Any]:
+        started = time.perf_counter()
+        outputs = self.apply(events)
+        stats = self.stats
+        stats.elapsed += time.perf_counter() - started
+        stats.events_in += len(events)
+        stats.events_out += len(outputs)
+        return outputs
+
+    def report(self) -> StageStats:
+        errors = getattr(getattr(self.engine, "stats", None), "errors", 0)
+        return self.stats.model_copy(update={"errors": errors})
+
+
+class PipelineDryRun:
+    """
+    Runs a pipeline configuration locally over recorded events.
+
+    Events of each source go through the transforms of that source in the order
+    of ``transforms``, then through the join when it is enabled, and are finally
+    mapped to the sink columns by ``sink.mapping`` and grouped into insert
+    batches of ``sink.max_batch_size`` rows. Each batch is written to the sink as
+    one document with the table, column names, column types and rows, the shape
+    of a ClickHouse insert.
+
+    Deduplication and join windows use event time when ``time_field`` is given,
+    and the wall clock otherwise, which makes replayed events fall into the same
+    window.
+    """
+
+    def __init__(
+        self,
+        config: PipelineConfig,
+        sink: RedriveSink | str | os.PathLike | None = None,
+        time_field: str | None = None,
+        batch_size: int = 1000,
+    ):
+        """Initialize the PipelineDryRun class.
+
+        Args:
+            config: Pipeline configuration
+            sink: Destination of the insert batches, or the path of a file they
+                are appended to as JSON lines, which is closed at the end of each
+                run; batches are kept in memory when not provided
+            time_field: Field holding the event time, used by dedup and join
+                windows and to interleave the sources of a join
+            batch_size: Number of events read and processed together
+
+        Raises:
+            ValueError: If ``batch_size`` is not positive
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._sink_path = None
+        if sink is None:
+            sink = InMemorySink()
+        elif isinstance(sink, (str, os.PathLike)):
+            self._sink_path = sink
+            sink = FileSink(sink, fsync=False)
+        self._sink_closed = False
+        self.config = config
+        self.sink: RedriveSink = sink
+        self.time_field = time_field
+        self.batch_size = batch_size
+
+    def _transform_stages(self) -> Dict[str, List[_Stage]]:
+        stages: Dict[str, List[_Stage]] = {
+            source.source_id: [] for source in self.config.sources
+        }
+        for transform in self.config.transforms or []:
+            if isinstance(transform, DedupTransform):
+                engine = DedupEngine(transform, time_field=self.time_field)
+            elif isinstance(transform, FilterTransform):
+                engine = FilterEngine(transform)
+            elif isinstance(transform, StatelessTransform):
+                engine = StatelessEngine(transform)
+            else:  # pragma: no cover - guarded by the TransformEntry union
+                raise ValueError(f"Unsupported transform {transform.type}")
+            stage = _Stage(
+                StageStats(stage=str(transform.type), source_id=transform.source_id),
+                engine.apply,
+            )
+            stage.engine = engine
+            stages[transform.source_id].append(stage)
+        return stages
+
+    def _source_batches(
+        self, source_id: str, source: EventSource, stages: List[_Stage]
+    ) -> Tuple[_Stage, Iterator[List[Any]]]:
+        read = _Stage(StageStats(stage="read", source_id=source_id), lambda b: b)
+
+        def batches() -> Iterator[List[Any]]:
+            reader = read_events(source, self.batch_size)
+            while True:
+                started = time.perf_counter()
+                batch = next(reader, None)
+                read.stats.elapsed += time.perf_counter() - started
+                if batch is None:
+                    return
+                read.stats.events_in += len(batch)
+                read.stats.events_out += len(batch)
+                for stage in stages:
+                    if not batch:
+                        break
+                    batch = stage(batch)
+                if batch:
+                    yield batch
+
+        return read, batches()
+
+    def _interleave(
+        self, streams: Dict[str, Iterator[List[Any]]]
+    ) -> Iterator[Tuple[str, Any]]:
+        if self.time_field is not None:
+            get_time = field_getter(self.time_field)
+            yield from heapq.merge(
+                *(_tagged(source_id, b) for source_id, b in streams.items()),
+                key=lambda item: to_seconds(get_time(item[1])),
+            )
+            return
+        active = dict(streams)
+        while active:
+            for source_id in list(active):
+                batch = next(active[source_id], None)
+                if batch is None:
+                    del active[source_id]
+                    continue
+                for event in batch:
+                    yield source_id, event
+
+    def run(self, inputs: Mapping[str, EventSource]) -> DryRunReport:
+        """
+        Run the pipeline over the given events.
+
+        Args:
+            inputs: Events of each source, keyed by source ID, as the path of a
+                JSONL or Parquet file or an iterable of event dicts; sources
+                without inputs receive no events
+
+        Returns:
+            DryRunReport: Per-stage counters and timings
+
+        Raises:
+            ValueError: If an input does not match any source of the pipeline
+        """
+        if self._sink_closed:
+            self.sink = FileSink(self._sink_path, fsync=False)
+            self._sink_closed = False
+        try:
+            return self._run(inputs)
+        finally:
+            # Only the file sink opened from a path is owned by the dry run
+            if self._sink_path is not None:
+                self.sink.close()
+                self._sink_closed = True
+
+    def _run(self, inputs: Mapping[str, EventSource]) -> DryRunReport:
+        config = self.config
+        source_ids = [source.source_id for source in config.sources]
+        unknown = sorted(set(inputs) - set(source_ids))
+        if unknown:
+            raise ValueError(f"Inputs do not match any source: {', '.join(unknown)}")
+
+        started = time.perf_counter()
+        transform_stages = self._transform_stages()
+        readers: List[_Stage] = []
+        streams: Dict[str, Iterator[List[Any]]] = {}
+        for source_id in source_ids:
+            if source_id in inputs:
+                read, batches = self._source_batches(
+                    source_id, inputs[source_id], transform_stages[source_id]
+                )
+                readers.append(read)
+                streams[source_id] = batches
+
+        join_stage = None
+        writer = _SinkWriter(config, self.sink)
+        if config.join is not None and config.join.enabled:
+            engine = JoinEngine(config.join, time_field=self.time_field)
+            join_ids = {config.join.left_source.source_id}
+            join_ids.add(config.join.right_source.source_id)
+            join_stage = _Stage(
+                StageStats(stage="join"),
+                lambda items: engine.process_stream(items, self.batch_size),
+            )
+            join_stage.engine = engine
+            stream = self._interleave(
+                {s: b for s, b in streams.items() if s in join_ids}
+            )
+            while True:
+                items = list(itertools.islice(stream, self.batch_size))
+                if not items:
+                    break
+                writer.write(join_stage(items))
+            # Sources outside of the join do not reach the sink; drain them so
+            # their stages are still measured
+            for source_id, batches in streams.items():
+                if source_id not in join_ids:
+                    for _ in batches:
+                        pass
+        else:
+            for source_id, batches in streams.items():
+                to_sink = config.sink.source_id in (None, source_id)
+                for batch in batches:
+                    if to_sink:
+                        writer.write(batch)
+        writer.flush()
+
+        stages = [read.report() for read in readers]
+        for source_id in source_ids:
+            stages.extend(stage.report() for stage in transform_stages[source_id])
+        if join_stage is not None:
+            stages.append(join_stage.report())
+        stages.append(writer.stage.report())
+        return DryRunReport(
+            pipeline_id=config.pipeline_id,
+            stages=stages,
+            rows=writer.rows,
+            batches=writer.batches,
+            elapsed=time.perf_counter() - started,
+        )
+
+
+class _SinkWriter:
+    """Maps events to sink columns and writes them in insert batches."""
+
+    def __init__(self, config: PipelineConfig, sink: RedriveSink):
+        sink_config = config.sink
+        self.sink = sink
+        self.table = sink_config.table
+        self.database = sink_config.connection_params.database
+        self.max_batch_size = sink_config.max_batch_size or DEFAULT_MAX_BATCH_SIZE
+        mapping = sink_config.mapping
+        if mapping:
+            self.columns: Optional[List[str]] = [m.column_name for m in mapping]
+            self.types: Optional[List[str]] = [str(m.column_type) for m in mapping]
+            self.getters = [field_getter(m.name) for m in mapping]
+        else:
+            self.columns = self.types = None
+            self.getters = []
+        self.stage = _Stage(StageStats(stage="sink"), self._map)
+        self.pending: List[List[Any]] = []
+        self.pending_columns: Optional[List[str]] = None
+        self.rows = 0
+        self.batches = 0
+
+    def _map(self, events: List[Any]) -> List[List[Any]]:
+        if self.getters:
+            getters = self.getters
+            return [[get(event) for get in getters] for event in events]
+        # Without a mapping, events are inserted as they are
+        if self.pending_columns is None and events:
+            self.pending_columns = list(events[0])
+        columns = self.pending_columns or []
+        return [[event.get(column) for column in columns] for event in events]
+
+    def write(self, events: List[Any]) -> None:
+        if not events:
+            return
+        self.pending.extend(self.stage(events))
+        while len(self.pending) >= self.max_batch_size:
+            self._send(self.pending[: self.max_batch_size])
+            del self.pending[: self.max_batch_size]
+
+    def flush(self) -> None:
+        if self.pending:
+            self._send(self.pending)
+            self.pending = []
+
+    def _send(self, rows: List[List[Any]]) -> None:
+        started = time.perf_counter()
+        self.sink.write(
+            [
+                {
+                    "database": self.database,
+                    "table": self.table,
+                    "columns": self.columns or self.pending_columns,
+                    "types": self.types,
+                    "rows": rows,
+                }
+            ]
+        )
+        self.stage.stats.elapsed += time.perf_counter() - started
+        self.rows += len(rows)
+        self.batches += 1
@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import math
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from pydantic import BaseModel, Field
+
+from ..models import KafkaField, KafkaSource
+from ..models.data_types import KafkaDataType
+from .coercion import FLOAT32_MAX, INTEGER_BOUNDS
+from .timeutils import field_getter
+
+_FLOAT_TYPES = {KafkaDataType.FLOAT, KafkaDataType.FLOAT32, KafkaDataType.FLOAT64}
+
+# Checks of the common case, written for generated code; ``{v}`` is the value
+_FAST_CHECKS = {
+    KafkaDataType.STRING: "{v}.__class__ is str",
+    KafkaDataType.BOOL: "{v}.__class__ is bool",
+    KafkaDataType.BYTES: "({v}.__class__ is str or {v}.__class__ is bytes)",
+    KafkaDataType.ARRAY: "{v}.__class__ is list",
+    KafkaDataType.MAP: "{v}.__class__ is dict",
+    KafkaDataType.FLOAT: "({v}.__class__ is float or {v}.__class__ is int)",
+    KafkaDataType.FLOAT64: "({v}.__class__ is float or {v}.__class__ is int)",
+    KafkaDataType.FLOAT32: (
+        "(({v}.__class__ is float or {v}.__class__ is int) "
+        f"and -{FLOAT32_MAX!r} <= {{v}} <= {FLOAT32_MAX!r})"
+    ),
+}
+
+
+def _fast_check(data_type: KafkaDataType, var: str) -> str:
+    if data_type in INTEGER_BOUNDS:
+        low, high = INTEGER_BOUNDS[data_type]
+        return f"({var}.__class__ is int and {low} <= {var} <= {high})"
+    return _FAST_CHECKS[data_type].format(v=var)
+
+
+def classify(value: Any, data_type: KafkaDataType) -> Optional[str]:
+    """
+    Check a non-null value against a Kafka data type.
+
+    Returns:
+        str | None: None when the value is valid, ``"overflow"`` when it is a
+            number out of the range of the type and ``"type"`` otherwise
+    """
+    if data_type in INTEGER_BOUNDS:
+        if isinstance(value, bool):
+            return "type"
+        if isinstance(value, float):
+            if not value.is_integer():
+                return "type"
+        elif not isinstance(value, int):
+            return "type"
+        low, high = INTEGER_BOUNDS[data_type]
+        return None if low <= value <= high else "overflow"
+    if data_type in _FLOAT_TYPES:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return "type"
+        if (
+            data_type == KafkaDataType.FLOAT32
+            and abs(value) > FLOAT32_MAX
+            and not math.isinf(value)
+        ):
+            return "overflow"
+        return None
+    if data_type == KafkaDataType.STRING:
+        return None if isinstance(value, str) else "type"
+    if data_type == KafkaDataType.BOOL:
+        return None if isinstance(value, bool) else "type"
+    if data_type == KafkaDataType.BYTES:
+        return None if isinstance(value, (str, bytes)) else "type"
+    if data_type == KafkaDataType.ARRAY:
+        return None if isinstance(value, (list, tuple)) else "type"
+    return None if isinstance(value, Mapping) else "type"
+
+
+class FieldViolations(BaseModel):
+    """Violations of one schema field."""
+
+    name: str
+    type: KafkaDataType
+    missing: int = 0
+    mismatched: int = 0
+    overflow: int = 0
+    examples: List[str] = Field(default_factory=list)
+
+    @property
+    def violations(self) -> int:
+        """Number of events with an invalid value for the field."""
+        return self.missing + self.mismatched + self.overflow
+
+
+class SchemaReport(BaseModel):
+    """Result of validating events against a source schema."""
+
+    events: int = 0
+    invalid: int = 0
+    fields: List[FieldViolations] = Field(default_factory=list)
+
+    @property
+    def valid(self) -> int:
+        """Number of events matching the schema."""
+        return self.events - self.invalid
+
+    @property
+    def invalid_rate(self) -> float:
+        """Fraction of the events with at least one violation."""
+        return self.invalid / self.events if self.events else 0.0
+
+    def violations(self) -> Dict[str, FieldViolations]:
+        """Fields with at least one violation, keyed by name."""
+        return {f.name: f for f in self.fields if f.violations}
+
+
+class SchemaValidator:
+    """
+    Validates events against the ``schema_fields`` of a Kafka source.
+
+    The schema is compiled once into a single function checking every field of
+    an event with exact type tests, which is what valid events pay for. Events
+    failing it are checked again field by field to attribute each violation to
+    a field and a kind: a missing or null value, a value of the wrong type or a
+    number out of range of its type, such as 300 for ``uint8``.
+
+    Missing and null values are only violations when ``nullable`` is False.
+    """
+
+    def __init__(
+        self,
+        schema: KafkaSource | Sequence[KafkaField | Mapping[str, str]],
+        nullable: bool = True,
+        max_examples: int = 3,
+    ):
+        """Initialize the SchemaValidator class.
+
+        Args:
+            schema: Kafka source or its schema fields
+            nullable: Whether fields may be missing or null
+            max_examples: Number of invalid values kept per field
+
+        Raises:
+            ValueError: If the source has no schema fields or a field type is
+                not a Kafka data type
+        """
+        if isinstance(schema, KafkaSource):
+            if schema.schema_fields is None:
+                raise ValueError(f"Source '{schema.source_id}' has no schema_fields")
+            schema = schema.schema_fields
+        self.fields: List[KafkaField] = [
+            f if isinstance(f, KafkaField) else KafkaField(**f) for f in schema
+        ]
+        self.nullable = nullable
+        self.max_examples = max_examples
+
+        checks = []
+        for i, f in enumerate(self.fields):
+            var = f"_v{i}"
+            get = f"({var} := _e.get({f.name!r}))"
+            if "." in f.name:
+                get = f"({var} := _get{i}(_e))"
+            null = f"{var} is None" if nullable else "False"
+            checks.append(f"({get} is None and {null} or {_fast_check(f.type, var)})")
+        source = "lambda _e: " + (" and ".join(checks) or "True")
+        namespace: Dict[str, Any] = {
+            f"_get{i}": field_getter(f.name) for i, f in enumerate(self.fields)
+        }
+        self.python_source = source
+        self._check: Callable[[Mapping[str, Any]], bool] = eval(  # noqa: S307
+            compile(source, "<schema>", "eval"), namespace
+        )
+        self._getters = [field_getter(f.name) for f in self.fields]
+        self.reset()
+
+    def is_valid(self, event: Mapping[str, Any]) -> bool:
+        """Check a single event without recording it in the report."""
+        return bool(self._check(event)) or not self._violations(event)
+
+    def _violations(self, event: Mapping[str, Any]) -> List[tuple]:
+        violations = []
+        for i, (f, get) in enumerate(zip(self.fields, self._getters)):
+            value = get(event)
+            if value is None:
+                if not self.nullable:
+                    violations.append((i, "missing", value))
+                continue
+            kind = classify(value, f.type)
+            if kind is not None:
+                violations.append((i, kind, value))
+        return violations
+
+    def _record(self, violations: List[tuple]) -> None:
+        for i, kind, value in violations:
+            stats = self._stats[i]
+            if kind == "missing":
+                stats.missing += 1
+            elif kind == "overflow":
+                stats.overflow += 1
+            else:
+                stats.mismatched += 1
+            if len(stats.examples) < self.max_examples:
+                stats.examples.append(repr(value))
+
+    def validate(self, events: Iterable[Mapping[str, Any]]) -> List[bool]:
+        """Validate a batch of events.
+
+        Args:
+            events: Event dicts
+
+        Returns:
+            List[bool]: Whether each event matches the schema
+        """
+        events = events if isinstance(events, Sequence) else list(events)
+        mask = list(map(self._check, events))
+        invalid = 0
+        for index, ok in enumerate(mask):
+            if ok:
+                continue
+            violations = self._violations(events[index])
+            if violations:
+                self._record(violations)
+                invalid += 1
+            else:
+                mask[index] = True
+        self._events += len(mask)
+        self._invalid += invalid
+        return mask
+
+    def validate_columns(
+        self, columns: Mapping[str, Sequence[Any]], length: int | None = None
+    ) -> List[bool]:
+        """Validate a columnar batch.
+
+        Args:
+            columns: Mapping of field name to the values of that field, one per
+                event; fields missing from the mapping are treated as null
+            length: Number of events, required when no schema field is present
+                in ``columns``
+
+        Returns:
+            List[bool]: Whether each event matches the schema
+        """
+        if length is None:
+            present = [columns[f.name] for f in self.fields if f.name in columns]
+            if not present:
+                raise ValueError("length is required without any schema column")
+            length = len(present[0])
+
+        mask = [True] * length
+        for i, f in enumerate(self.fields):
+            values = columns.get(f.name)
+            if values is None:
+                if not self.nullable:
+                    self._record([(i, "missing", None)] * length)
+                    mask = [False] * length
+                continue
+            check = _column_check(f.type, self.nullable)
+            if all(map(check, values)):
+                continue
+            for index, value in enumerate(values):
+                if check(value):
+                    continue
+                if value is None:
+                    kind = "missing"
+                else:
+                    kind = classify(value, f.type)
+                    if kind is None:
+                        continue
+                self._record([(i, kind, value)])
+                mask[index] = False
+
+        self._events += length
+        self._invalid += length - sum(mask)
+        return mask
+
+    @property
+    def report(self) -> SchemaReport:
+        """Violations found so far."""
+        return SchemaReport(
+            events=self._events,
+            invalid=self._invalid,
+            fields=[stats.model_copy(deep=True) for stats in self._stats],
+        )
+
+    def reset(self) -> None:
+        """Clear the report."""
+        self._events = 0
+        self._invalid = 0
+        self._stats = [FieldViolations(name=f.name, type=f.type) for f in self.fields]
+
+
+_column_checks: Dict[tuple, Callable[[Any], bool]] = {}
+
+
+def _column_check(data_type: KafkaDataType, nullable: bool) -> Callable[[Any], bool]:
+    key = (data_type, nullable)
+    check = _column_checks.get(key)
+    if check is None:
+        null = "_v is None or " if nullable else ""
+        source = f"lambda _v: {null}{_fast_check(data_type, '_v')}"
+        check = _column_checks[key] = eval(  # noqa: S307
+            compile(source, "<schema>", "eval"), {}
+        )
+    return check
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from pydantic import BaseModel
+
+from ..models import StatelessTransform, StatelessTransformConfig, Transformation
+from ..models.data_types import KafkaDataType
+from .coercion import kafka_coercer
+from .expressions import CompiledRecord, compile_expression
+
+
+class StatelessStats(BaseModel):
+    """Counters of a local stateless transform run."""
+
+    evaluated: int = 0
+    transformed: int = 0
+    errors: int = 0
+    elapsed: float = 0.0
+    last_error: Optional[str] = None
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of evaluated events the transform failed on."""
+        return self.errors / self.evaluated if self.evaluated else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Evaluated events per second spent in the engine."""
+        return self.evaluated / self.elapsed if self.elapsed else 0.0
+
+
+class StatelessEngine:
+    """
+    Evaluates a stateless transform locally over batches of events.
+
+    All transformations of the transform are compiled into a single function
+    that computes every output field of an event in one call, with each result
+    converted to the ``output_type`` of its transformation. Output events only
+    contain the output fields, as in the pipeline. Events any transformation
+    fails on, or whose result cannot be converted, are dropped and counted as
+    errors, since the pipeline would send them to the DLQ.
+    """
+
+    def __init__(
+        self,
+        config: StatelessTransform
+        | StatelessTransformConfig
+        | Sequence[Transformation | Mapping[str, str]],
+    ):
+        """Initialize the StatelessEngine class.
+
+        Args:
+            config: Stateless transform, its config or its list of
+                transformations
+
+        Raises:
+            InvalidExpressionError: If an expression is not valid
+            ValueError: If an output type is not a Kafka data type or an output
+                name is used more than once
+        """
+        if isinstance(config, StatelessTransform):
+            config = config.config
+        if isinstance(config, StatelessTransformConfig):
+            transformations = list(config.transforms)
+        else:
+            transformations = [
+                t if isinstance(t, Transformation) else Transformation(**t)
+                for t in config
+            ]
+
+        names = [t.output_name for t in transformations]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate output names: {', '.join(duplicates)}")
+
+        self.transformations: List[Transformation] = transformations
+        self.output_schema: Dict[str, KafkaDataType] = {
+            t.output_name: KafkaDataType(t.output_type) for t in transformations
+        }
+        self._coercers = [kafka_coercer(t.output_type) for t in transformations]
+
+        record = CompiledRecord(
+            {t.output_name: t.expression for t in transformations},
+            dict(zip(names, self._coercers)),
+        )
+        self.fields = record.fields
+        self.python_source = record.python_source
+        self._row_fn = record.row_function
+        self._column_fn = record.column_function
+
+        self.stats = StatelessStats()
+
+    def _describe_failure(self, event: Mapping[str, Any]) -> str:
+        for transformation, coerce in zip(self.transformations, self._coercers):
+            try:
+                value = compile_expression(transformation.expression)(event)
+            except Exception as e:
+                return f"{transformation.output_name}: {e}"
+            try:
+                coerce(value)
+            except Exception as e:
+                return (
+                    f"{transformation.output_name}: cannot convert {value!r} to "
+                    f"{transformation.output_type}: {e}"
+                )
+        return "unknown error"
+
+    def apply(self, events: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+        """Transform a batch of events.
+
+        Args:
+            events: Event dicts
+
+        Returns:
+            List[Dict[str, Any]]: Output events, in order, of the events the
+                transform succeeded on
+        """
+        started = time.perf_counter()
+        events = events if isinstance(events, Sequence) else list(events)
+        try:
+            outputs = list(map(self._row_fn, events))
+        except Exception:
+            outputs = []
+            row_fn = self._row_fn
+            failed = None
+            for event in events:
+                try:
+                    outputs.append(row_fn(event))
+                except Exception:
+                    failed = event
+            if failed is not None:
+                self.stats.last_error = self._describe_failure(failed)
+
+        self._record(len(events), len(outputs), started)
+        return outputs
+
+    def apply_columns(
+        self, columns: Mapping[str, Sequence[Any]], length: int | None = None
+    ) -> Dict[str, List[Any]]:
+        """Transform a columnar batch.
+
+        Args:
+            columns: Mapping of field name to the values of that field, one per
+                event; fields missing from the mapping evaluate to None
+            length: Number of events, required when no referenced field is
+                present in ``columns``
+
+        Returns:
+            Dict[str, List[Any]]: Mapping of output name to the output values of
+                the events the transform succeeded on
+        """
+        started = time.perf_counter()
+        if length is None:
+            present = [columns[name] for name in self.fields if name in columns]
+            if present:
+                length = len(present[0])
+            elif columns:
+                length = len(next(iter(columns.values())))
+            else:
+                raise ValueError("length is required for empty column batches")
+        args = [
+            columns[name] if name in columns else [None] * length
+            for name in self.fields
+        ] or [range(length)]
+        column_fn = self._column_fn
+        try:
+            rows = list(map(column_fn, *args))
+        except Exception:
+            rows = []
+            failed = None
+            for values in zip(*args):
+                try:
+                    rows.append(column_fn(*values))
+                except Exception:
+                    failed = values
+            if failed is not None:
+                self.stats.last_error = self._describe_failure(
+                    dict(zip(self.fields, failed))
+                )
+
+        self._record(length, len(rows), started)
+        outputs = zip(*rows) if rows else ([] for _ in self.output_schema)
+        return {name: list(values) for name, values in zip(self.output_schema, outputs)}
+
+    def _record(self, evaluated: int, transformed: int, started: float) -> None:
+        stats = self.stats
+        stats.evaluated += evaluated
+        stats.transformed += transformed
+        stats.errors += evaluated - transformed
+        stats.elapsed += time.perf_counter() - started
+
+    def reset(self) -> None:
+        """Reset the counters."""
+        self.stats = StatelessStats()
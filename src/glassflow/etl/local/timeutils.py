@@ -0,0 +1,106 @@
+"""Parsing of the durations and event times used by windowed transforms."""
+
+from __future__ import annotations
+
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, Mapping, Optional
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d*)?|\.\d+)(ns|us|µs|μs|ms|s|m|h)")
+_UNITS = {
+    "ns": 1e-9,
+    "us": 1e-6,
+    "µs": 1e-6,
+    "μs": 1e-6,
+    "ms": 1e-3,
+    "s": 1.0,
+    "m": 60.0,
+    "h": 3600.0,
+}
+
+_BINARY_UNITS = [("Ti", 2**40), ("Gi", 2**30), ("Mi", 2**20), ("Ki", 2**10)]
+
+
+@lru_cache(maxsize=256)
+def parse_duration(value: str) -> float:
+    """
+    Parse a duration such as ``30s``, ``12h`` or ``1h30m`` into seconds.
+
+    Durations use the Go format accepted by the pipeline for ``time_window`` and
+    ``max_delay_time``.
+
+    Raises:
+        ValueError: If the value is not a valid duration
+    """
+    text = value.strip()
+    if text == "0":
+        return 0.0
+    sign = -1.0 if text.startswith("-") else 1.0
+    text = text.lstrip("+-")
+    position = 0
+    seconds = 0.0
+    for match in _DURATION_PART.finditer(text):
+        if match.start() != position:
+            break
+        seconds += float(match.group(1)) * _UNITS[match.group(2)]
+        position = match.end()
+    if position != len(text) or position == 0:
+        raise ValueError(f"invalid duration {value!r}")
+    return sign * seconds
+
+
+def format_bytes(size: float) -> str:
+    """Format a number of bytes as a Kubernetes quantity, e.g. ``512Mi``."""
+    for suffix, factor in _BINARY_UNITS:
+        if size >= factor:
+            return f"{-(-size // factor):.0f}{suffix}"
+    return f"{size:.0f}"
+
+
+def to_seconds(value: Any) -> float:
+    """
+    Convert an event time to seconds since the epoch.
+
+    Numbers are taken as seconds, datetimes without a timezone as UTC and strings
+    as ISO 8601 timestamps.
+
+    Raises:
+        ValueError: If the value cannot be interpreted as a time
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        text = value.strip()
+        if text.endswith("Z"):
+            text = text[:-1] + "+00:00"
+        value = datetime.fromisoformat(text)
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    raise ValueError(f"cannot interpret {value!r} as an event time")
+
+
+def field_getter(path: str) -> Callable[[Mapping[str, Any]], Optional[Any]]:
+    """
+    Build a function reading a field from an event.
+
+    Dotted paths such as ``user.id`` read nested objects when the event has no
+    top-level field with that exact name.
+    """
+    parts = path.split(".")
+    if len(parts) == 1:
+        return lambda event: event.get(path)
+
+    def get(event: Mapping[str, Any]) -> Optional[Any]:
+        if path in event:
+            return event[path]
+        value: Any = event
+        for part in parts:
+            if not isinstance(value, Mapping):
+                return None
+            value = value.get(part)
+        return value
+
+    return get
@@ -0,0 +1,138 @@
+"""
+Checks of the sink mapping of pipeline configs against the upstream field types.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional
+
+from .errors import InvalidDataTypeMappingError
+from .models import KafkaDataType, KafkaSource, PipelineConfig, StatelessTransform
+from .models.clickhouse_types import is_compatible
+
+
+def _kafka_type(value: str) -> Optional[KafkaDataType]:
+    try:
+        return KafkaDataType(value)
+    except ValueError:
+        return None
+
+
+def sink_field_types(config: PipelineConfig) -> Optional[Dict[str, KafkaDataType]]:
+    """
+    Known Kafka types of the fields of the events reaching the sink.
+
+    These are the ``schema_fields`` of the sources feeding the sink, i.e. both
+    sources of an enabled join or the sink source, extended with the outputs of
+    their stateless transforms and the ``output_fields`` of the join. Names
+    with conflicting types across the joined sources are left out.
+
+    Returns:
+        Dict[str, KafkaDataType] | None: Field types by name, or None when no
+            source feeding the sink has a known schema, e.g. for OTLP sources
+    """
+    schemas: Dict[str, Dict[str, KafkaDataType]] = {
+        src.source_id: {f.name: f.type for f in src.schema_fields}
+        for src in config.sources
+        if isinstance(src, KafkaSource) and src.schema_fields is not None
+    }
+
+    join = config.join
+    if join is not None and join.enabled and join.left_source and join.right_source:
+        source_ids = [join.left_source.source_id, join.right_source.source_id]
+    elif config.sink.source_id is not None:
+        source_ids = [config.sink.source_id]
+    elif len(config.sources) == 1:
+        source_ids = [config.sources[0].source_id]
+    else:
+        return None
+    if not any(source_id in schemas for source_id in source_ids):
+        return None
+
+    types: Dict[str, KafkaDataType] = {}
+    conflicts = set()
+    for source_id in source_ids:
+        for name, data_type in schemas.get(source_id, {}).items():
+            if types.setdefault(name, data_type) != data_type:
+                conflicts.add(name)
+    for transform in config.transforms or ():
+        if isinstance(transform, StatelessTransform) and (
+            transform.source_id in source_ids
+        ):
+            for transformation in transform.config.transforms:
+                data_type = _kafka_type(transformation.output_type)
+                if data_type is not None:
+                    types[transformation.output_name] = data_type
+    for name in conflicts:
+        del types[name]
+
+    if join is not None and join.enabled:
+        for field in join.output_fields or ():
+            data_type = schemas.get(field.source_id, {}).get(field.name)
+            if data_type is not None:
+                types[field.output_name or field.name] = data_type
+    return types
+
+
+def sink_mapping_errors(config: PipelineConfig) -> List[str]:
+    """
+    Check the ``column_type`` of every ``sink.mapping`` entry of a config.
+
+    Only entries whose field type is known from ``sink_field_types`` are
+    checked; the others may name nested or computed fields.
+
+    Returns:
+        List[str]: Error messages, empty when the mapping is valid
+    """
+    mapping = config.sink.mapping
+    if not mapping:
+        return []
+    types = sink_field_types(config)
+    if not types:
+        return []
+
+    errors = []
+    for entry in mapping:
+        data_type = types.get(entry.name)
+        if data_type is not None and not is_compatible(data_type, entry.column_type):
+            errors.append(
+                f"Field '{entry.name}' of type '{data_type}' cannot be written to "
+                f"column '{entry.column_name}' of type '{entry.column_type}'"
+            )
+    return errors
+
+
+def check_sink_mapping(config: PipelineConfig) -> None:
+    """
+    Check the sink mapping of a config.
+
+    Raises:
+        InvalidDataTypeMappingError: Listing every invalid mapping entry
+    """
+    errors = sink_mapping_errors(config)
+    if errors:
+        raise InvalidDataTypeMappingError(
+            f"Invalid sink mapping in pipeline '{config.pipeline_id}':\n"
+            + "\n".join(f"  - {error}" for error in errors)
+        )
+
+
+def check_sink_mappings(configs: Iterable[PipelineConfig]) -> None:
+    """
+    Check the sink mappings of many configs, e.g. of a whole fleet in CI.
+
+    Every config is checked before raising, so a single run reports all the
+    invalid mappings.
+
+    Raises:
+        InvalidDataTypeMappingError: Listing every invalid mapping entry of
+            every config
+    """
+    lines = []
+    for config in configs:
+        errors = sink_mapping_errors(config)
+        if errors:
+            lines.append(f"Pipeline '{config.pipeline_id}':")
+            lines.extend(f"  - {error}" for error in errors)
+    if lines:
+        raise InvalidDataTypeMappingError("Invalid sink mappings:\n" + "\n".join(lines))
@@ -1,3 +1,5 @@
+from .base import ANY_COLUMN_TYPE_CONTEXT
+from .clickhouse_types import ClickhouseType, parse_clickhouse_type
 from .config import GlassFlowConfig
 from .data_types import ClickhouseDataType, KafkaDataType
 from .metadata import MetadataConfig
@@ -61,10 +63,12 @@ from .transforms import (
 )
 
 __all__ = [
+    "ANY_COLUMN_TYPE_CONTEXT",
     "AnySource",
     "ClickhouseConnectionParams",
     "ClickhouseConnectionParamsPatch",
     "ClickhouseDataType",
+    "ClickhouseType",
     "ConsumerGroupOffset",
     "DedupTransform",
     "DedupTransformConfig",
@@ -115,4 +119,5 @@ __all__ = [
     "TransformEntry",
     "TransformResourceEntry",
     "TransformType",
+    "parse_clickhouse_type",
 ]
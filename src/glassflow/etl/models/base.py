@@ -1,11 +1,42 @@
 from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict
+
+from pydantic import ValidationInfo
+
+# Validation context of data that was already validated, e.g. configs returned by
+# the API; model validators skip their cross-reference checks for it
+TRUSTED_CONTEXT: Dict[str, Any] = {"trusted": True}
+
+
+# Validation context accepting sink column types that no Kafka type maps to,
+# e.g. Decimal(18, 4), which the pipeline may not be able to write
+ANY_COLUMN_TYPE_CONTEXT: Dict[str, Any] = {"any_column_type": True}
+
+
+def is_trusted(info: ValidationInfo) -> bool:
+    """Whether the data being validated comes from a trusted source."""
+    return bool(info.context) and bool(info.context.get("trusted"))
+
+
+def allows_any_column_type(info: ValidationInfo) -> bool:
+    """Whether sink column types without a Kafka type mapping are accepted."""
+    return bool(info.context) and bool(
+        info.context.get("any_column_type") or info.context.get("trusted")
+    )
+
+
+@lru_cache(maxsize=None)
+def _members_by_lowercase_value(cls: type) -> Dict[str, Enum]:
+    return {member.value.lower(): member for member in cls}
 
 
 class CaseInsensitiveStrEnum(str, Enum):
     @classmethod
     def _missing_(cls, value):
-        for member in cls:
-            if member.value.lower() == value.lower():
+        if isinstance(value, str):
+            member = _members_by_lowercase_value(cls).get(value.lower())
+            if member is not None:
                 return member
         raise ValueError(f"Invalid value: {value}")
 
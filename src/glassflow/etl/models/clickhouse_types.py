@@ -0,0 +1,393 @@
+"""Parsing of ClickHouse column type strings."""
+
+from __future__ import annotations
+
+import re
+import weakref
+from functools import lru_cache
+from typing import (
+    Annotated,
+    Any,
+    Dict,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pydantic import PlainValidator, ValidationInfo, WithJsonSchema
+
+from .base import allows_any_column_type
+from .data_types import (
+    KAFKA_TO_CLICKHOUSE_COMPATIBILITY,
+    ClickhouseDataType,
+    KafkaDataType,
+)
+
+# Types taking other types as arguments, with their number of arguments
+_WRAPPERS = {"Nullable": 1, "LowCardinality": 1, "Array": 1, "Map": 2, "Tuple": None}
+# Storage modifiers that do not change which values a column accepts
+_MODIFIERS = ("Nullable", "LowCardinality")
+_SCALARS = (
+    [f"Int{bits}" for bits in (8, 16, 32, 64, 128, 256)]
+    + [f"UInt{bits}" for bits in (8, 16, 32, 64, 128, 256)]
+    + ["Float32", "Float64", "BFloat16", "String", "UUID", "Date", "Date32"]
+    + ["Bool", "IPv4", "IPv6"]
+)
+_PARAMETRIC = ["FixedString", "DateTime", "DateTime64", "Decimal", "Enum8", "Enum16"]
+_PARAMETRIC += [f"Decimal{bits}" for bits in (32, 64, 128, 256)]
+_DECIMAL_PRECISION = {"Decimal32": 9, "Decimal64": 18, "Decimal128": 38}
+_DECIMAL_PRECISION["Decimal256"] = 76
+
+# Type names are matched case-insensitively, like ClickhouseDataType
+_NAMES: Dict[str, str] = {
+    name.lower(): name for name in [*_WRAPPERS, *_SCALARS, *_PARAMETRIC]
+}
+
+_TOKEN = re.compile(
+    r"\s*(?:(?P<name>[A-Za-z_][A-Za-z0-9_]*)|(?P<number>-?\d+)"
+    r"|(?P<string>'(?:[^'\\]|\\.)*')|(?P<punct>[(),=]))"
+)
+
+
+class ClickhouseType:
+    """
+    A parsed ClickHouse column type, e.g. ``Array(LowCardinality(String))``.
+
+    Instances are interned: parsing two spellings of the same type, differing
+    in the case of the type names or in whitespace, gives the same object.
+    ``str()`` gives the canonical spelling.
+    """
+
+    __slots__ = ("name", "arguments", "parameters", "_text", "__weakref__")
+
+    def __init__(
+        self,
+        name: str,
+        arguments: Tuple[ClickhouseType, ...],
+        parameters: Tuple[Any, ...],
+        text: str,
+    ):
+        """Initialize the ClickhouseType class.
+
+        Args:
+            name: Type name, e.g. ``Array`` or ``DateTime64``
+            arguments: Types the type is built from, e.g. the element type of
+                an ``Array``
+            parameters: Literal parameters, e.g. the precision and time zone of
+                a ``DateTime64``, the element names of a ``Tuple`` or the
+                ``(name, value)`` pairs of an ``Enum8``
+            text: Canonical spelling of the type
+        """
+        self.name = name
+        self.arguments = arguments
+        self.parameters = parameters
+        self._text = text
+
+    def __str__(self) -> str:
+        return self._text
+
+    def __repr__(self) -> str:
+        return f"ClickhouseType({self._text!r})"
+
+    def __reduce__(self):
+        return parse_clickhouse_type, (self._text,)
+
+    @property
+    def nullable(self) -> bool:
+        """Whether the column accepts nulls."""
+        t = self
+        while t.name in _MODIFIERS:
+            if t.name == "Nullable":
+                return True
+            t = t.arguments[0]
+        return False
+
+    def unwrapped(self) -> ClickhouseType:
+        """The type without its ``Nullable`` and ``LowCardinality`` modifiers."""
+        t = self
+        while t.name in _MODIFIERS:
+            t = t.arguments[0]
+        return t
+
+
+# Types in use by canonical spelling; a type is dropped once nothing refers to
+# it, so that arbitrary input strings do not grow the table
+_interned: MutableMapping[str, ClickhouseType] = weakref.WeakValueDictionary()
+
+
+def _quote(value: str) -> str:
+    return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def _format_parameter(value: Any) -> str:
+    if isinstance(value, tuple):
+        name, number = value
+        return _quote(name) if number is None else f"{_quote(name)} = {number}"
+    return _quote(value) if isinstance(value, str) else str(value)
+
+
+def _intern(
+    name: str, arguments: Tuple[ClickhouseType, ...], parameters: Tuple[Any, ...]
+) -> ClickhouseType:
+    if name == "Tuple" and parameters:
+        inner = ", ".join(f"{n} {a}" for n, a in zip(parameters, arguments))
+    else:
+        inner = ", ".join(
+            [str(a) for a in arguments] + [_format_parameter(p) for p in parameters]
+        )
+    text = f"{name}({inner})" if inner else name
+    interned = _interned.get(text)
+    if interned is None:
+        interned = _interned[text] = ClickhouseType(name, arguments, parameters, text)
+    return interned
+
+
+class _Parser:
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens: List[Tuple[str, str]] = []
+        position = 0
+        while position < len(text):
+            match = _TOKEN.match(text, position)
+            if match is None:
+                if text[position:].strip():
+                    self.fail(f"unexpected {text[position:].strip()[0]!r}")
+                break
+            self.tokens.append((match.lastgroup, match.group(match.lastgroup)))
+            position = match.end()
+        self.position = 0
+
+    def fail(self, reason: str) -> None:
+        raise ValueError(f"Invalid ClickHouse type {self.text!r}: {reason}")
+
+    def peek(self) -> Tuple[Optional[str], Optional[str]]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None, None
+
+    def take(self, kind: str, value: str | None = None) -> str:
+        token_kind, token = self.peek()
+        if token_kind != kind or (value is not None and token != value):
+            self.fail(f"expected {value or kind}, got {token or 'end of type'!r}")
+        self.position += 1
+        return token
+
+    def accept(self, value: str) -> bool:
+        if self.peek() == ("punct", value):
+            self.position += 1
+            return True
+        return False
+
+    def parse(self) -> ClickhouseType:
+        result = self.parse_type()
+        if self.position != len(self.tokens):
+            self.fail(f"unexpected {self.peek()[1]!r}")
+        return result
+
+    def parse_type(self) -> ClickhouseType:
+        spelled = self.take("name")
+        name = _NAMES.get(spelled.lower())
+        if name is None:
+            self.fail(f"unknown type {spelled!r}")
+        arguments: List[ClickhouseType] = []
+        parameters: List[Any] = []
+        if self.accept("("):
+            if name in _WRAPPERS:
+                self.parse_type_arguments(name, arguments, parameters)
+            elif name in _PARAMETRIC:
+                self.parse_parameters(name, parameters)
+            else:
+                self.fail(f"{name} takes no parameters")
+            self.take("punct", ")")
+        self.check(name, arguments, parameters)
+        return _intern(name, tuple(arguments), tuple(parameters))
+
+    def parse_type_arguments(
+        self, name: str, arguments: List[ClickhouseType], names: List[str]
+    ) -> None:
+        while True:
+            # Elements of a Tuple may be named: Tuple(a String, b Int32)
+            if name == "Tuple" and self.peek()[0] == "name":
+                following = self.tokens[self.position + 1 : self.position + 2]
+                if following and following[0][0] == "name":
+                    names.append(self.take("name"))
+            arguments.append(self.parse_type())
+            if not self.accept(","):
+                return
+
+    def parse_parameters(self, name: str, parameters: List[Any]) -> None:
+        if self.peek() == ("punct", ")"):
+            return
+        while True:
+            kind, token = self.peek()
+            if kind == "number":
+                parameters.append(int(self.take("number")))
+            elif kind == "string":
+                value = re.sub(r"\\(.)", r"\1", self.take("string")[1:-1])
+                if name.startswith("Enum"):
+                    number = None
+                    if self.accept("="):
+                        number = int(self.take("number"))
+                    parameters.append((value, number))
+                else:
+                    parameters.append(value)
+            else:
+                self.fail(f"unexpected {token or 'end of type'!r}")
+            if not self.accept(","):
+                return
+
+    def check(self, name: str, arguments: List[ClickhouseType], parameters: List):
+        arity = _WRAPPERS.get(name, 0)
+        if name == "Tuple":
+            if not arguments:
+                self.fail("Tuple needs at least one element")
+            if parameters and len(parameters) != len(arguments):
+                self.fail("either all or none of the Tuple elements are named")
+        elif len(arguments) != arity:
+            self.fail(f"{name} takes {arity} type argument(s)")
+
+        kinds = [type(p).__name__ for p in parameters]
+        if name == "FixedString":
+            if kinds not in ([], ["int"]) or (parameters and parameters[0] < 1):
+                self.fail("FixedString takes a positive length")
+        elif name == "DateTime":
+            if kinds not in ([], ["str"]):
+                self.fail("DateTime takes an optional time zone")
+        elif name == "DateTime64":
+            if kinds not in ([], ["int"], ["int", "str"]):
+                self.fail("DateTime64 takes a precision and an optional time zone")
+            if parameters and not 0 <= parameters[0] <= 9:
+                self.fail("DateTime64 precision must be between 0 and 9")
+        elif name == "Decimal":
+            if kinds not in (["int"], ["int", "int"]):
+                self.fail("Decimal takes a precision and an optional scale")
+            precision, scale = (parameters + [0])[:2]
+            if not 1 <= precision <= 76 or not 0 <= scale <= precision:
+                self.fail("Decimal precision must be 1 to 76 and scale 0 to precision")
+        elif name in _DECIMAL_PRECISION:
+            if kinds != ["int"] or not 0 <= parameters[0] <= _DECIMAL_PRECISION[name]:
+                self.fail(f"{name} takes a scale up to {_DECIMAL_PRECISION[name]}")
+        elif name in ("Enum8", "Enum16"):
+            if any(kind != "tuple" for kind in kinds):
+                self.fail(f"{name} takes 'name' = value pairs")
+
+
+@lru_cache(maxsize=1024)
+def parse_clickhouse_type(type_string: str) -> ClickhouseType:
+    """
+    Parse a ClickHouse column type.
+
+    Results are cached by string and interned, so repeated parsing is a dict
+    lookup and equal types are the same object.
+
+    Args:
+        type_string: ClickHouse type, e.g. ``Nullable(DateTime64(3, 'UTC'))``,
+            ``Decimal(18, 4)`` or ``Map(LowCardinality(String), Array(UInt64))``
+
+    Returns:
+        ClickhouseType: The parsed type
+
+    Raises:
+        ValueError: If the type cannot be parsed or is not a known type
+    """
+    return _Parser(str(type_string)).parse()
+
+
+def _erase(t: ClickhouseType) -> ClickhouseType:
+    """The type with its modifiers and scalar parameters removed."""
+    t = t.unwrapped()
+    if t.arguments:
+        arguments = tuple(_erase(a) for a in t.arguments)
+        return _intern(t.name, arguments, t.parameters if t.name == "Tuple" else ())
+    return _intern(t.name, (), ())
+
+
+# Compatibility matrix keyed by erased type, so that e.g. DateTime64(6, 'UTC')
+# or Nullable(LowCardinality(UInt8)) match the entries listed for them
+_ERASED_COMPATIBILITY = {
+    kafka_type: frozenset(
+        _erase(parse_clickhouse_type(str(t))) for t in clickhouse_types
+    )
+    for kafka_type, clickhouse_types in KAFKA_TO_CLICKHOUSE_COMPATIBILITY.items()
+}
+_MAPPED_TYPES = frozenset().union(*_ERASED_COMPATIBILITY.values())
+
+
+@lru_cache(maxsize=4096)
+def is_compatible(
+    kafka_type: KafkaDataType | str, clickhouse_type: ClickhouseType | str
+) -> bool:
+    """
+    Check whether values of a Kafka type can be written to a ClickHouse type.
+
+    ``Nullable`` and ``LowCardinality`` modifiers and the parameters of types
+    such as ``FixedString(16)`` or ``DateTime64(3)`` do not affect the result.
+    Type strings are matched case-insensitively; unknown types are not
+    compatible with anything.
+    """
+    try:
+        kafka_type = KafkaDataType(kafka_type)
+        if not isinstance(clickhouse_type, ClickhouseType):
+            clickhouse_type = parse_clickhouse_type(clickhouse_type)
+    except ValueError:
+        return False
+    return _erase(clickhouse_type) in _ERASED_COMPATIBILITY[kafka_type]
+
+
+def clickhouse_column_type(
+    value: Any, info: ValidationInfo
+) -> ClickhouseDataType | str:
+    """
+    Validate the ClickHouse type of a sink column.
+
+    Types that no Kafka type maps to, e.g. ``Decimal(18, 4)`` or ``IPv4``, are
+    rejected unless the data is validated with ``ANY_COLUMN_TYPE_CONTEXT`` or
+    ``TRUSTED_CONTEXT``.
+
+    Returns:
+        ClickhouseDataType | str: The enum member of the type when there is
+            one, else the canonical spelling of the type
+
+    Raises:
+        ValueError: If the value is not a valid ClickHouse type, or not one a
+            Kafka type maps to
+    """
+    if isinstance(value, ClickhouseDataType):
+        return value
+    if not isinstance(value, str):
+        raise ValueError(
+            f"ClickHouse type must be a string, not {type(value).__name__}"
+        )
+    try:
+        return ClickhouseDataType(value)
+    except ValueError:
+        pass
+    parsed = parse_clickhouse_type(value)
+    if _erase(parsed) not in _MAPPED_TYPES and not allows_any_column_type(info):
+        raise ValueError(
+            f"ClickHouse type '{parsed}' is not supported in sink mappings"
+        )
+    return str(parsed)
+
+
+# A ClickhouseDataType, or any other ClickHouse type string a Kafka type maps
+# to in its canonical spelling, e.g. DateTime64(6, 'UTC'), reported as a single
+# error when invalid. The schema lists the enum members.
+ClickhouseColumnType = Annotated[
+    Union[ClickhouseDataType, str],
+    PlainValidator(clickhouse_column_type),
+    WithJsonSchema(
+        {
+            "anyOf": [
+                {"enum": [t.value for t in ClickhouseDataType], "type": "string"},
+                {
+                    "type": "string",
+                    "description": "Parametric variant of a listed type, e.g. "
+                    "DateTime64(6, 'UTC') or Nullable(String)",
+                },
+            ]
+        }
+    ),
+]
@@ -34,7 +34,12 @@ class GlassFlowConfig(BaseModel):
             if "analytics" in config:
                 self.analytics = AnalyticsSettings(**config["analytics"])
         else:
-            self.write()
+            try:
+                self.write()
+            except OSError:
+                # e.g. a read-only home directory in a container; the defaults
+                # still apply, the analytics distinct_id is just not persisted
+                pass
 
     def write(self):
         if not os.path.exists(self.config_file.parent):
@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+from typing import Dict, FrozenSet
+
 from .base import CaseInsensitiveStrEnum
 
 
@@ -170,3 +174,11 @@ kafka_to_clickhouse_data_type_mappings = {
         ClickhouseDataType.ARRAY_MAP_STRING_STRING,
     ],
 }
+
+# Compatible ClickHouse types of each Kafka type, as frozensets for O(1) lookups.
+KAFKA_TO_CLICKHOUSE_COMPATIBILITY: Dict[
+    KafkaDataType, FrozenSet[ClickhouseDataType]
+] = {
+    kafka_type: frozenset(clickhouse_types)
+    for kafka_type, clickhouse_types in kafka_to_clickhouse_data_type_mappings.items()
+}
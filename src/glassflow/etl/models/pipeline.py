@@ -1,9 +1,27 @@
+import hashlib
 import re
-from typing import List, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
 
-from .base import CaseInsensitiveStrEnum
+from .. import jsonlib
+from .base import TRUSTED_CONTEXT, CaseInsensitiveStrEnum, is_trusted
 from .metadata import MetadataConfig
 from .resources import PipelineResourcesConfig
 from .sink import SinkConfig, SinkConfigPatch
@@ -34,6 +52,142 @@ class PipelineVersion(CaseInsensitiveStrEnum):
     V3 = "v3"
 
 
+class _SourceIndex:
+    """Sources of a pipeline config by ID, with their schema field names."""
+
+    def __init__(self, sources: List[SourceConfig]):
+        self.by_id: Dict[str, SourceConfig] = {}
+        self.has_otlp = False
+        duplicates = []
+        for src in sources:
+            self.has_otlp = self.has_otlp or isinstance(src, OTLPSource)
+            if src.source_id in self.by_id:
+                duplicates.append(src.source_id)
+                continue
+            self.by_id[src.source_id] = src
+        self.duplicates: List[str] = list(dict.fromkeys(duplicates))
+        self._field_names: Dict[str, Optional[Set[str]]] = {}
+
+    def field_names(self, source_id: str) -> Optional[Set[str]]:
+        """Schema field names of a Kafka source, or None when it has no schema."""
+        if source_id not in self._field_names:
+            src = self.by_id.get(source_id)
+            names = None
+            if isinstance(src, KafkaSource) and src.schema_fields is not None:
+                names = {f.name for f in src.schema_fields}
+            self._field_names[source_id] = names
+        return self._field_names[source_id]
+
+
+# Errors are (path, message) pairs, the path being the dotted location of the
+# offending value in the config, e.g. "transforms.2.source_id"
+_ConfigIssue = Tuple[str, str]
+
+
+def _sources_errors(
+    config: "PipelineConfig", index: _SourceIndex
+) -> List[_ConfigIssue]:
+    errors = []
+    if not config.sources:
+        errors.append(("sources", "At least one source is required"))
+    if index.duplicates:
+        # Position of the second occurrence of the first duplicated ID
+        seen: Set[str] = set()
+        first = 0
+        for i, src in enumerate(config.sources):
+            if src.source_id in seen:
+                first = i
+                break
+            seen.add(src.source_id)
+        errors.append(
+            (
+                f"sources.{first}.source_id",
+                f"Duplicate source_id(s) found: {set(index.duplicates)}",
+            )
+        )
+    return errors
+
+
+def _join_errors(config: "PipelineConfig", index: _SourceIndex) -> List[_ConfigIssue]:
+    join = config.join
+    if join is None or not join.enabled:
+        return []
+    errors = []
+    if index.has_otlp:
+        errors.append(("join.enabled", "join.enabled must be False for OTLP pipelines"))
+    for side, join_src in (
+        ("left_source", join.left_source),
+        ("right_source", join.right_source),
+    ):
+        if join_src is None:
+            continue
+        if join_src.source_id not in index.by_id:
+            errors.append(
+                (
+                    f"join.{side}.source_id",
+                    f"Join {side} '{join_src.source_id}' does not match any source",
+                )
+            )
+            continue
+        field_names = index.field_names(join_src.source_id)
+        if field_names is not None and join_src.key not in field_names:
+            errors.append(
+                (
+                    f"join.{side}.key",
+                    f"Join key '{join_src.key}' does not exist in source "
+                    f"'{join_src.source_id}' schema_fields",
+                )
+            )
+    return errors
+
+
+def _transforms_errors(
+    config: "PipelineConfig", index: _SourceIndex
+) -> List[_ConfigIssue]:
+    errors = []
+    for i, transform in enumerate(config.transforms or ()):
+        if transform.source_id not in index.by_id:
+            errors.append(
+                (
+                    f"transforms.{i}.source_id",
+                    f"Transform source_id '{transform.source_id}' "
+                    "does not match any source",
+                )
+            )
+            continue
+        if isinstance(transform, DedupTransform):
+            field_names = index.field_names(transform.source_id)
+            if field_names is not None and transform.config.key not in field_names:
+                errors.append(
+                    (
+                        f"transforms.{i}.config.key",
+                        f"Dedup key '{transform.config.key}' not found "
+                        f"in schema_fields of source "
+                        f"'{transform.source_id}'",
+                    )
+                )
+    return errors
+
+
+# Cross-reference checks with the config sections they read. After a patch,
+# only the checks reading a patched section need to run again.
+_CHECKS: Tuple[Tuple[FrozenSet[str], Callable[..., List[_ConfigIssue]]], ...] = (
+    (frozenset({"sources"}), _sources_errors),
+    (frozenset({"sources", "join"}), _join_errors),
+    (frozenset({"sources", "transforms"}), _transforms_errors),
+)
+
+
+def _raise_config_errors(errors: List[str]) -> None:
+    if len(errors) == 1:
+        raise ValueError(errors[0])
+    if errors:
+        raise ValueError(
+            f"{len(errors)} errors in pipeline config:\n"
+            + "\n".join(f"  - {error}" for error in errors)
+        )
+
+
 class PipelineConfig(BaseModel):
     version: PipelineVersion = Field(default=PipelineVersion.V3)
     pipeline_id: str
@@ -82,84 +236,128 @@ class PipelineConfig(BaseModel):
         return v
 
     @model_validator(mode="after")
-    def validate_config(self) -> "PipelineConfig":
+    def validate_config(self, info: ValidationInfo) -> "PipelineConfig":
         if self.name is None:
             self.name = self.pipeline_id.replace("-", " ").title()
 
-        # Validate sources list is non-empty
-        if not self.sources:
-            raise ValueError("At least one source is required")
-
-        # Validate source_id uniqueness
-        source_id_list = [src.source_id for src in self.sources]
-        if len(source_id_list) != len(set(source_id_list)):
-            duplicates = {
-                sid for sid in source_id_list if source_id_list.count(sid) > 1
-            }
-            raise ValueError(f"Duplicate source_id(s) found: {duplicates}")
-
-        # Build the set of valid source identifiers from sources list
-        source_ids = set(source_id_list)
-        has_otlp = any(isinstance(src, OTLPSource) for src in self.sources)
-
-        if has_otlp and self.join and self.join.enabled:
-            raise ValueError("join.enabled must be False for OTLP pipelines")
-
-        # Validate join source references
-        if self.join and self.join.enabled:
-            if self.join.left_source:
-                if self.join.left_source.source_id not in source_ids:
-                    raise ValueError(
-                        f"Join left_source '{self.join.left_source.source_id}' "
-                        "does not match any source"
-                    )
-            if self.join.right_source:
-                if self.join.right_source.source_id not in source_ids:
-                    raise ValueError(
-                        f"Join right_source '{self.join.right_source.source_id}' "
-                        "does not match any source"
-                    )
+        if is_trusted(info):
+            return self
 
-        # Validate transform source_id references
-        if self.transforms:
-            for transform in self.transforms:
-                if transform.source_id not in source_ids:
-                    raise ValueError(
-                        f"Transform source_id '{transform.source_id}' "
-                        "does not match any source"
-                    )
+        _raise_config_errors(self.config_errors())
+        return self
 
-        # Validate dedup keys against source schema_fields (Kafka only)
-        if self.transforms:
-            source_by_id = {src.source_id: src for src in self.sources}
-            for transform in self.transforms:
-                if isinstance(transform, DedupTransform):
-                    src = source_by_id.get(transform.source_id)
-                    if isinstance(src, KafkaSource) and src.schema_fields is not None:
-                        field_names = {f.name for f in src.schema_fields}
-                        if transform.config.key not in field_names:
-                            raise ValueError(
-                                f"Dedup key '{transform.config.key}' not found "
-                                f"in schema_fields of source "
-                                f"'{transform.source_id}'"
-                            )
-
-        # Validate join keys against source schema_fields (Kafka only)
-        if self.join and self.join.enabled:
-            source_by_id = {src.source_id: src for src in self.sources}
-            for join_src in [self.join.left_source, self.join.right_source]:
-                if join_src is None:
-                    continue
-                src = source_by_id.get(join_src.source_id)
-                if isinstance(src, KafkaSource) and src.schema_fields is not None:
-                    field_names = {f.name for f in src.schema_fields}
-                    if join_src.key not in field_names:
-                        raise ValueError(
-                            f"Join key '{join_src.key}' does not exist in source "
-                            f"'{join_src.source_id}' schema_fields"
-                        )
+    def config_errors(self, sections: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Check the references between sources, transforms and the join.
+
+        The sources are indexed once per call by ID, with the schema field names
+        of each Kafka source collected on first use, so the checks take linear
+        time in the size of the config and see any change made in place since
+        the last call. Every problem is reported, not only the first.
+
+        Args:
+            sections: Only run the checks reading one of these sections, e.g.
+                the sections changed by a patch; all checks run by default
+
+        Returns:
+            List[str]: Error messages, empty when the config is consistent
+        """
+        return [message for _, message in self.config_issues(sections)]
+
+    def config_issues(
+        self, sections: Optional[Iterable[str]] = None
+    ) -> List[_ConfigIssue]:
+        """
+        Check the config like ``config_errors``, locating each error.
+
+        Returns:
+            List[Tuple[str, str]]: ``(path, message)`` pairs, the path being the
+                dotted location of the offending value, e.g.
+                ``"transforms.2.source_id"``
+        """
+        if sections is not None:
+            sections = set(sections)
+            unknown = sections - set(type(self).model_fields)
+            if unknown:
+                raise ValueError(f"Unknown config section(s): {sorted(unknown)}")
+        errors: List[_ConfigIssue] = []
+        index = None
+        for reads, check in _CHECKS:
+            if sections is not None and reads.isdisjoint(sections):
+                continue
+            if index is None:
+                index = _SourceIndex(self.sources)
+            errors.extend(check(self, index))
+        return errors
 
-        return self
+    @classmethod
+    def model_validate_trusted(cls, data: Any) -> "PipelineConfig":
+        """
+        Build a config without its cross-reference checks.
+
+        Field types, the source and transform unions and the normalizing
+        validators still apply, but the checks between sources, transforms and
+        the join are skipped, e.g. to run them separately with
+        ``config_issues``. It costs about as much as ``model_validate``.
+
+        Args:
+            data: Pipeline config as returned by the API
+
+        Returns:
+            PipelineConfig: The pipeline config
+        """
+        return cls.model_validate(data, context=TRUSTED_CONTEXT)
+
+    def canonical_json(self) -> bytes:
+        """
+        Serialize the config in a canonical form.
+
+        Keys are sorted, enums are written with their canonical values whatever
+        the casing they were given in, and defaults are written out, so equal
+        configs always give the same bytes.
+        """
+        return jsonlib.dumps(self.model_dump(mode="json"), sort_keys=True)
+
+    def section_fingerprint(self, section: str) -> str:
+        """
+        Fingerprint of one top-level section of the config, e.g. ``"sink"``.
+
+        It is computed from the current value of the section on every call, so
+        changes made in place, e.g. ``config.sink.table = "t"``, are reflected.
+
+        Args:
+            section: Name of a field of the config
+
+        Returns:
+            str: SHA-256 hex digest of the canonical JSON of the section
+        """
+        if section not in type(self).model_fields:
+            raise ValueError(f"Unknown config section: {section!r}")
+        return self._fingerprints([section])[0]
+
+    def fingerprint(self) -> str:
+        """
+        Stable fingerprint of the whole config.
+
+        Equal configs have equal fingerprints, so they can be compared or used
+        as cache keys without comparing their dumps. It is derived from the
+        fingerprint of every section; see ``section_fingerprint``.
+
+        Returns:
+            str: SHA-256 hex digest
+        """
+        sections = sorted(type(self).model_fields)
+        digest = hashlib.sha256()
+        for section, section_digest in zip(sections, self._fingerprints(sections)):
+            digest.update(f"{section}={section_digest};".encode())
+        return digest.hexdigest()
+
+    def _fingerprints(self, sections: List[str]) -> List[str]:
+        dumped = self.model_dump(mode="json", include=set(sections))
+        return [
+            hashlib.sha256(jsonlib.dumps(dumped[section], sort_keys=True)).hexdigest()
+            for section in sections
+        ]
 
     def _has_deduplication_enabled(self) -> bool:
         """Check if the pipeline has any dedup transforms."""
@@ -167,9 +365,30 @@ class PipelineConfig(BaseModel):
             return False
         return any(isinstance(t, DedupTransform) for t in self.transforms)
 
-    def update(self, config_patch: "PipelineConfigPatch") -> "PipelineConfig":
-        """Apply a patch configuration to this pipeline configuration."""
-        updated_config = self.model_copy(deep=True)
+    def update(
+        self, config_patch: "PipelineConfigPatch", validate: bool = False
+    ) -> "PipelineConfig":
+        """
+        Apply a patch configuration to this pipeline configuration.
+
+        The config is not modified. The returned config shares every section
+        the patch leaves unchanged with it, copying only the patched branches,
+        so neither config should be mutated in place afterwards.
+
+        Args:
+            config_patch: Patch to apply
+            validate: Whether to check the patched config. Only the checks
+                reading a section set in the patch run, so small patches are
+                checked in time independent of the size of the config.
+
+        Returns:
+            PipelineConfig: The patched config
+
+        Raises:
+            ValueError: If ``validate`` is True and the patched config is not
+                consistent
+        """
+        updated_config = self.model_copy()
 
         if config_patch.name is not None:
             updated_config.name = config_patch.name
@@ -196,6 +415,17 @@ class PipelineConfig(BaseModel):
         if config_patch.sources is not None:
             updated_config.sources = config_patch.sources
 
+        if validate:
+            if config_patch.join is not None and updated_config.join is not None:
+                # Runs the checks of the join on its own fields
+                JoinConfig.model_validate(updated_config.join.model_dump())
+            sections = [
+                name
+                for name in type(config_patch).model_fields
+                if getattr(config_patch, name) is not None
+            ]
+            _raise_config_errors(updated_config.config_errors(sections))
+
         return updated_config
 
 
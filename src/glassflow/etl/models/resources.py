@@ -17,7 +17,7 @@ class JetStreamResources(BaseModel):
                 "nats.stream are immutable and cannot be changed after pipeline "
                 "creation."
             )
-        return self.model_copy(deep=True)
+        return self
 
 
 class NATSResources(BaseModel):
@@ -25,7 +25,7 @@ class NATSResources(BaseModel):
 
     def update(self, patch: "NATSResources") -> "NATSResources":
         """Apply a patch to this jetstream resources config."""
-        updated_config = self.model_copy(deep=True)
+        updated_config = self.model_copy()
         if patch.stream is not None:
             updated_config.stream = (
                 updated_config.stream or JetStreamResources()
@@ -39,7 +39,7 @@ class Resources(BaseModel):
 
     def update(self, patch: "Resources") -> "Resources":
         """Apply a patch to this resources config."""
-        updated_config = self.model_copy(deep=True)
+        updated_config = self.model_copy()
         if patch.memory is not None:
             updated_config.memory = patch.memory
         if patch.cpu is not None:
@@ -57,7 +57,7 @@ class StorageResources(BaseModel):
                 "Cannot update pipeline resources: 'size' in transform.storage is "
                 "immutable and cannot be changed after pipeline creation."
             )
-        return self.model_copy(deep=True)
+        return self
 
 
 class SourceResourceEntry(BaseModel):
@@ -86,7 +86,7 @@ class SinkResources(BaseModel):
 
     def update(self, patch: "SinkResources") -> "SinkResources":
         """Apply a patch to this sink resources config."""
-        updated_config = self.model_copy(deep=True)
+        updated_config = self.model_copy()
         if patch.replicas is not None:
             updated_config.replicas = patch.replicas
         if patch.requests is not None:
@@ -108,7 +108,7 @@ class PipelineResourcesConfig(BaseModel):
 
     def update(self, patch: "PipelineResourcesConfig") -> "PipelineResourcesConfig":
         """Apply a patch to this pipeline resources config."""
-        updated_config = self.model_copy(deep=True)
+        updated_config = self.model_copy()
 
         if patch.nats is not None:
             updated_config.nats = (updated_config.nats or NATSResources()).update(
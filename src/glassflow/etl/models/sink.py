@@ -3,7 +3,7 @@ from typing import List, Optional
 from pydantic import BaseModel, Field
 
 from .base import CaseInsensitiveStrEnum
-from .data_types import ClickhouseDataType
+from .clickhouse_types import ClickhouseColumnType
 
 
 class SinkType(CaseInsensitiveStrEnum):
@@ -26,7 +26,7 @@ class ClickhouseConnectionParams(BaseModel):
         self, patch: "ClickhouseConnectionParamsPatch"
     ) -> "ClickhouseConnectionParams":
         """Apply a patch to this connection params config."""
-        update_dict = self.model_copy(deep=True)
+        update_dict = self.model_copy()
 
         if patch.host is not None:
             update_dict.host = patch.host
@@ -55,7 +55,9 @@ class SinkFieldMapping(BaseModel):
 
     name: str
     column_name: str
-    column_type: ClickhouseDataType
+    # Types without a ClickhouseDataType member, e.g. DateTime64(6, 'UTC'), are
+    # kept as strings in their canonical spelling
+    column_type: ClickhouseColumnType
 
 
 class SinkConfig(BaseModel):
@@ -69,7 +71,7 @@ class SinkConfig(BaseModel):
 
     def update(self, patch: "SinkConfigPatch") -> "SinkConfig":
         """Apply a patch to this sink config."""
-        update_dict = self.model_copy(deep=True)
+        update_dict = self.model_copy()
 
         if patch.connection_params is not None:
             update_dict.connection_params = self.connection_params.update(
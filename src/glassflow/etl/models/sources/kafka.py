@@ -2,9 +2,9 @@
 
 from typing import Any, List, Literal, Optional
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, ValidationInfo, model_validator
 
-from ..base import CaseInsensitiveStrEnum
+from ..base import CaseInsensitiveStrEnum, is_trusted
 from ..data_types import KafkaDataType
 from ..source import SourceBaseConfig, SourceBaseConfigPatch, SourceType
 
@@ -66,10 +66,7 @@ class KafkaConnectionParams(BaseModel):
 
     def update(self, patch: "KafkaConnectionParamsPatch") -> "KafkaConnectionParams":
         """Apply a patch to this connection params config."""
-        current_dict = self.model_dump()
-        patch_dict = patch.model_dump(exclude_none=True)
-        merged_dict = {**current_dict, **patch_dict}
-        return KafkaConnectionParams.model_validate(merged_dict)
+        return self.model_copy(update=patch.model_dump(exclude_none=True))
 
 
 class KafkaSource(SourceBaseConfig):
@@ -96,8 +93,12 @@ class KafkaSource(SourceBaseConfig):
         return data
 
     @model_validator(mode="after")
-    def validate_schema_registry_requires_version(self) -> "KafkaSource":
+    def validate_schema_registry_requires_version(
+        self, info: ValidationInfo
+    ) -> "KafkaSource":
         """Validate that schema_version is set when schema_registry is provided."""
+        if is_trusted(info):
+            return self
         if self.schema_registry is not None and self.schema_version is None:
             raise ValueError(
                 "schema_version is required when schema_registry is provided"
@@ -106,7 +107,7 @@ class KafkaSource(SourceBaseConfig):
 
     def update(self, patch: "KafkaSourcePatch") -> "KafkaSource":
         """Apply a patch to this source config."""
-        update_dict = self.model_copy(deep=True)
+        update_dict = self.model_copy()
 
         if patch.connection_params is not None:
             update_dict.connection_params = self.connection_params.update(
@@ -1,8 +1,8 @@
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, ValidationInfo, model_validator
 
-from ..base import CaseInsensitiveStrEnum
+from ..base import CaseInsensitiveStrEnum, is_trusted
 
 
 class JoinOutputField(BaseModel):
@@ -35,9 +35,9 @@ class JoinConfig(BaseModel):
     output_fields: Optional[List[JoinOutputField]] = Field(default=None)
 
     @model_validator(mode="after")
-    def validate_enabled_fields(self) -> "JoinConfig":
+    def validate_enabled_fields(self, info: ValidationInfo) -> "JoinConfig":
         """Validate required fields when join is enabled."""
-        if not self.enabled:
+        if not self.enabled or is_trusted(info):
             return self
         if not self.type:
             raise ValueError("type is required when join is enabled")
@@ -51,7 +51,7 @@ class JoinConfig(BaseModel):
 
     def update(self, patch: "JoinConfigPatch") -> "JoinConfig":
         """Apply a patch to this join config."""
-        update_dict = self.model_copy(deep=True)
+        update_dict = self.model_copy()
 
         if patch.enabled is not None:
             update_dict.enabled = patch.enabled
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import yaml
 from httpx._models import Response
 
-from . import errors, models
+from . import config_io, errors, models
 from .api_client import APIClient
 from .dlq import DLQ
 
+if TYPE_CHECKING:
+    from .local import DryRunReport
+    from .sinks import RedriveSink
+
 
 class Pipeline(APIClient):
     """
@@ -41,6 +43,8 @@ class Pipeline(APIClient):
         if pipeline_id is not None:
             self.pipeline_id = pipeline_id
 
+        # Config returned by the API, kept unvalidated until first accessed
+        self._raw_config: dict[str, Any] | None = None
         if config is not None:
             if isinstance(config, dict):
                 self.config = models.PipelineConfig.model_validate(config)
@@ -50,12 +54,28 @@ class Pipeline(APIClient):
         else:
             self.config = None
 
-        self._dlq = DLQ(pipeline_id=self.pipeline_id, host=host)
+        self._dlq = DLQ(
+            pipeline_id=self.pipeline_id, host=host, http_client=self.http_client
+        )
         self.status: models.PipelineStatus | None = None
 
+    @property
+    def config(self) -> models.PipelineConfig | None:
+        """Pipeline configuration, validated on first access when fetched lazily."""
+        if self._raw_config is not None:
+            self._config = models.PipelineConfig.model_validate(self._raw_config)
+            self._raw_config = None
+        return self._config
+
+    @config.setter
+    def config(self, config: models.PipelineConfig | None) -> None:
+        self._config = config
+        self._raw_config = None
+
     def get(
         self,
         schema_versions: dict[str, str] | None = None,
+        lazy: bool = False,
     ) -> Pipeline:
         """Fetch a pipeline by its ID.
 
@@ -65,6 +85,10 @@ class Pipeline(APIClient):
                 versions instead of the latest ones.
                 Format: ``{"sourceId": "versionId"}``.
                 Only applies to sources that use a schema registry.
+            lazy: Whether to defer building the config until ``config`` is first
+                accessed, for tooling that only needs the status or the ID. The
+                config is then fully validated on first access, which raises
+                if it is not valid.
 
         Returns:
             Pipeline: A Pipeline instance for the given ID
@@ -85,9 +109,16 @@ class Pipeline(APIClient):
             event_name="PipelineGet",
             **kwargs,
         )
-        self.config = models.PipelineConfig.model_validate(response.json())
+        data = response.json()
+        if lazy:
+            self._config = None
+            self._raw_config = data
+        else:
+            self.config = models.PipelineConfig.model_validate(data)
         self.health()
-        self._dlq = DLQ(pipeline_id=self.pipeline_id, host=self.host)
+        self._dlq = DLQ(
+            pipeline_id=self.pipeline_id, host=self.host, http_client=self.http_client
+        )
         return self
 
     def create(self) -> Pipeline:
@@ -291,8 +322,7 @@ class Pipeline(APIClient):
         Args:
             yaml_path: Path to the YAML file
         """
-        with open(yaml_path, "w") as f:
-            yaml.dump(self.to_dict(), f, default_flow_style=False)
+        config_io.write_yaml(yaml_path, self.to_dict())
 
     def to_json(self, json_path: str) -> None:
         """Save the pipeline configuration to a JSON file.
@@ -300,8 +330,7 @@ class Pipeline(APIClient):
         Args:
             json_path: Path to the JSON file
         """
-        with open(json_path, "w") as f:
-            json.dump(self.to_dict(), f, indent=4)
+        config_io.write_json(json_path, self.to_dict())
 
     @classmethod
     def from_yaml(cls, yaml_path: str, host: str | None = None) -> Pipeline:
@@ -314,9 +343,7 @@ class Pipeline(APIClient):
         Returns:
             Pipeline: A Pipeline instance for the created pipeline
         """
-        with open(yaml_path, "r") as f:
-            config = yaml.safe_load(f)
-        return cls(config=config, host=host)
+        return cls(config=config_io.read_yaml(yaml_path), host=host)
 
     @classmethod
     def from_json(cls, json_path: str, host: str | None = None) -> Pipeline:
@@ -329,9 +356,7 @@ class Pipeline(APIClient):
         Returns:
             Pipeline: A Pipeline instance for the created pipeline
         """
-        with open(json_path, "r") as f:
-            config = json.load(f)
-        return cls(config=config, host=host)
+        return cls(config=config_io.read_json(json_path), host=host)
 
     @staticmethod
     def validate_config(config: dict[str, Any]) -> bool:
@@ -351,6 +376,40 @@ class Pipeline(APIClient):
         models.PipelineConfig.model_validate(config)
         return True
 
+    def dry_run(
+        self,
+        inputs: dict[str, Any],
+        sink: RedriveSink | str | None = None,
+        time_field: str | None = None,
+        batch_size: int = 1000,
+    ) -> DryRunReport:
+        """Run the pipeline configuration locally over recorded events.
+
+        Nothing is sent to the GlassFlow API; see ``local.PipelineDryRun``.
+
+        Args:
+            inputs: Events of each source, keyed by source ID, as the path of a
+                JSONL or Parquet file or an iterable of event dicts
+            sink: Destination of the insert batches, or the path of a file they
+                are appended to as JSON lines
+            time_field: Field holding the event time
+            batch_size: Number of events read and processed together
+
+        Returns:
+            DryRunReport: Per-stage counters and timings
+
+        Raises:
+            ValueError: If the pipeline has no configuration
+        """
+        from .local import PipelineDryRun
+
+        if self.config is None:
+            raise ValueError("A pipeline configuration is required for a dry run")
+        runner = PipelineDryRun(
+            self.config, sink=sink, time_field=time_field, batch_size=batch_size
+        )
+        return runner.run(inputs)
+
     @property
     def dlq(self) -> DLQ:
         """Get the DLQ (Dead Letter Queue) client for this pipeline.
@@ -366,7 +425,8 @@ class Pipeline(APIClient):
 
     def _tracking_info(self) -> dict[str, Any]:
         """Get information about the active pipeline."""
-        if self.config is None:
+        # A lazily fetched config is not built just to be tracked
+        if self._raw_config is not None or self.config is None:
             tracking_info = {"pipeline_id": self.pipeline_id}
         else:
             # Determine source types
@@ -417,6 +477,8 @@ class Pipeline(APIClient):
         return tracking_info
 
     def _track_event(self, event_name: str, **kwargs: Any) -> None:
+        if not self._tracking.enabled:
+            return
         pipeline_properties = self._tracking_info()
         properties = {**pipeline_properties, **kwargs}
         super()._track_event(event_name, **properties)
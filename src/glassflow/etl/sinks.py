@@ -0,0 +1,85 @@
+"""Sinks receiving batches of payloads from a DLQ redrive or a local run."""
+
+from __future__ import annotations
+
+import abc
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, List
+
+from . import jsonlib
+
+
+class RedriveSink(abc.ABC):
+    """
+    Destination of batches of payloads, such as redriven DLQ messages or the
+    rows of a local dry run.
+
+    ``write`` may be called from several threads at once when more than one
+    batch is allowed in flight.
+    """
+
+    @abc.abstractmethod
+    def write(self, batch: List[Any]) -> None:
+        """Write a batch of payloads, returning once it is durably accepted."""
+
+    def close(self) -> None:  # noqa: B027 - optional, most sinks hold nothing
+        """Release the resources held by the sink."""
+
+
+class CallableSink(RedriveSink):
+    """Sink that forwards each batch to a callable, e.g. a Kafka producer."""
+
+    def __init__(self, func: Callable[[List[Any]], Any]):
+        self.func = func
+
+    def write(self, batch: List[Any]) -> None:
+        self.func(batch)
+
+
+class InMemorySink(RedriveSink):
+    """Sink that keeps every batch in memory, mostly useful for testing."""
+
+    def __init__(self):
+        self.batches: List[List[Any]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def payloads(self) -> List[Any]:
+        """All payloads written so far, in write order."""
+        with self._lock:
+            return [payload for batch in self.batches for payload in batch]
+
+    def write(self, batch: List[Any]) -> None:
+        with self._lock:
+            self.batches.append(list(batch))
+
+
+class FileSink(RedriveSink):
+    """Sink that appends payloads to a file, one JSON document per line."""
+
+    def __init__(self, path: str | os.PathLike, fsync: bool = True):
+        self.path = Path(path)
+        self.fsync = fsync
+        self._file = open(self.path, "ab")
+        self._lock = threading.Lock()
+
+    def write(self, batch: List[Any]) -> None:
+        data = b"".join(_encode_payload(payload) + b"\n" for payload in batch)
+        with self._lock:
+            self._file.write(data)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _encode_payload(payload: Any) -> bytes:
+    if isinstance(payload, bytes):
+        return payload
+    if isinstance(payload, str):
+        return payload.encode("utf-8")
+    return jsonlib.dumps(payload)
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Union
+
+from pydantic import BaseModel, Field, ValidationError, computed_field
+
+from . import config_io, jsonlib
+from .models import PipelineConfig
+
+CONFIG_SUFFIXES = (".yaml", ".yml", ".json")
+
+# Below this number of files the cost of starting worker processes outweighs
+# the validation itself
+_MIN_FILES_PER_WORKER = 8
+
+
+class ConfigIssue(BaseModel):
+    """A single problem found in a pipeline config file."""
+
+    path: str = ""
+    loc: List[Union[str, int]] = Field(default_factory=list)
+    message: str
+    type: str
+
+
+class ConfigFileResult(BaseModel):
+    """Validation result of a single pipeline config file."""
+
+    file: str
+    pipeline_id: Optional[str] = None
+    errors: List[ConfigIssue] = Field(default_factory=list)
+
+    @computed_field
+    @property
+    def valid(self) -> bool:
+        """Whether the file holds a valid pipeline config."""
+        return not self.errors
+
+
+class ConfigValidationReport(BaseModel):
+    """Result of validating many pipeline config files, in input order."""
+
+    results: List[ConfigFileResult] = Field(default_factory=list)
+    elapsed: float = 0.0
+
+    @computed_field
+    @property
+    def valid(self) -> bool:
+        """Whether every file holds a valid pipeline config."""
+        return all(result.valid for result in self.results)
+
+    @property
+    def invalid(self) -> List[ConfigFileResult]:
+        """Results of the files with at least one error."""
+        return [result for result in self.results if not result.valid]
+
+    @computed_field
+    @property
+    def error_count(self) -> int:
+        """Number of errors across every file."""
+        return sum(len(result.errors) for result in self.results)
+
+    def to_text(self) -> str:
+        """Render the errors as ``file:path: message`` lines, e.g. for CI logs."""
+        lines = [
+            f"{result.file}:{issue.path}: {issue.message}"
+            if issue.path
+            else f"{result.file}: {issue.message}"
+            for result in self.results
+            for issue in result.errors
+        ]
+        lines.append(
+            f"{len(self.results)} file(s) checked, {len(self.invalid)} invalid, "
+            f"{self.error_count} error(s)"
+        )
+        return "\n".join(lines)
+
+
+def _located_loc(data: Any, loc: tuple) -> List[Union[str, int]]:
+    # Drop the tags pydantic adds to the location of errors inside tagged
+    # unions, e.g. ("sources", 1, "kafka", "topic"), by walking the input:
+    # a key missing from its parent is a tag unless the error is about it
+    located: List[Union[str, int]] = []
+    node = data
+    for i, element in enumerate(loc):
+        if isinstance(node, dict):
+            if element not in node and i < len(loc) - 1:
+                continue
+            node = node.get(element)
+        elif isinstance(node, list) and isinstance(element, int):
+            node = node[element] if -len(node) <= element < len(node) else None
+        else:
+            node = None
+        located.append(element)
+    return located
+
+
+def _path_loc(path: str) -> List[Union[str, int]]:
+    return [int(part) if part.isdigit() else part for part in path.split(".")]
+
+
+def _validation_issues(data: Any, exc: ValidationError) -> List[ConfigIssue]:
+    issues = []
+    for error in exc.errors(include_url=False):
+        if not error["loc"]:
+            # Raised by the cross-reference checks, which run once every field
+            # is valid; run them again to locate each error
+            located = _reference_issues(data)
+            if located:
+                issues.extend(located)
+                continue
+        loc = _located_loc(data, error["loc"])
+        issues.append(
+            ConfigIssue(
+                path=".".join(str(element) for element in loc),
+                loc=loc,
+                message=error["msg"],
+                type=error["type"],
+            )
+        )
+    return issues
+
+
+def _reference_issues(data: Any) -> List[ConfigIssue]:
+    try:
+        config = PipelineConfig.model_validate_trusted(data)
+    except ValidationError:
+        return []
+    return [
+        ConfigIssue(path=path, loc=_path_loc(path), message=message, type="reference")
+        for path, message in config.config_issues()
+    ]
+
+
+def validate_config_file(path: Union[str, os.PathLike]) -> ConfigFileResult:
+    """
+    Validate a single pipeline config file.
+
+    Every error is collected, each located by its dotted path in the config,
+    e.g. ``sources.1.topic``. Files ending in ``.json`` are read as JSON, all
+    others as YAML.
+
+    Args:
+        path: Path to the YAML or JSON config file
+
+    Returns:
+        ConfigFileResult: The errors found in the file, empty when it is valid
+    """
+    # Imported here as pyyaml is slow to import
+    import yaml
+
+    path = os.fspath(path)
+    try:
+        data = (
+            config_io.read_json(path)
+            if path.endswith(".json")
+            else config_io.read_yaml(path)
+        )
+    except OSError as e:
+        issue = ConfigIssue(message=str(e), type="read_error")
+        return ConfigFileResult(file=path, errors=[issue])
+    except (yaml.YAMLError, jsonlib.JSONDecodeError, UnicodeDecodeError) as e:
+        issue = ConfigIssue(message=str(e), type="parse_error")
+        return ConfigFileResult(file=path, errors=[issue])
+
+    pipeline_id = data.get("pipeline_id") if isinstance(data, dict) else None
+    result = ConfigFileResult(
+        file=path,
+        pipeline_id=pipeline_id if isinstance(pipeline_id, str) else None,
+    )
+    try:
+        PipelineConfig.model_validate(data)
+    except ValidationError as e:
+        result.errors = _validation_issues(data, e)
+    return result
+
+
+def find_config_files(paths: Iterable[Union[str, os.PathLike]]) -> List[str]:
+    """
+    Expand directories into the config files they contain, recursively.
+
+    Args:
+        paths: Config files and directories
+
+    Returns:
+        List[str]: Files in the given order, the files of each directory sorted
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(
+                sorted(
+                    str(p)
+                    for p in Path(path).rglob("*")
+                    if p.suffix in CONFIG_SUFFIXES and p.is_file()
+                )
+            )
+        else:
+            files.append(os.fspath(path))
+    return files
+
+
+class BulkConfigValidator:
+    """
+    Validates many pipeline config files at once, e.g. a whole repository in CI.
+
+    Files are read, parsed and validated on a process pool, so a run uses every
+    core instead of validating one file after another, and every error of every
+    file is collected instead of stopping at the first one.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """Initialize the BulkConfigValidator class.
+
+        Args:
+            max_workers: Number of worker processes; defaults to the number of
+                CPUs. With a single worker, or few files, the files are validated
+                in the calling process.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def validate(
+        self, paths: Iterable[Union[str, os.PathLike]]
+    ) -> ConfigValidationReport:
+        """
+        Validate config files.
+
+        Args:
+            paths: Config files and directories; directories are searched
+                recursively for ``.yaml``, ``.yml`` and ``.json`` files
+
+        Returns:
+            ConfigValidationReport: A result per file, in the order of ``paths``
+        """
+        started = time.perf_counter()
+        files = find_config_files(paths)
+        workers = min(self.max_workers, len(files) // _MIN_FILES_PER_WORKER)
+        if workers <= 1:
+            results = [validate_config_file(file) for file in files]
+        else:
+            chunksize = max(1, len(files) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(validate_config_file, files, chunksize=chunksize)
+                )
+        return ConfigValidationReport(
+            results=results, elapsed=time.perf_counter() - started
+        )
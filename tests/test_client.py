@@ -3,6 +3,7 @@ from unittest.mock import call, patch
 import pytest
 
 from glassflow.etl import errors
+from glassflow.etl.api_client import APIClient
 from glassflow.etl.client import Client
 from glassflow.etl.models import PipelineConfig
 from glassflow.etl.pipeline import Pipeline
@@ -18,6 +19,16 @@ class TestClient:
         assert client.host == "https://example.com"
         assert client.http_client.base_url == "https://example.com"
 
+    def test_client_tracking_can_be_patched_on_the_class(self):
+        with patch.object(APIClient, "_tracking") as tracking:
+            client = Client()
+            client.disable_usagestats()
+            client._track_event("TestEvent", key="value")
+
+        assert tracking.enabled is False
+        tracking.track_event.assert_called_once_with("TestEvent", {"key": "value"})
+        assert not isinstance(APIClient.__dict__["_tracking"], type(tracking))
+
     def test_client_get_pipeline_success(
         self, mock_success, get_pipeline_response, get_health_payload
     ):
@@ -0,0 +1,87 @@
+"""Tests for reading and writing pipeline config files."""
+
+import json
+import os
+
+import pytest
+import yaml
+
+from glassflow.etl import config_io, models
+
+
+@pytest.fixture
+def configs(valid_config, valid_config_without_joins):
+    return [
+        models.PipelineConfig.model_validate(valid_config),
+        models.PipelineConfig.model_validate(valid_config_without_joins),
+    ]
+
+
+class TestConfigIO:
+    """Tests for the config_io module."""
+
+    @pytest.mark.parametrize("suffix", [".yaml", ".json"])
+    def test_round_trip(self, tmp_path, valid_config, suffix):
+        """Test that a config written to a file reads back unchanged."""
+        path = tmp_path / f"config{suffix}"
+        if suffix == ".json":
+            config_io.write_json(path, valid_config)
+            assert config_io.read_json(path) == valid_config
+        else:
+            config_io.write_yaml(path, valid_config)
+            assert config_io.read_yaml(path) == valid_config
+
+    def test_json_format(self, tmp_path):
+        """Test that JSON files keep the 4-space, ASCII-escaped format."""
+        path = tmp_path / "config.json"
+        data = {"name": "Pipeline über", "tags": ["a"]}
+
+        config_io.write_json(path, data)
+
+        assert path.read_text() == json.dumps(data, indent=4)
+
+    @pytest.mark.parametrize("suffix", [".yaml", ".json", ".jsonl"])
+    def test_bundle_round_trip(self, tmp_path, configs, suffix):
+        """Test that bundles of every format read back unchanged."""
+        path = tmp_path / f"bundle{suffix}"
+
+        assert config_io.save_bundle(path, iter(configs)) == 2
+        assert list(config_io.load_bundle(path)) == configs
+
+    def test_yaml_bundle_is_read_lazily(self, tmp_path, valid_config):
+        """Test that YAML documents are parsed one at a time."""
+        path = tmp_path / "bundle.yaml"
+        path.write_text(yaml.safe_dump(valid_config) + "---\n[unclosed\n")
+
+        documents = config_io.iter_documents(path)
+
+        assert next(documents) == valid_config
+        with pytest.raises(yaml.YAMLError):
+            next(documents)
+
+    def test_yaml_document_with_list(self, tmp_path, valid_config):
+        """Test that a YAML document holding a list yields every item."""
+        path = tmp_path / "bundle.yml"
+        path.write_text(yaml.safe_dump([valid_config, valid_config]))
+
+        assert len(list(config_io.iter_documents(path))) == 2
+
+    def test_failed_write_keeps_file(self, tmp_path, valid_config):
+        """Test that a failed write leaves the previous file untouched."""
+        path = tmp_path / "bundle.yaml"
+        config_io.save_bundle(path, [valid_config])
+        os.chmod(path, 0o640)
+        content = path.read_bytes()
+
+        def failing():
+            yield valid_config
+            raise RuntimeError("interrupted")
+
+        with pytest.raises(RuntimeError):
+            config_io.save_bundle(path, failing())
+
+        assert path.read_bytes() == content
+        assert os.listdir(tmp_path) == ["bundle.yaml"]
+
+        config_io.save_bundle(path, [valid_config, valid_config])
+        assert os.stat(path).st_mode & 0o777 == 0o640
@@ -4,7 +4,7 @@ from unittest.mock import patch
 
 import pytest
 
-from glassflow.etl import DLQ, Pipeline, errors
+from glassflow.etl import DLQ, DLQMessage, Pipeline, errors
 from tests.data import error_scenarios, mock_responses
 
 
@@ -72,6 +72,34 @@ class TestDLQ:
             )
             assert result == []
 
+    def test_consume_messages_success(self, dlq):
+        """Test DLQ consume returning lazily decoded messages."""
+        mock_response = mock_responses.create_mock_response_factory()(
+            status_code=200,
+        )
+        mock_response.content = (
+            b'[{"component": "ingestor", "error": "invalid type",'
+            b' "original_message": "{\\"id\\": 1}"}]'
+        )
+        with patch("httpx.Client.request", return_value=mock_response) as mock_get:
+            result = dlq.consume_messages(batch_size=50)
+
+            mock_get.assert_called_once_with(
+                "GET", f"{dlq.endpoint}/consume", params={"batch_size": 50}
+            )
+            assert len(result) == 1
+            assert isinstance(result[0], DLQMessage)
+            assert result[0].error == "invalid type"
+            assert result[0].original_message == {"id": 1}
+
+    def test_consume_messages_returns_empty_list_on_204_no_content(self, dlq):
+        """Test DLQ consume_messages returns empty list on 204 No Content."""
+        mock_response = mock_responses.create_mock_response_factory()(
+            status_code=204,
+        )
+        with patch("httpx.Client.request", return_value=mock_response):
+            assert dlq.consume_messages(batch_size=50) == []
+
     @pytest.mark.parametrize(
         "scenario",
         [
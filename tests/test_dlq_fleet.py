@@ -0,0 +1,159 @@
+"""Tests for the fleet-wide DLQ scanner."""
+
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from glassflow.etl import DLQ, Client, FleetDLQScanner, errors
+
+
+def list_payload(*pipeline_ids):
+    return [{"pipeline_id": pid, "name": pid.title()} for pid in pipeline_ids]
+
+
+class StateServer:
+    """Serves DLQ states keyed by pipeline ID to a patched DLQ.state."""
+
+    def __init__(self, backlogs):
+        self.backlogs = backlogs
+        self.calls = []
+
+    def __call__(self, dlq):
+        self.calls.append(dlq.pipeline_id)
+        backlog = self.backlogs[dlq.pipeline_id]
+        if isinstance(backlog, Exception):
+            raise backlog
+        return {"total_messages": backlog, "unconsumed_messages": backlog}
+
+
+@contextmanager
+def serve(server, listing=None, side_effect=None):
+    """Patch pipeline listing and DLQ state requests."""
+    with patch.object(
+        Client, "list_pipelines", return_value=listing, side_effect=side_effect
+    ):
+        with patch.object(DLQ, "state", autospec=True, side_effect=server):
+            yield
+
+
+class TestFleetDLQScanner:
+    """Test cases for FleetDLQScanner class."""
+
+    def test_scan_sorts_worst_offenders_first(self):
+        client = Client(host="http://localhost:8080")
+        server = StateServer({"a": 5, "b": 50, "c": 0})
+
+        with serve(server, list_payload(*"abc")):
+            scanner = FleetDLQScanner(client, max_workers=4)
+            report = scanner.scan()
+            scanner.close()
+
+        assert sorted(server.calls) == ["a", "b", "c"]
+        assert [e.pipeline_id for e in report.entries] == ["b", "a", "c"]
+        assert report.entries[0].name == "B"
+        assert report.total_backlog == 55
+        assert report.worst(1)[0].backlog == 50
+        assert all(e.backlog_delta is None for e in report.entries)
+
+    def test_dlqs_share_the_client_http_client(self):
+        client = Client(host="http://localhost:8080")
+        server = StateServer({"a": 1, "b": 2})
+
+        with serve(server, list_payload(*"ab")):
+            scanner = FleetDLQScanner(client)
+            scanner.scan()
+
+        for pipeline_id in scanner.monitor.pipeline_ids:
+            dlq = scanner.monitor._dlqs[pipeline_id]
+            assert dlq.http_client is client.http_client
+
+    def test_delta_reporting_between_scans(self):
+        client = Client(host="http://localhost:8080")
+        server = StateServer({"a": 10, "b": 10})
+
+        with serve(server, list_payload(*"ab")):
+            scanner = FleetDLQScanner(client, interval=0.001)
+            scanner.scan()
+            server.backlogs = {"a": 25, "b": 4}
+            scanner.monitor._last_request.clear()
+            report = scanner.scan()
+
+        deltas = {e.pipeline_id: e.backlog_delta for e in report.entries}
+        assert deltas == {"a": 15, "b": -6}
+
+    def test_scan_does_not_requery_within_interval(self):
+        client = Client(host="http://localhost:8080")
+        server = StateServer({"a": 10})
+
+        with serve(server, list_payload("a")):
+            scanner = FleetDLQScanner(client, interval=60)
+            scanner.scan()
+            report = scanner.scan()
+
+        assert server.calls == ["a"]
+        assert report.entries[0].backlog == 10
+
+    def test_removed_pipelines_are_dropped(self):
+        client = Client(host="http://localhost:8080")
+        server = StateServer({"a": 1, "b": 1})
+        listings = [list_payload("a", "b"), list_payload("a")]
+
+        with serve(server, side_effect=listings):
+            scanner = FleetDLQScanner(client)
+            scanner.scan()
+            report = scanner.scan()
+
+        assert [e.pipeline_id for e in report.entries] == ["a"]
+
+    def test_errors_and_min_backlog(self):
+        client = Client(host="http://localhost:8080")
+        server = StateServer({"a": 0, "b": errors.ServerError(500, "boom"), "c": 3})
+
+        with serve(server, list_payload(*"abc")):
+            report = FleetDLQScanner(client, min_backlog=1).scan()
+
+        assert [(e.pipeline_id, e.error) for e in report.entries] == [
+            ("c", None),
+            ("b", "boom"),
+        ]
+
+    def test_to_table(self):
+        client = Client(host="http://localhost:8080")
+        server = StateServer({"pipeline-a": 12})
+
+        with serve(server, list_payload("pipeline-a")):
+            table = FleetDLQScanner(client).scan().to_table()
+
+        header, row = table.splitlines()
+        assert header.split() == [
+            "PIPELINE",
+            "BACKLOG",
+            "DELTA",
+            "IN/S",
+            "TREND",
+            "DRAIN",
+            "ERROR",
+        ]
+        assert row.split() == ["pipeline-a", "12", "unknown"]
+
+    def test_watch(self):
+        client = Client(host="http://localhost:8080")
+        server = StateServer({"a": 1})
+        reports = []
+
+        with serve(server, list_payload("a")):
+            FleetDLQScanner(client, interval=0.001).watch(reports.append, iterations=2)
+
+        assert len(reports) == 2
+
+
+class TestClientScanDLQs:
+    """Test cases for Client.scan_dlqs."""
+
+    def test_scan_dlqs(self):
+        client = Client(host="http://localhost:8080")
+        server = StateServer({"a": 0, "b": 7, "c": 3})
+
+        with serve(server, list_payload(*"abc")):
+            entries = client.scan_dlqs(limit=1)
+
+        assert [(e.pipeline_id, e.backlog) for e in entries] == [("b", 7)]
@@ -0,0 +1,87 @@
+"""Tests for lazily decoded DLQ messages."""
+
+import json
+
+from glassflow.etl import DLQMessage
+
+
+class TestDLQMessage:
+    """Test cases for DLQMessage class."""
+
+    def test_from_dict_with_encoded_original_message(self):
+        message = DLQMessage.from_dict(
+            {
+                "component": "ingestor",
+                "error": "failed to validate data",
+                "original_message": '{"id": 1, "name": "test"}',
+            }
+        )
+
+        assert message.component == "ingestor"
+        assert message.error == "failed to validate data"
+        assert not message.is_decoded
+        assert message.raw == b'{"id": 1, "name": "test"}'
+
+        assert message.original_message == {"id": 1, "name": "test"}
+        assert message.is_decoded
+
+    def test_from_dict_with_object_original_message(self):
+        message = DLQMessage.from_dict(
+            {"component": "sink", "error": "e", "original_message": {"id": 1}}
+        )
+
+        assert message.is_decoded
+        assert message.original_message == {"id": 1}
+        assert json.loads(message.raw) == {"id": 1}
+
+    def test_invalid_json_original_message_is_returned_as_string(self):
+        message = DLQMessage.from_dict(
+            {"component": "sink", "error": "e", "original_message": "not json"}
+        )
+
+        assert message.original_message == "not json"
+
+    def test_extra_fields_are_preserved(self):
+        data = {
+            "component": "ingestor",
+            "error": "e",
+            "original_message": '{"a": 1}',
+            "id": "msg1",
+        }
+        message = DLQMessage.from_dict(data)
+
+        assert message.extra == {"id": "msg1"}
+        assert message.to_dict() == {**data, "original_message": {"a": 1}}
+
+    def test_parse_batch(self):
+        content = json.dumps(
+            [
+                {"component": "ingestor", "error": "e1", "original_message": "{}"},
+                {"component": "sink", "error": "e2", "original_message": "[1]"},
+            ]
+        ).encode()
+
+        messages = DLQMessage.parse_batch(content)
+
+        assert [m.error for m in messages] == ["e1", "e2"]
+        assert not any(m.is_decoded for m in messages)
+        assert messages[1].original_message == [1]
+
+    def test_parse_batch_object_payload(self):
+        content = json.dumps(
+            [{"component": "sink", "error": "e", "original_message": {"a": 1}}]
+        ).encode()
+
+        messages = DLQMessage.parse_batch(content)
+
+        assert messages[0].is_decoded
+        assert messages[0].original_message == {"a": 1}
+        assert messages[0].raw == json.dumps({"a": 1}, separators=(",", ":")).encode()
+
+    def test_parse_batch_empty(self):
+        assert DLQMessage.parse_batch(b"") == []
+        assert DLQMessage.parse_batch(b"{}") == []
+
+    def test_slots(self):
+        message = DLQMessage(component="ingestor", error="e", raw=b"{}")
+        assert not hasattr(message, "__dict__")
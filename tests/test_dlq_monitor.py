@@ -0,0 +1,170 @@
+"""Tests for the DLQ backlog monitor."""
+
+from unittest.mock import patch
+
+import pytest
+
+from glassflow.etl import DLQ, DLQMonitor, errors
+from glassflow.etl.dlq_monitor import BacklogTrend, DLQSample, compute_backlog_stats
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_samples(points):
+    return [
+        DLQSample(
+            pipeline_id="test-pipeline",
+            timestamp=t,
+            total_messages=total,
+            backlog=backlog,
+        )
+        for t, total, backlog in points
+    ]
+
+
+class TestComputeBacklogStats:
+    """Test cases for backlog statistics."""
+
+    def test_no_samples(self):
+        stats = compute_backlog_stats("test-pipeline", [])
+        assert stats.samples == 0
+        assert stats.trend == BacklogTrend.UNKNOWN
+        assert stats.ingress_rate is None
+
+    def test_single_sample_empty_backlog(self):
+        stats = compute_backlog_stats("test-pipeline", make_samples([(0, 5, 0)]))
+        assert stats.trend == BacklogTrend.UNKNOWN
+        assert stats.time_to_drain == 0.0
+
+    def test_growing_backlog(self):
+        samples = make_samples([(0, 0, 0), (10, 100, 100), (20, 200, 200)])
+        stats = compute_backlog_stats("test-pipeline", samples)
+        assert stats.ingress_rate == pytest.approx(10.0)
+        assert stats.egress_rate == pytest.approx(0.0)
+        assert stats.growth_rate == pytest.approx(10.0)
+        assert stats.trend == BacklogTrend.GROWING
+        assert stats.time_to_drain is None
+
+    def test_draining_backlog(self):
+        samples = make_samples([(0, 100, 100), (10, 110, 60), (20, 120, 20)])
+        stats = compute_backlog_stats("test-pipeline", samples)
+        assert stats.ingress_rate == pytest.approx(1.0)
+        assert stats.egress_rate == pytest.approx(5.0)
+        assert stats.growth_rate == pytest.approx(-4.0)
+        assert stats.trend == BacklogTrend.DRAINING
+        assert stats.time_to_drain == pytest.approx(5.0)
+
+    def test_stable_backlog(self):
+        samples = make_samples([(0, 10, 10), (10, 10, 10), (20, 10, 10)])
+        stats = compute_backlog_stats("test-pipeline", samples)
+        assert stats.trend == BacklogTrend.STABLE
+        assert stats.time_to_drain is None
+
+
+class TestDLQMonitor:
+    """Test cases for DLQMonitor class."""
+
+    def test_invalid_arguments(self, dlq):
+        with pytest.raises(ValueError):
+            DLQMonitor(dlq, interval=0)
+        with pytest.raises(ValueError):
+            DLQMonitor(dlq, window=1)
+        with pytest.raises(ValueError):
+            DLQMonitor(dlq, max_workers=0)
+
+    def test_poll_is_rate_limited_per_interval(self, dlq):
+        clock = FakeClock()
+        monitor = DLQMonitor(dlq, interval=30, clock=clock)
+        state = {"total_messages": 10, "unconsumed_messages": 4}
+
+        with patch.object(DLQ, "state", return_value=state) as mock_state:
+            assert set(monitor.poll()) == {"test-pipeline"}
+            assert monitor.poll() == {}
+            clock.now += 29
+            assert monitor.poll() == {}
+            assert mock_state.call_count == 1
+
+            clock.now += 1
+            monitor.poll()
+            assert mock_state.call_count == 2
+
+        assert len(monitor.samples("test-pipeline")) == 2
+        assert monitor.stats("test-pipeline").backlog == 4
+
+    def test_ring_buffer_keeps_last_window(self, dlq):
+        clock = FakeClock()
+        monitor = DLQMonitor(dlq, interval=1, window=3, clock=clock)
+
+        for i in range(5):
+            with patch.object(
+                DLQ,
+                "state",
+                return_value={"total_messages": i, "unconsumed_messages": i},
+            ):
+                monitor.poll()
+            clock.now += 1
+
+        samples = monitor.samples("test-pipeline")
+        assert [s.total_messages for s in samples] == [2, 3, 4]
+
+    def test_counter_reset_clears_samples(self, dlq):
+        clock = FakeClock()
+        monitor = DLQMonitor(dlq, interval=1, clock=clock)
+        states = [
+            {"total_messages": 50, "unconsumed_messages": 50},
+            {"total_messages": 0, "unconsumed_messages": 0},
+        ]
+        with patch.object(DLQ, "state", side_effect=states):
+            monitor.poll()
+            clock.now += 1
+            monitor.poll()
+
+        samples = monitor.samples("test-pipeline")
+        assert len(samples) == 1
+        assert samples[0].total_messages == 0
+
+    def test_fleet_poll_records_errors(self):
+        clock = FakeClock()
+        dlqs = [
+            DLQ(host="http://localhost:8080", pipeline_id=f"pipeline-{i}")
+            for i in range(3)
+        ]
+        monitor = DLQMonitor(dlqs, interval=10, max_workers=3, clock=clock)
+
+        def state(self):
+            if self.pipeline_id == "pipeline-1":
+                raise errors.ServerError(500, "boom")
+            return {"total_messages": 1, "unconsumed_messages": 1}
+
+        with patch.object(DLQ, "state", autospec=True, side_effect=state) as mock:
+            samples = monitor.poll()
+            assert mock.call_count == 3
+
+        assert set(samples) == {"pipeline-0", "pipeline-2"}
+        stats = monitor.fleet_stats()
+        assert stats["pipeline-1"].last_error == "boom"
+        assert stats["pipeline-0"].last_error is None
+
+    def test_stats_unknown_pipeline(self, dlq):
+        monitor = DLQMonitor(dlq)
+        with pytest.raises(KeyError):
+            monitor.stats("other-pipeline")
+
+    def test_run_invokes_callback(self, dlq):
+        monitor = DLQMonitor(dlq, interval=0.001)
+        received = []
+        with patch.object(
+            DLQ,
+            "state",
+            return_value={"total_messages": 1, "unconsumed_messages": 0},
+        ):
+            monitor.run(callback=received.append, iterations=2)
+
+        assert len(received) == 2
+        assert received[-1]["test-pipeline"].backlog == 0
@@ -0,0 +1,217 @@
+"""Tests for DLQ redrive."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from glassflow.etl import (
+    DLQ,
+    DLQMessage,
+    DLQRedrive,
+    InMemorySink,
+    RedriveCheckpoint,
+)
+
+
+def make_messages(start: int, count: int):
+    return [
+        DLQMessage(
+            component="sink",
+            error="invalid type",
+            raw=json.dumps({"id": i}).encode(),
+        )
+        for i in range(start, start + count)
+    ]
+
+
+def paged_consumer(total: int):
+    """Build a consume_messages side effect serving ``total`` messages."""
+    state = {"next": 0}
+
+    def consume_messages(batch_size):
+        start = state["next"]
+        count = min(batch_size, total - start)
+        state["next"] += count
+        return make_messages(start, count)
+
+    return consume_messages
+
+
+class TestDLQRedrive:
+    """Test cases for DLQRedrive class."""
+
+    def test_redrive_raw_payloads_in_batches(self, dlq):
+        sink = InMemorySink()
+        with patch.object(DLQ, "consume_messages", side_effect=paged_consumer(7)):
+            result = dlq.redrive(sink, batch_size=3)
+
+        assert [len(b) for b in sink.batches] == [3, 3, 1]
+        assert sink.payloads[0] == b'{"id": 0}'
+        assert result.consumed == 7
+        assert result.sent == 7
+        assert result.batches == 3
+
+    def test_large_batches_span_several_pages(self, dlq):
+        sink = InMemorySink()
+        with patch.object(
+            DLQ, "consume_messages", side_effect=paged_consumer(250)
+        ) as mock:
+            result = dlq.redrive(sink, batch_size=150)
+
+        assert [c.kwargs["batch_size"] for c in mock.call_args_list] == [
+            100,
+            50,
+            100,
+            50,
+        ]
+        assert [len(b) for b in sink.batches] == [150, 100]
+        assert result.sent == 250
+
+    def test_fix_function_skip_and_reject(self, dlq):
+        sink = InMemorySink()
+
+        def fix(message):
+            event = message.original_message
+            if event["id"] == 1:
+                return None
+            if event["id"] == 2:
+                raise ValueError("cannot fix")
+            return {**event, "fixed": True}
+
+        checkpoint = RedriveCheckpoint()
+        with patch.object(DLQ, "consume_messages", side_effect=paged_consumer(4)):
+            result = dlq.redrive(sink, fix=fix, checkpoint=checkpoint)
+
+        assert sink.payloads == [{"id": 0, "fixed": True}, {"id": 3, "fixed": True}]
+        assert result.skipped == 1
+        assert result.rejected == 1
+        rejected = checkpoint.rejected()
+        assert rejected[0]["error"] == "ValueError: cannot fix"
+        assert json.loads(rejected[0]["message"]["original_message"]) == {"id": 2}
+
+    def test_max_messages(self, dlq):
+        sink = InMemorySink()
+        with patch.object(DLQ, "consume_messages", side_effect=paged_consumer(10)):
+            result = dlq.redrive(sink, batch_size=4, max_messages=6)
+
+        assert result.consumed == 6
+        assert [len(b) for b in sink.batches] == [4, 2]
+
+    def test_concurrent_batches(self, dlq):
+        sink = InMemorySink()
+        with patch.object(DLQ, "consume_messages", side_effect=paged_consumer(50)):
+            result = dlq.redrive(sink, batch_size=5, max_in_flight=4)
+
+        assert result.batches == 10
+        assert sorted(p for p in sink.payloads) == sorted(
+            json.dumps({"id": i}).encode() for i in range(50)
+        )
+
+    def test_failed_batches_are_resumed_from_checkpoint(self, dlq, tmp_path):
+        journal = tmp_path / "redrive.journal"
+        calls = {"count": 0}
+
+        def flaky_sink(batch):
+            calls["count"] += 1
+            if calls["count"] == 2:
+                raise RuntimeError("broker unavailable")
+
+        with patch.object(DLQ, "consume_messages", side_effect=paged_consumer(6)):
+            redrive = DLQRedrive(
+                dlq, flaky_sink, batch_size=3, checkpoint=journal, max_retries=0
+            )
+            with pytest.raises(RuntimeError):
+                redrive.run()
+
+        pending = RedriveCheckpoint(journal).pending()
+        assert len(pending) == 1
+        assert [m.original_message["id"] for m in next(iter(pending.values()))] == [
+            3,
+            4,
+            5,
+        ]
+
+        sink = InMemorySink()
+        with patch.object(DLQ, "consume_messages", return_value=[]):
+            result = dlq.redrive(sink, checkpoint=journal)
+
+        assert result.resumed == 3
+        assert result.consumed == 0
+        assert [json.loads(p)["id"] for p in sink.payloads] == [3, 4, 5]
+        assert RedriveCheckpoint(journal).pending() == {}
+
+    def test_resumed_batch_keeps_its_rejections(self, dlq, tmp_path):
+        journal = tmp_path / "redrive.journal"
+        fixed = []
+
+        def fix(message):
+            fixed.append(message.original_message["id"])
+            if message.original_message["id"] == 1:
+                raise ValueError("cannot fix")
+            return message.raw
+
+        def failing_sink(batch):
+            raise RuntimeError("broker unavailable")
+
+        with patch.object(DLQ, "consume_messages", side_effect=paged_consumer(3)):
+            redrive = DLQRedrive(
+                dlq, failing_sink, fix=fix, checkpoint=journal, max_retries=0
+            )
+            with pytest.raises(RuntimeError):
+                redrive.run()
+
+        sink = InMemorySink()
+        with patch.object(DLQ, "consume_messages", return_value=[]):
+            result = dlq.redrive(sink, fix=fix, checkpoint=journal)
+
+        assert fixed == [0, 1, 2, 0, 2]
+        assert [json.loads(p)["id"] for p in sink.payloads] == [0, 2]
+        assert result.resumed == 2
+        assert result.rejected == 0
+        checkpoint = RedriveCheckpoint(journal)
+        assert len(checkpoint.rejected()) == 1
+        assert checkpoint.pending() == {}
+
+    def test_consumer_error_keeps_consumed_messages(self, dlq, tmp_path):
+        journal = tmp_path / "redrive.journal"
+        pages = [make_messages(0, 100), RuntimeError("connection reset")]
+        sink = InMemorySink()
+
+        with patch.object(DLQ, "consume_messages", side_effect=pages):
+            redrive = DLQRedrive(dlq, sink, batch_size=150, checkpoint=journal)
+            with pytest.raises(RuntimeError):
+                redrive.run()
+
+        assert sink.batches == []
+        assert redrive.checkpoint._file is None
+        pending = RedriveCheckpoint(journal).pending()
+        assert [len(messages) for messages in pending.values()] == [100]
+
+        with patch.object(DLQ, "consume_messages", return_value=[]):
+            result = dlq.redrive(sink, checkpoint=journal)
+
+        assert result.resumed == 100
+        assert len(sink.payloads) == 100
+        assert RedriveCheckpoint(journal).pending() == {}
+
+    def test_sink_write_is_retried(self, dlq):
+        calls = {"count": 0}
+
+        def flaky_sink(batch):
+            calls["count"] += 1
+            if calls["count"] == 1:
+                raise RuntimeError("timeout")
+
+        with patch.object(DLQ, "consume_messages", side_effect=paged_consumer(2)):
+            result = DLQRedrive(dlq, flaky_sink, retry_backoff=0).run()
+
+        assert calls["count"] == 2
+        assert result.sent == 2
+        assert result.errors == ["RuntimeError: timeout"]
+
+    def test_invalid_arguments(self, dlq):
+        with pytest.raises(ValueError):
+            DLQRedrive(dlq, InMemorySink(), batch_size=0)
+        with pytest.raises(ValueError):
+            DLQRedrive(dlq, InMemorySink(), max_in_flight=0)
@@ -0,0 +1,179 @@
+"""Tests for streaming DLQ triage."""
+
+from unittest.mock import patch
+
+import pytest
+
+from glassflow.etl import DLQ, DLQMessage, DLQTriage, InMemorySink
+from glassflow.etl.dlq_triage import (
+    ReservoirSample,
+    SpaceSavingCounter,
+    error_class,
+    error_fields,
+)
+
+
+def make_message(error: str, component: str = "ingestor") -> DLQMessage:
+    return DLQMessage(component=component, error=error, raw=b"{}")
+
+
+class TestErrorClassification:
+    """Test cases for error class normalisation."""
+
+    @pytest.mark.parametrize(
+        "error,expected",
+        [
+            ("value 123 out of range", "value <number> out of range"),
+            ("cannot parse 'abc' as int", "cannot parse <value> as int"),
+            (
+                "unknown id 123e4567-e89b-12d3-a456-426614174000",
+                "unknown id <uuid>",
+            ),
+            ("Int8 overflow", "Int8 overflow"),
+            (None, ""),
+        ],
+    )
+    def test_error_class(self, error, expected):
+        assert error_class(error) == expected
+
+    def test_error_fields(self):
+        assert error_fields("field 'user_id' is missing") == ["user_id"]
+        assert error_fields("invalid key: order.id, column amount") == [
+            "order.id",
+            "amount",
+        ]
+        assert error_fields(None) == []
+
+
+class TestSpaceSavingCounter:
+    """Test cases for the bounded top-k counter."""
+
+    def test_exact_below_capacity(self):
+        counter = SpaceSavingCounter(capacity=10)
+        for value in ["a", "b", "a", "c", "a", "b"]:
+            counter.add(value)
+
+        assert counter.most_common(2) == [("a", 3), ("b", 2)]
+        assert counter.total == 6
+
+    def test_bounded_memory(self):
+        counter = SpaceSavingCounter(capacity=5)
+        for i in range(1000):
+            counter.add("frequent")
+            counter.add(f"rare-{i}")
+
+        assert len(counter) == 5
+        assert counter.most_common(1)[0][0] == "frequent"
+
+    def test_evicts_least_frequent_value(self):
+        counter = SpaceSavingCounter(capacity=3)
+        for value in ["a", "a", "b", "c", "a", "b", "c", "c", "a", "c", "a"]:
+            counter.add(value)
+        counter.add("d")
+        counter.add("e")
+
+        assert counter.most_common() == [("a", 5), ("c", 4), ("e", 4)]
+        assert counter.total == 13
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            SpaceSavingCounter(capacity=0)
+
+
+class TestReservoirSample:
+    """Test cases for reservoir sampling."""
+
+    def test_keeps_everything_below_size(self):
+        reservoir = ReservoirSample(size=10, seed=1)
+        for i in range(5):
+            reservoir.add(i)
+        assert reservoir.items == [0, 1, 2, 3, 4]
+
+    def test_fixed_size_and_uniform(self):
+        counts = [0] * 20
+        for seed in range(2000):
+            reservoir = ReservoirSample(size=5, seed=seed)
+            for i in range(20):
+                reservoir.add(i)
+            assert len(reservoir.items) == 5
+            for item in reservoir.items:
+                counts[item] += 1
+
+        # Each item is expected 500 times
+        assert min(counts) > 400
+        assert max(counts) < 600
+
+
+class TestDLQTriage:
+    """Test cases for DLQTriage and DLQ.triage."""
+
+    def test_report(self):
+        triage = DLQTriage(sample_size=3, top_k=2, seed=42)
+        triage.add_many(
+            [
+                make_message("field 'a' has value 1 out of range"),
+                make_message("field 'a' has value 2 out of range"),
+                make_message("field 'b' has value 3 out of range", "sink"),
+                make_message("connection refused", "sink"),
+                make_message("connection refused", "sink"),
+            ]
+        )
+
+        report = triage.report()
+        assert report.total_messages == 5
+        assert report.components == {"sink": 3, "ingestor": 2}
+        assert report.top_errors == [
+            ("field <value> has value <number> out of range", 3),
+            ("connection refused", 2),
+        ]
+        assert report.top_fields == [("a", 2), ("b", 1)]
+        assert len(report.sample) == 3
+
+    def test_dlq_triage_streams_batches(self, dlq):
+        batches = [
+            [make_message("error 1") for _ in range(3)],
+            [make_message("error 2") for _ in range(3)],
+            [make_message("error 3")],
+        ]
+        with patch.object(DLQ, "consume_messages", side_effect=batches) as mock:
+            report = dlq.triage(sample_size=2, batch_size=3, drain=True)
+
+        assert mock.call_count == 3
+        assert report.total_messages == 7
+        assert report.top_errors == [("error <number>", 7)]
+        assert len(report.sample) == 2
+
+    def test_dlq_triage_requires_opt_in(self, dlq):
+        with patch.object(DLQ, "consume_messages") as mock:
+            with pytest.raises(ValueError, match="drain=True"):
+                dlq.triage()
+        mock.assert_not_called()
+
+    def test_dlq_triage_keeps_consumed_messages(self, dlq):
+        batches = [[make_message("error 1"), make_message("error 2")], []]
+        sink = InMemorySink()
+        with patch.object(DLQ, "consume_messages", side_effect=batches):
+            report = dlq.triage(sample_size=1, batch_size=2, sink=sink)
+
+        assert report.total_messages == 2
+        assert sink.payloads == [m.to_dict() for m in batches[0]]
+
+    def test_dlq_iter_messages_max_messages(self, dlq):
+        def consume_messages(batch_size):
+            return [make_message("e") for _ in range(batch_size)]
+
+        with patch.object(
+            DLQ, "consume_messages", side_effect=consume_messages
+        ) as mock:
+            messages = list(dlq.iter_messages(batch_size=3, max_messages=5))
+
+        assert [c.kwargs for c in mock.call_args_list] == [
+            {"batch_size": 3},
+            {"batch_size": 2},
+        ]
+        assert len(messages) == 5
+
+    def test_dlq_iter_messages_stops_when_empty(self, dlq):
+        with patch.object(DLQ, "consume_messages", side_effect=[[]]) as mock:
+            assert list(dlq.iter_messages()) == []
+        mock.assert_called_once_with(batch_size=100)
@@ -0,0 +1,75 @@
+"""Tests for the import-time behavior of the package."""
+
+import os
+import subprocess
+import sys
+
+
+def run_python(code, home):
+    env = {**os.environ, "HOME": str(home), "GF_USAGESTATS_ENABLED": "false"}
+    return subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True
+    )
+
+
+def test_import_is_lazy(tmp_path):
+    """Test that importing the package loads no heavy dependency."""
+    result = run_python(
+        "import sys, glassflow.etl\n"
+        "print(sorted({'httpx', 'mixpanel', 'pydantic', 'yaml'} & set(sys.modules)))",
+        tmp_path,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+def test_validation_import_is_lazy(tmp_path):
+    """Test that importing the validation module does not load pyyaml."""
+    result = run_python(
+        "import sys, glassflow.etl.validation\nprint('yaml' in sys.modules)",
+        tmp_path,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "False"
+
+
+def test_import_writes_no_files(tmp_path):
+    """Test that the config file is only written once a client is created."""
+    result = run_python(
+        "from glassflow.etl import Client, Pipeline, PipelineConfig", tmp_path
+    )
+    assert result.returncode == 0, result.stderr
+    assert not (tmp_path / ".glassflow").exists()
+
+    result = run_python("from glassflow.etl import Client; Client()", tmp_path)
+    assert result.returncode == 0, result.stderr
+    assert (tmp_path / ".glassflow" / "clickhouse.conf").exists()
+
+
+def test_client_settings_are_lazy_class_attributes(tmp_path):
+    """Test that the config and tracking are created on first class access."""
+    result = run_python(
+        "import sys\n"
+        "from glassflow.etl.api_client import APIClient\n"
+        "print('mixpanel' in sys.modules)\n"
+        "config = APIClient.glassflow_config\n"
+        "assert APIClient.__dict__['glassflow_config'] is config\n"
+        "assert APIClient._tracking is APIClient()._tracking\n"
+        "print('mixpanel' in sys.modules)",
+        tmp_path,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ["False", "True"]
+    assert (tmp_path / ".glassflow" / "clickhouse.conf").exists()
+
+
+def test_public_names():
+    """Test that every public name resolves to the object of its submodule."""
+    import importlib
+
+    import glassflow.etl
+
+    for name in glassflow.etl.__all__:
+        module = importlib.import_module(glassflow.etl._EXPORTS[name], "glassflow.etl")
+        assert getattr(glassflow.etl, name) is getattr(module, name)
+    assert set(glassflow.etl.__all__) <= set(dir(glassflow.etl))
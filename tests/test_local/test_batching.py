@@ -0,0 +1,128 @@
+import pytest
+
+from glassflow.etl.local import (
+    SinkBatchingSimulator,
+    bursty_arrivals,
+    constant_arrivals,
+    find_sink_batch_settings,
+    parse_duration,
+    poisson_arrivals,
+    replayed_arrivals,
+)
+from glassflow.etl.models import PipelineConfig
+from tests.data import pipeline_configs
+
+
+def test_size_triggered_flushes():
+    report = SinkBatchingSimulator(10, "1m").run(constant_arrivals(100, 1))
+
+    assert report.events == 100
+    assert report.batches == 10
+    assert report.size_flushes == 10
+    assert report.delay_flushes == 0
+    assert report.batch_size_p50 == 10
+    # The first event of each batch waits for the nine that follow
+    assert report.latency_max == pytest.approx(0.09)
+    assert report.latency_p50 == pytest.approx(0.04)
+
+
+def test_delay_triggered_flushes():
+    report = SinkBatchingSimulator(1000, "1s").run(constant_arrivals(10, 10))
+
+    assert report.size_flushes == 0
+    assert report.delay_flushes == 10
+    assert report.batch_size_mean == pytest.approx(10)
+    assert report.latency_max == pytest.approx(1.0)
+    assert report.latency_p50 == pytest.approx(0.5, abs=0.1)
+    assert report.inserts_per_second == pytest.approx(1.0, rel=0.1)
+    assert report.flush_interval == pytest.approx(1.0, rel=0.1)
+
+
+def test_inserts_queue_behind_a_busy_sink():
+    idle = SinkBatchingSimulator(10, "1s").run(constant_arrivals(100, 1))
+    busy = SinkBatchingSimulator(10, "1s", insert_overhead=0.5).run(
+        constant_arrivals(100, 1)
+    )
+
+    assert busy.latency_max > idle.latency_max + 4
+    assert busy.sink_utilization == pytest.approx(1.0, rel=0.2)
+
+
+def test_from_config():
+    config = pipeline_configs.get_valid_pipeline_config()
+    config["sink"].update(max_batch_size=500, max_delay_time="10m")
+    sink = PipelineConfig(**config).sink
+    simulator = SinkBatchingSimulator.from_config(sink)
+    assert simulator.max_batch_size == 500
+    assert simulator.max_delay_time == 600
+
+    sink.max_batch_size = sink.max_delay_time = None
+    simulator = SinkBatchingSimulator.from_config(sink)
+    assert simulator.max_batch_size == 1000
+    assert simulator.max_delay_time == parse_duration("1m")
+
+
+def test_arrival_profiles():
+    assert len(constant_arrivals(5, 2)) == 10
+    poisson = poisson_arrivals(100, 10, seed=1)
+    assert 800 < len(poisson) < 1200
+    assert poisson == sorted(poisson)
+    bursty = bursty_arrivals(10, 1000, 1, 10, 20, seed=1)
+    assert sum(1 for t in bursty if t % 10 < 1) > sum(1 for t in bursty if t % 10 >= 1)
+    assert replayed_arrivals(["2024-01-01T00:00:01Z", "2024-01-01T00:00:00Z"]) == [
+        0.0,
+        1.0,
+    ]
+
+
+def test_find_settings_meeting_slo():
+    arrivals = poisson_arrivals(1000, 30, seed=7)
+    best = find_sink_batch_settings(
+        arrivals, latency_slo=2.0, percentile=99, insert_overhead=0.01
+    )
+
+    assert best is not None
+    assert best.latency_p99 <= 2.0
+    assert best.inserts_per_second <= 2
+    assert (
+        find_sink_batch_settings(arrivals, latency_slo=0.001, insert_overhead=0.01)
+        is None
+    )
+
+
+def test_find_settings_with_non_monotonic_latency():
+    arrivals = constant_arrivals(1000, 20)
+    p99 = {
+        size: SinkBatchingSimulator(size, "1s", insert_overhead=0.05)
+        .run(arrivals)
+        .latency_p99
+        for size in (1, 10, 100, 500, 1000)
+    }
+    assert p99[100] <= 1.0 and p99[500] <= 1.0 and p99[1000] > 1.0
+
+    best = find_sink_batch_settings(
+        arrivals,
+        latency_slo=1.0,
+        batch_sizes=(1, 10, 100, 500, 1000),
+        delay_times=("1s",),
+        insert_overhead=0.05,
+    )
+
+    assert best is not None
+    assert best.max_batch_size == 500
+
+
+def test_unsupported_percentile():
+    report = SinkBatchingSimulator(10, "1s").run(constant_arrivals(100, 1))
+    assert report.latency(99) == report.latency_p99
+    with pytest.raises(ValueError, match="percentile"):
+        report.latency(95)
+    with pytest.raises(ValueError, match="percentile"):
+        find_sink_batch_settings([0.0], latency_slo=1.0, percentile=95)
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError):
+        SinkBatchingSimulator(0, "1s")
+    with pytest.raises(ValueError):
+        SinkBatchingSimulator(10, "0s")
@@ -0,0 +1,208 @@
+import decimal
+import uuid
+from datetime import date
+
+import pytest
+
+from glassflow.etl.local import (
+    ClickhouseCoercer,
+    TruncationError,
+    clickhouse_converter,
+)
+from glassflow.etl.models import ClickhouseDataType, SinkConfig
+from tests.data import pipeline_configs
+
+
+@pytest.mark.parametrize(
+    ("column_type", "value", "expected"),
+    [
+        ("Int8", 127, 127),
+        ("Int8", "-128", -128),
+        ("UInt64", 2**64 - 1, 2**64 - 1),
+        ("Int32", 7.0, 7),
+        ("Float32", "1.5", 1.5),
+        ("String", {"a": 1}, '{"a":1}'),
+        ("FixedString(3)", "abc", "abc"),
+        ("Bool", "true", True),
+        ("UUID", uuid.UUID(int=1).bytes, str(uuid.UUID(int=1))),
+        ("DateTime", "2024-01-01T00:00:00Z", 1704067200),
+        ("DateTime64(3)", 1704067200.123, 1704067200.123),
+        ("Enum8", "a", "a"),
+        ("LowCardinality(Int16)", 5, 5),
+        ("Array(LowCardinality(UInt8))", [1, 2], [1, 2]),
+        ("Map(String, String)", {"a": 1}, {"a": "1"}),
+        ("Nullable(Int8)", None, None),
+        ("Int128", str(2**100), 2**100),
+        ("UInt256", 2**255, 2**255),
+        ("BFloat16", 1.5, 1.5),
+        ("Decimal(18, 4)", "12.5", decimal.Decimal("12.5000")),
+        ("Decimal32(2)", 0.1, decimal.Decimal("0.10")),
+        ("Date", "2024-01-01", date(2024, 1, 1)),
+        ("Date", 1, date(1970, 1, 2)),
+        ("Date32", date(1950, 6, 1), date(1950, 6, 1)),
+        ("IPv4", "10.0.0.1", "10.0.0.1"),
+        ("IPv6", "10.0.0.1", "::ffff:a00:1"),
+        ("Enum8('a' = 1, 'b' = 2)", 2, 2),
+        ("Tuple(String, Int8)", ["a", "1"], ("a", 1)),
+        ("Tuple(name String, n Int8)", {"n": 1, "name": "a"}, ("a", 1)),
+    ],
+)
+def test_converter_accepts(column_type, value, expected):
+    assert clickhouse_converter(column_type)(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("column_type", "value", "error"),
+    [
+        ("Int8", 128, OverflowError),
+        ("UInt8", -1, OverflowError),
+        ("Int64", 2**63, OverflowError),
+        ("Int32", 1.5, TruncationError),
+        ("Int32", "abc", ValueError),
+        ("Float32", 1e39, OverflowError),
+        ("FixedString(2)", "abc", TruncationError),
+        ("Bool", 2, ValueError),
+        ("UUID", "not-a-uuid", ValueError),
+        ("DateTime", 1.5, TruncationError),
+        ("DateTime", -1, OverflowError),
+        ("DateTime64(3)", 1.0001, TruncationError),
+        ("DateTime64(6)", 2**40, OverflowError),
+        ("Enum8", 200, OverflowError),
+        ("Array(Int8)", [1, 300], OverflowError),
+        ("Int128", 2**127, OverflowError),
+        ("Decimal(5, 2)", "1000", OverflowError),
+        ("Decimal(5, 2)", "1.234", TruncationError),
+        ("Decimal(5, 2)", "NaN", ValueError),
+        ("Date", "2024-01-01T12:00:00", TruncationError),
+        ("Date", "2200-01-01", OverflowError),
+        ("IPv4", "::1", ValueError),
+        ("Enum8('a' = 1)", "b", ValueError),
+        ("Tuple(String, Int8)", ["a"], ValueError),
+    ],
+)
+def test_converter_rejects(column_type, value, error):
+    with pytest.raises(error):
+        clickhouse_converter(column_type)(value)
+
+
+def test_unknown_type():
+    with pytest.raises(ValueError):
+        clickhouse_converter("Decimal(10, 2")
+
+
+@pytest.mark.parametrize(
+    "column_type",
+    [t.value for t in ClickhouseDataType]
+    + [
+        "Int128",
+        "Int256",
+        "UInt128",
+        "UInt256",
+        "BFloat16",
+        "Date",
+        "Date32",
+        "IPv4",
+        "IPv6",
+        "Decimal32(2)",
+        "Decimal64(4)",
+        "Decimal128(10)",
+        "Tuple(String, Int8)",
+        "FixedString(16)",
+        "DateTime('UTC')",
+        "DateTime64(6, 'UTC')",
+        "Decimal(18, 4)",
+        "Decimal256(10)",
+        "Enum16('a' = 1)",
+        "Nullable(LowCardinality(String))",
+        "Map(String, Array(Tuple(a UInt8, b IPv6)))",
+    ],
+)
+def test_coercer_supports_every_mapping_type(column_type):
+    mapping = {"name": "f", "column_name": "c", "column_type": column_type}
+    coercer = ClickhouseCoercer([mapping])
+    assert coercer.convert_events([{"f": None}]) == [[None]]
+
+
+MAPPING = [
+    {"name": "id", "column_name": "id", "column_type": "Int8"},
+    {"name": "ts", "column_name": "created_at", "column_type": "DateTime"},
+    {"name": "code", "column_name": "code", "column_type": "FixedString"},
+]
+
+
+def test_convert_columns_reports_failures():
+    coercer = ClickhouseCoercer(MAPPING, column_types={"code": "FixedString(2)"})
+    converted = coercer.convert_columns(
+        {
+            "id": [1, 300, 2.5, None, "x"],
+            "ts": [0, 1.5, -5, "2024-01-01 00:00:00", None],
+        }
+    )
+
+    assert converted["id"] == [1, None, None, None, None]
+    assert converted["created_at"] == [0, None, None, 1704067200, None]
+    assert converted["code"] == [None] * 5
+
+    report = coercer.report
+    assert report.rows == 5
+    assert report.failed_rows == 3
+    assert not report.ok
+    failures = report.failures()
+    assert set(failures) == {"id", "created_at"}
+    assert (failures["id"].overflow, failures["id"].truncated) == (1, 1)
+    assert failures["id"].invalid == 1
+    assert failures["id"].nulls == 1
+    assert failures["id"].examples == ["300", "2.5", "'x'"]
+    assert (failures["created_at"].truncated, failures["created_at"].overflow) == (
+        1,
+        1,
+    )
+    assert report.columns[2].nulls == 5
+    assert report.columns[2].column_type == "FixedString(2)"
+
+
+def test_convert_events():
+    coercer = ClickhouseCoercer(MAPPING[:2])
+    rows = coercer.convert_events([{"id": "3", "ts": 10}, {"id": 4}])
+
+    assert rows == [[3, 10], [4, None]]
+    assert coercer.report.ok
+
+    coercer.reset()
+    assert coercer.report.rows == 0
+
+
+def test_from_sink_config():
+    config = pipeline_configs.get_valid_pipeline_config()
+    sink = SinkConfig(**config["sink"])
+    coercer = ClickhouseCoercer(sink)
+    assert len(coercer.mapping) == len(sink.mapping)
+
+    sink.mapping = None
+    with pytest.raises(ValueError):
+        ClickhouseCoercer(sink)
+
+
+@pytest.mark.parametrize(
+    ("column_type", "values"),
+    [
+        ("Int8", [1, -128, 127, True]),
+        ("Int8", [1, 128]),
+        ("UInt64", [0, 2**64 - 1]),
+        ("Nullable(Int32)", [1, None]),
+        ("Int16", [1.0, 2.5]),
+        ("Float32", [1.5, 2, float("inf"), float("nan")]),
+        ("Float32", [1.5, 1e39]),
+        ("Float64", [1e300, -1e300]),
+    ],
+)
+def test_numpy_columns_match_python_conversion(column_type, values):
+    np = pytest.importorskip("numpy")
+    mapping = [{"name": "f", "column_name": "c", "column_type": column_type}]
+    # Object arrays are not checked with NumPy, only converted value by value
+    python = ClickhouseCoercer(mapping)
+    expected = python.convert_columns({"f": np.asarray(values, dtype=object)})
+    vectorized = ClickhouseCoercer(mapping)
+
+    assert repr(vectorized.convert_columns({"f": values})) == repr(expected)
+    assert vectorized.report.columns == python.report.columns
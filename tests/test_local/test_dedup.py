@@ -0,0 +1,108 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from glassflow.etl.local import DedupEngine, parse_duration
+from glassflow.etl.models import DedupTransform, DedupTransformConfig
+
+
+def config(window="10s"):
+    return DedupTransformConfig(key="id", time_window=window)
+
+
+def events(*pairs):
+    return [{"id": key, "ts": ts} for key, ts in pairs]
+
+
+def test_drops_duplicates_within_window():
+    engine = DedupEngine(config(), time_field="ts")
+    kept = engine.apply(events(("a", 0), ("b", 1), ("a", 5), ("a", 10), ("b", 12)))
+
+    assert kept == events(("a", 0), ("b", 1), ("a", 10), ("b", 12))
+    assert engine.stats.evaluated == 5
+    assert engine.stats.duplicates == 1
+    assert engine.stats.unique == 4
+    assert engine.stats.duplicate_rate == pytest.approx(0.2)
+
+
+def test_window_is_not_extended_by_duplicates():
+    engine = DedupEngine(config(), time_field="ts")
+    mask = engine.mask(events(("a", 0), ("a", 9), ("a", 11)))
+    assert mask == [True, False, True]
+
+
+def test_expired_keys_are_removed():
+    engine = DedupEngine(config(), time_field="ts", buckets=2)
+    engine.mask(events(*((str(i), i * 0.1) for i in range(100))))
+    assert engine.stats.keys == 100
+    assert engine.stats.peak_keys == 100
+
+    engine.mask(events(("late", 30)))
+    assert engine.stats.keys == 1
+    assert engine.stats.expired == 100
+    assert engine.stats.peak_keys == 100
+
+
+def test_state_is_kept_across_batches():
+    engine = DedupEngine(config(), time_field="ts")
+    assert engine.mask(events(("a", 0))) == [True]
+    assert engine.mask(events(("a", 1), ("b", 2))) == [False, True]
+
+
+def test_bounded_memory_mode():
+    engine = DedupEngine(config(), time_field="ts", buckets=10, max_keys=5)
+    engine.mask(events(*((str(i), i) for i in range(10))))
+
+    assert engine.stats.keys <= 5
+    assert engine.stats.peak_keys == 6
+    assert engine.stats.evicted == 5
+    # Evicted keys are no longer recognized as duplicates
+    assert engine.mask(events(("0", 9.5))) == [True]
+
+
+def test_missing_keys_pass_through():
+    engine = DedupEngine(config(), time_field="ts")
+    assert engine.mask([{"ts": 0}, {"ts": 1}]) == [True, True]
+    assert engine.stats.missing_keys == 2
+
+
+def test_processing_time_and_explicit_timestamps():
+    now = {"t": 100.0}
+    engine = DedupEngine(config("1m"), clock=lambda: now["t"])
+    assert engine.mask([{"id": 1}, {"id": 1}]) == [True, False]
+    now["t"] += 61
+    assert engine.mask([{"id": 1}]) == [True]
+
+    engine = DedupEngine(DedupTransform(source_id="s", config=config("1h")))
+    times = [
+        datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "2024-01-01T00:30:00Z",
+        "2024-01-01T01:00:00+00:00",
+    ]
+    assert engine.mask([{"id": 1}] * 3, timestamps=times) == [True, False, True]
+
+
+def test_nested_keys_and_storage_estimate():
+    engine = DedupEngine(
+        DedupTransformConfig(key="user.id", time_window="1h"), time_field="ts"
+    )
+    engine.mask([{"user": {"id": f"user-{i}"}, "ts": i} for i in range(1000)])
+
+    assert engine.stats.keys == 1000
+    assert engine.stats.estimated_bytes > 1000 * len("user-000")
+    assert engine.recommended_storage() == "1Mi"
+
+
+def test_invalid_window():
+    with pytest.raises(ValueError):
+        DedupEngine(config("ten seconds"))
+    with pytest.raises(ValueError):
+        DedupEngine(config("0s"))
+
+
+@pytest.mark.parametrize(
+    ("value", "seconds"),
+    [("30s", 30), ("12h", 43200), ("1h30m", 5400), ("1.5m", 90), ("250ms", 0.25)],
+)
+def test_parse_duration(value, seconds):
+    assert parse_duration(value) == pytest.approx(seconds)
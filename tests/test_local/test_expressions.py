@@ -0,0 +1,163 @@
+import pytest
+
+from glassflow.etl.errors import ExpressionError, InvalidExpressionError
+from glassflow.etl.local import (
+    CompiledExpression,
+    CompiledRecord,
+    ExpressionEvaluationError,
+    compile_expression,
+)
+from glassflow.etl.local.expressions import _regex
+
+
+@pytest.mark.parametrize(
+    "expression,event,expected",
+    [
+        ("age > 18", {"age": 21}, True),
+        ("age > 18 && status == 'active'", {"age": 21, "status": "new"}, False),
+        ("age < 18 or status == 'active'", {"age": 21, "status": "active"}, True),
+        ("!(age >= 18)", {"age": 21}, False),
+        ("not enabled", {"enabled": False}, True),
+        ("price * quantity", {"price": 2.5, "quantity": 4}, 10.0),
+        ("total % 3", {"total": 10}, 1),
+        ("2 ** 3 ** 2", {}, 512),
+        ("2 ^ 3", {}, 8),
+        ("-a + 1", {"a": 3}, -2),
+        ("user.address.city", {"user": {"address": {"city": "Berlin"}}}, "Berlin"),
+        ("user?.name", {}, None),
+        ("tags[1]", {"tags": ["a", "b"]}, "b"),
+        ("tags[5]", {"tags": ["a", "b"]}, None),
+        ("data['key']", {"data": {"key": 1}}, 1),
+        ("country in ['DE', 'FR']", {"country": "FR"}, True),
+        ("country not in ['DE', 'FR']", {"country": "FR"}, False),
+        ("name contains 'flow'", {"name": "glassflow"}, True),
+        ("name startsWith 'glass'", {"name": "glassflow"}, True),
+        ("name endsWith 'glass'", {"name": "glassflow"}, False),
+        ("email matches '^[a-z]+@example\\\\.com$'", {"email": "a@example.com"}, True),
+        ("level > 3 ? 'high' : 'low'", {"level": 5}, "high"),
+        ("missing ?? 'default'", {}, "default"),
+        ("missing ?? other ?? 3", {"other": None}, 3),
+        ("nil == missing", {}, True),
+        ("[a, b][1]", {"a": 1, "b": 2}, 2),
+        ("{x: 1, 'y': b}.y", {"b": 2}, 2),
+        ('"multi\\nline"', {}, "multi\nline"),
+        ("1.5e2", {}, 150.0),
+    ],
+)
+def test_evaluate(expression, event, expected):
+    assert compile_expression(expression)(event) == expected
+
+
+@pytest.mark.parametrize(
+    "expression,event,expected",
+    [
+        ("len(name)", {"name": "abc"}, 3),
+        ("lower(name) == 'abc'", {"name": "ABC"}, True),
+        ("upper(name)", {"name": "abc"}, "ABC"),
+        ("trim(name)", {"name": "  a "}, "a"),
+        ("trimPrefix(name, 'gf_')", {"name": "gf_id"}, "id"),
+        ("trimSuffix(name, '_id')", {"name": "user_id"}, "user"),
+        ("split(path, '/')", {"path": "a/b"}, ["a", "b"]),
+        ("join(parts, '-')", {"parts": ["a", "b"]}, "a-b"),
+        ("replace(s, 'a', 'b')", {"s": "aa"}, "bb"),
+        ("int('42')", {}, 42),
+        ("int(3.9)", {}, 3),
+        ("float('1.5')", {}, 1.5),
+        ("string(true)", {}, "true"),
+        ("abs(-2)", {}, 2),
+        ("round(2.5)", {}, 3.0),
+        ("max(1, 5, 3)", {}, 5),
+        ("toJSON({a: 1})", {}, '{"a":1}'),
+        ("fromJSON(payload).id", {"payload": '{"id": 7}'}, 7),
+        ("toBase64('hi')", {}, "aGk="),
+    ],
+)
+def test_builtin_functions(expression, event, expected):
+    assert compile_expression(expression)(event) == expected
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["a >", "(a", "foo(1)", "'unterminated", "a b", "a ? b", "a.1", "@"],
+)
+def test_invalid_expressions(expression):
+    with pytest.raises(InvalidExpressionError):
+        compile_expression(expression)
+
+
+def test_evaluation_error():
+    expression = compile_expression("age > 18")
+    with pytest.raises(ExpressionEvaluationError) as exc_info:
+        expression({})
+    assert isinstance(exc_info.value, ExpressionError)
+    assert not isinstance(exc_info.value, InvalidExpressionError)
+
+
+def test_regex_cache_is_bounded():
+    expression = compile_expression("name matches pattern")
+    for i in range(1000):
+        assert expression({"name": f"user-{i}", "pattern": f"^user-{i}$"})
+    assert _regex.cache_info().currsize <= _regex.cache_info().maxsize
+
+
+def test_compile_is_cached():
+    assert compile_expression("a == 1") is compile_expression("a == 1")
+    assert isinstance(compile_expression("a == 1"), CompiledExpression)
+
+
+def test_referenced_fields():
+    expression = compile_expression("a.b > 1 && c in [d, 'x'] && len(e) > 0")
+    assert expression.fields == ("a", "c", "d", "e")
+
+
+def test_evaluate_batch_counts_failures():
+    expression = compile_expression("age > 18")
+    results, failures = expression.evaluate_batch(
+        [{"age": 20}, {}, {"age": 10}], default="error"
+    )
+    assert results == [True, "error", False]
+    assert failures == 1
+
+
+def test_evaluate_columns_matches_rows():
+    expression = compile_expression("age > 18 && country in ['DE', 'FR']")
+    events = [
+        {"age": 20, "country": "DE"},
+        {"age": 30, "country": "US"},
+        {"age": 10, "country": "FR"},
+    ]
+    columns = {
+        "age": [e["age"] for e in events],
+        "country": [e["country"] for e in events],
+    }
+
+    assert expression.evaluate_columns(columns) == expression.evaluate_batch(events)
+
+
+def test_evaluate_columns_missing_and_constant():
+    results, failures = compile_expression("missing ?? 1").evaluate_columns(
+        {"other": [1, 2]}
+    )
+    assert results == [1, 1]
+    assert failures == 0
+
+    results, _ = compile_expression("1 + 1").evaluate_columns({}, length=3)
+    assert results == [2, 2, 2]
+
+    with pytest.raises(ValueError):
+        compile_expression("1 + 1").evaluate_columns({})
+
+
+def test_compiled_record():
+    record = CompiledRecord(
+        {"total": "price * quantity", "name": "upper(user.name)", "one": "1"},
+        {"total": int},
+    )
+
+    assert record.names == ("total", "name", "one")
+    assert record.fields == ("price", "quantity", "user")
+    event = {"price": 2.5, "quantity": 4, "user": {"name": "ann"}}
+    assert record.row_function(event) == {"total": 10, "name": "ANN", "one": 1}
+    assert record.column_function(2.5, 4, {"name": "ann"}) == (10, "ANN", 1)
+    with pytest.raises(InvalidExpressionError):
+        CompiledRecord({"x": "a +"})
@@ -0,0 +1,63 @@
+import pytest
+
+from glassflow.etl.errors import InvalidExpressionError
+from glassflow.etl.local import FilterEngine
+from glassflow.etl.models import FilterTransform
+
+EVENTS = [
+    {"id": 1, "age": 15, "status": "active"},
+    {"id": 2, "age": 25, "status": "active"},
+    {"id": 3, "age": 40, "status": "deleted"},
+    {"id": 4, "status": "active"},
+]
+
+
+def test_drops_matching_events_by_default():
+    engine = FilterEngine("age < 18 || status == 'deleted'")
+    kept = engine.apply(EVENTS)
+
+    assert [e["id"] for e in kept] == [2]
+    assert engine.stats.evaluated == 4
+    assert engine.stats.matched == 2
+    assert engine.stats.passed == 1
+    assert engine.stats.dropped == 3
+    assert engine.stats.errors == 1
+    assert engine.stats.selectivity == pytest.approx(0.25)
+    assert engine.stats.drop_rate == pytest.approx(0.75)
+
+
+def test_keep_matching_events():
+    engine = FilterEngine("status == 'active'", drop_matching=False)
+    assert [e["id"] for e in engine.apply(EVENTS)] == [1, 2, 4]
+    assert engine.stats.matched == 3
+
+
+def test_from_filter_transform():
+    transform = FilterTransform.model_validate(
+        {"source_id": "events", "config": {"expression": "age >= 18"}}
+    )
+    engine = FilterEngine(transform)
+    assert [e["id"] for e in engine.apply(EVENTS[:3])] == [1]
+
+
+def test_apply_columns():
+    engine = FilterEngine("age < 18")
+    columns = {"id": [1, 2, 3], "age": [15, 25, 40]}
+
+    assert engine.apply_columns(columns) == {"id": [2, 3], "age": [25, 40]}
+    assert engine.stats.passed == 2
+
+
+def test_stats_accumulate_and_reset():
+    engine = FilterEngine("age < 18")
+    engine.mask(EVENTS[:2])
+    engine.mask(EVENTS[:2])
+    assert engine.stats.evaluated == 4
+
+    engine.reset()
+    assert engine.stats.evaluated == 0
+
+
+def test_invalid_expression():
+    with pytest.raises(InvalidExpressionError):
+        FilterEngine("age <")
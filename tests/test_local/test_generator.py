@@ -0,0 +1,125 @@
+from collections import Counter
+
+import pytest
+
+from glassflow.etl.local import DedupEngine, EventGenerator, SchemaValidator
+from glassflow.etl.models import DedupTransformConfig
+
+SCHEMA = [
+    {"name": "event_id", "type": "string"},
+    {"name": "user_id", "type": "string"},
+    {"name": "amount", "type": "int8"},
+    {"name": "score", "type": "float32"},
+    {"name": "ok", "type": "bool"},
+    {"name": "tags", "type": "array"},
+    {"name": "ts", "type": "string"},
+]
+
+
+def test_events_match_schema():
+    generator = EventGenerator(SCHEMA, seed=1, time_field="ts", start_time=0)
+    events = generator.batch(1000)
+
+    assert len(events) == 1000
+    assert set(events[0]) == {f["name"] for f in SCHEMA}
+    assert events[0]["ts"] == "1970-01-01T00:00:00.000000+00:00"
+    validator = SchemaValidator(SCHEMA, nullable=False)
+    assert all(validator.validate(events))
+
+
+def test_deterministic_with_seed():
+    first = EventGenerator(SCHEMA, seed=7, start_time=0).batch(100)
+    generator = EventGenerator(SCHEMA, seed=7, start_time=0)
+    assert generator.batch(100) == first
+    generator.reset()
+    assert generator.batch(100) == first
+
+
+def test_duplicates_are_detected_by_dedup():
+    generator = EventGenerator(
+        SCHEMA, seed=3, dedup_key="event_id", duplicate_rate=0.2, start_time=0
+    )
+    events = list(generator.events(20000, batch_size=5000))
+    stats = generator.stats
+
+    assert stats.events == 20000
+    assert 0.18 < stats.duplicates / stats.events < 0.22
+    engine = DedupEngine(
+        DedupTransformConfig(key="event_id", time_window="1h"), clock=lambda: 0.0
+    )
+    engine.apply(events)
+    assert engine.stats.duplicates == stats.duplicates
+
+
+def test_key_skew():
+    generator = EventGenerator(
+        SCHEMA, seed=5, key_cardinality={"user_id": 100}, key_skew=1.2
+    )
+    counts = Counter(event["user_id"] for event in generator.events(20000))
+
+    assert len(counts) <= 100
+    assert counts.most_common(1)[0][0] == "user_id-1"
+    assert counts["user_id-1"] > 10 * counts["user_id-50"]
+
+
+def test_null_and_bad_values():
+    generator = EventGenerator(SCHEMA, seed=9, null_rate=0.05, bad_value_rate=0.05)
+    events = generator.batch(10000)
+    stats = generator.stats
+    fields = len(SCHEMA) * 10000
+
+    assert 0.04 < stats.nulls / fields < 0.06
+    assert 0.04 < stats.bad_values / fields < 0.06
+    validator = SchemaValidator(SCHEMA)
+    validator.validate(events)
+    assert validator.report.violations()["amount"].overflow > 0
+
+
+def test_late_events():
+    generator = EventGenerator(
+        [{"name": "ts", "type": "float64"}],
+        seed=2,
+        time_field="ts",
+        start_time=0,
+        rate=10,
+        late_rate=0.1,
+        max_lateness=5,
+    )
+    times = [event["ts"] for event in generator.batch(1000)]
+
+    assert 0 < generator.stats.late < 200
+    assert times != sorted(times)
+    assert all(t >= i / 10 - 5 for i, t in enumerate(times))
+
+
+def test_write_jsonl(tmp_path):
+    path = tmp_path / "events.jsonl"
+    generator = EventGenerator(SCHEMA, seed=1)
+    assert generator.write(path, 2500, batch_size=1000) == 2500
+    assert len(path.read_text().splitlines()) == 2500
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError):
+        EventGenerator(SCHEMA, dedup_key="missing")
+    with pytest.raises(ValueError):
+        EventGenerator(SCHEMA, null_rate=1.5)
+
+
+def test_vectorized_events_match_schema():
+    pytest.importorskip("numpy")
+    schema = SCHEMA + [
+        {"name": "big", "type": "uint64"},
+        {"name": "wide", "type": "int64"},
+        {"name": "ratio", "type": "float64"},
+    ]
+    generator = EventGenerator(schema, seed=5, null_rate=0.1, vectorized=True)
+    events = generator.batch(1000)
+
+    validator = SchemaValidator(schema)
+    assert all(validator.validate(events))
+    assert all(type(e["amount"]) is int for e in events if e["amount"] is not None)
+    assert all(type(e["ok"]) is bool for e in events if e["ok"] is not None)
+    assert 0 < generator.stats.nulls
+    generator.reset()
+    assert generator.batch(1000) == events
@@ -0,0 +1,110 @@
+import pytest
+
+from glassflow.etl.local import JoinEngine
+from glassflow.etl.models import JoinConfig
+
+
+def join_config(left_window="10s", right_window="10s"):
+    return JoinConfig.model_validate(
+        {
+            "enabled": True,
+            "type": "temporal",
+            "left_source": {
+                "source_id": "orders",
+                "key": "user_id",
+                "time_window": left_window,
+            },
+            "right_source": {
+                "source_id": "users",
+                "key": "id",
+                "time_window": right_window,
+            },
+            "output_fields": [
+                {"source_id": "orders", "name": "order_id"},
+                {"source_id": "orders", "name": "user_id"},
+                {"source_id": "users", "name": "name", "output_name": "user_name"},
+            ],
+        }
+    )
+
+
+def test_joins_matching_keys_within_window():
+    engine = JoinEngine(join_config(), time_field="ts")
+    assert engine.process("users", [{"id": 1, "name": "ann", "ts": 0}]) == []
+
+    joined = engine.process(
+        "orders",
+        [
+            {"order_id": "o1", "user_id": 1, "ts": 5},
+            {"order_id": "o2", "user_id": 2, "ts": 6},
+            {"order_id": "o3", "user_id": 1, "ts": 12},
+        ],
+    )
+
+    assert joined == [{"order_id": "o1", "user_id": 1, "user_name": "ann"}]
+    assert engine.stats.joined == 1
+    assert engine.stats.left.matched == 1
+    assert engine.stats.right.matched == 1
+    assert engine.stats.match_rate == pytest.approx(0.5)
+    assert engine.stats.right.expired_unmatched == 0
+
+
+def test_right_events_join_buffered_left_events():
+    engine = JoinEngine(join_config(), time_field="ts")
+    engine.process("orders", [{"order_id": "o1", "user_id": 1, "ts": 0}])
+    engine.process("orders", [{"order_id": "o2", "user_id": 1, "ts": 1}])
+    joined = engine.process("users", [{"id": 1, "name": "ann", "ts": 2}])
+
+    assert [j["order_id"] for j in joined] == ["o1", "o2"]
+    assert list(joined[0]) == ["order_id", "user_id", "user_name"]
+
+
+def test_buffers_are_evicted_by_window():
+    engine = JoinEngine(join_config("5s", "1m"), time_field="ts")
+    orders = [{"order_id": i, "user_id": i, "ts": i} for i in range(10)]
+    engine.process("orders", orders)
+    assert engine.stats.left.peak_buffered == 5
+    assert engine.stats.left.peak_keys == 5
+
+    engine.process("users", [{"id": 9, "name": "x", "ts": 12}])
+    assert engine.stats.left.buffered == 2
+    assert engine.stats.left.expired == 8
+    assert engine.stats.left.expired_unmatched == 8
+    assert engine.stats.right.buffered == 1
+
+
+def test_process_stream_and_missing_keys():
+    engine = JoinEngine(join_config(), time_field="ts")
+    stream = [
+        ("users", {"id": 1, "name": "ann", "ts": 0}),
+        ("orders", {"order_id": "o1", "user_id": 1, "ts": 1}),
+        ("orders", {"order_id": "o2", "ts": 2}),
+        ("users", {"id": 1, "name": "ann", "ts": 3}),
+    ]
+    joined = engine.process_stream(stream)
+
+    assert len(joined) == 2
+    assert engine.stats.left.missing_keys == 1
+    assert engine.stats.events == 4
+    assert engine.stats.throughput > 0
+
+
+def test_processing_time():
+    now = {"t": 0.0}
+    engine = JoinEngine(join_config(), clock=lambda: now["t"])
+    engine.process("users", [{"id": 1, "name": "ann"}])
+    now["t"] = 11
+    assert engine.process("orders", [{"order_id": "o1", "user_id": 1}]) == []
+
+
+def test_invalid_configs():
+    with pytest.raises(ValueError, match="not enabled"):
+        JoinEngine(JoinConfig())
+
+    config = join_config()
+    config.output_fields[0].source_id = "payments"
+    with pytest.raises(ValueError, match="payments"):
+        JoinEngine(config)
+
+    with pytest.raises(ValueError, match="not part of the join"):
+        JoinEngine(join_config()).process("payments", [])
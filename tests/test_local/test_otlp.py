@@ -0,0 +1,230 @@
+import json
+import struct
+
+import pytest
+
+from glassflow.etl.local import OTLPFlattener, decode_otlp, read_otlp
+from glassflow.etl.models import OTLPLogsSource
+
+TRACE_ID = "5b8efff798038103d269b633813fc60c"
+SPAN_ID = "eee19b7ec3c1b174"
+
+
+def _resource(key, scope_key, records_key, records):
+    return {
+        key: [
+            {
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": {"stringValue": "api"}}
+                    ]
+                },
+                scope_key: [
+                    {
+                        "scope": {"name": "lib", "version": "1.0"},
+                        records_key: records,
+                    }
+                ],
+            }
+        ]
+    }
+
+
+LOGS = _resource(
+    "resourceLogs",
+    "scopeLogs",
+    "logRecords",
+    [
+        {
+            "timeUnixNano": "1700000000000000000",
+            "severityNumber": 9,
+            "severityText": "INFO",
+            "body": {"stringValue": "hello"},
+            "attributes": [
+                {"key": "count", "value": {"intValue": "3"}},
+                {
+                    "key": "tags",
+                    "value": {"arrayValue": {"values": [{"stringValue": "a"}]}},
+                },
+            ],
+            "traceId": TRACE_ID,
+            "spanId": SPAN_ID,
+        },
+        {"timeUnixNano": "1700000000000000001", "body": {"doubleValue": 1.5}},
+    ],
+)
+
+TRACES = _resource(
+    "resourceSpans",
+    "scopeSpans",
+    "spans",
+    [
+        {
+            "traceId": TRACE_ID,
+            "spanId": SPAN_ID,
+            "name": "GET /",
+            "kind": 2,
+            "startTimeUnixNano": "1000",
+            "endTimeUnixNano": "1500",
+            "status": {"code": 1},
+            "events": [{"timeUnixNano": "1200", "name": "retry"}],
+        }
+    ],
+)
+
+METRICS = _resource(
+    "resourceMetrics",
+    "scopeMetrics",
+    "metrics",
+    [
+        {
+            "name": "requests",
+            "unit": "1",
+            "sum": {
+                "aggregationTemporality": 2,
+                "isMonotonic": True,
+                "dataPoints": [
+                    {"timeUnixNano": "10", "asInt": "5"},
+                    {"timeUnixNano": "20", "asInt": "7"},
+                ],
+            },
+        },
+        {
+            "name": "latency",
+            "histogram": {
+                "dataPoints": [
+                    {
+                        "count": "3",
+                        "sum": 0.6,
+                        "bucketCounts": ["1", "2"],
+                        "explicitBounds": [0.1],
+                    }
+                ]
+            },
+        },
+    ],
+)
+
+
+def test_flatten_logs():
+    flattener = OTLPFlattener(OTLPLogsSource(source_id="logs"))
+    rows = flattener.flatten(LOGS)
+
+    assert len(rows) == 2
+    assert rows[0]["timestamp"] == 1700000000000000000
+    assert rows[0]["body"] == "hello"
+    assert rows[0]["attributes"] == {"count": 3, "tags": ["a"]}
+    assert rows[0]["trace_id"] == TRACE_ID
+    assert rows[0]["resource_attributes"] == {"service.name": "api"}
+    assert rows[0]["scope_name"] == "lib"
+    assert rows[1]["body"] == 1.5
+
+    stats = flattener.stats
+    assert stats.requests == 1
+    assert stats.rows == 2
+    assert stats.row_bytes > 0
+    assert stats.columns["timestamp"] == "int64"
+    assert stats.columns["body"] == "string"
+    assert stats.columns["attributes"] == "map"
+
+
+def test_flatten_traces():
+    rows = OTLPFlattener("traces").flatten(json.dumps(TRACES))
+
+    assert len(rows) == 1
+    row = rows[0]
+    assert row["duration_ns"] == 500
+    assert row["status_code"] == 1
+    assert row["events"] == [{"timestamp": 1200, "name": "retry", "attributes": {}}]
+
+
+def test_flatten_metrics():
+    flattener = OTLPFlattener("metrics")
+    rows = flattener.flatten(METRICS)
+
+    assert [row["metric_name"] for row in rows] == ["requests"] * 2 + ["latency"]
+    assert rows[0]["value"] == 5
+    assert rows[0]["is_monotonic"] is True
+    assert rows[0]["aggregation_temporality"] == 2
+    assert rows[2]["metric_type"] == "histogram"
+    assert rows[2]["bucket_counts"] == [1, 2]
+    assert flattener.stats.columns["value"] == "int64"
+
+
+def _varint(value):
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _field(number, wire, payload):
+    key = _varint(number << 3 | wire)
+    if wire == 2:
+        return key + _varint(len(payload)) + payload
+    return key + payload
+
+
+def _logs_protobuf():
+    value = _field(1, 2, b"api")
+    key_value = _field(1, 2, b"service.name") + _field(2, 2, value)
+    resource = _field(1, 2, key_value)
+    record = (
+        _field(1, 1, struct.pack("<Q", 1700000000000000000))
+        + _field(2, 0, _varint(9))
+        + _field(5, 2, _field(3, 0, _varint(42)))
+        + _field(9, 2, bytes.fromhex(TRACE_ID))
+        + _field(10, 2, bytes.fromhex(SPAN_ID))
+        + _field(99, 0, _varint(1))  # unknown fields are skipped
+    )
+    scope_logs = _field(1, 2, _field(1, 2, b"lib")) + _field(2, 2, record)
+    resource_logs = _field(1, 2, resource) + _field(2, 2, scope_logs)
+    return _field(1, 2, resource_logs)
+
+
+def test_decode_protobuf_matches_json():
+    request = decode_otlp(_logs_protobuf(), "logs", encoding="protobuf")
+    record = request["resourceLogs"][0]["scopeLogs"][0]["logRecords"][0]
+
+    assert record["timeUnixNano"] == 1700000000000000000
+    assert record["traceId"] == TRACE_ID
+    assert record["body"] == {"intValue": 42}
+
+    row = OTLPFlattener("logs").flatten(request)[0]
+    assert row["body"] == 42
+    assert row["resource_attributes"] == {"service.name": "api"}
+
+
+def test_decode_invalid_protobuf():
+    with pytest.raises(ValueError):
+        decode_otlp(b"\x0a\xff", "logs", encoding="protobuf")
+
+
+def test_read_files(tmp_path):
+    jsonl = tmp_path / "logs.jsonl"
+    jsonl.write_text("\n".join(json.dumps(LOGS) for _ in range(3)))
+    pretty = tmp_path / "logs.json"
+    pretty.write_text(json.dumps(LOGS, indent=2))
+    data = _logs_protobuf()
+    binary = tmp_path / "logs.binpb"
+    binary.write_bytes((struct.pack(">I", len(data)) + data) * 2)
+
+    assert len(list(read_otlp(jsonl, "logs"))) == 3
+    assert len(list(read_otlp(pretty, "logs"))) == 1
+    assert len(list(read_otlp(binary, "logs"))) == 2
+
+    flattener = OTLPFlattener("logs")
+    sample = flattener.preview(jsonl, sample=3)
+    assert len(sample) == 3
+    assert flattener.stats.rows == 6
+    assert flattener.stats.input_bytes == jsonl.stat().st_size
+
+
+def test_invalid_signal():
+    with pytest.raises(ValueError):
+        OTLPFlattener("kafka")
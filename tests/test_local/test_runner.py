@@ -0,0 +1,132 @@
+import json
+
+import pytest
+
+from glassflow.etl import Pipeline
+from glassflow.etl.local import PipelineDryRun, read_events
+from glassflow.etl.models import PipelineConfig
+from tests.data import pipeline_configs
+
+
+@pytest.fixture
+def join_config():
+    config = pipeline_configs.get_valid_pipeline_config()
+    config["transforms"] = [
+        {
+            "type": "dedup",
+            "source_id": "orders",
+            "config": {"key": "order_id", "time_window": "1h"},
+        },
+        {
+            "type": "filter",
+            "source_id": "user-logins",
+            "config": {"expression": "user_id == 'bot'"},
+        },
+    ]
+    config["sink"]["max_batch_size"] = 2
+    return PipelineConfig(**config)
+
+
+def logins():
+    return [
+        {"session_id": "s1", "user_id": "u1", "timestamp": 0},
+        {"session_id": "s2", "user_id": "bot", "timestamp": 1},
+        {"session_id": "s3", "user_id": "u2", "timestamp": 2},
+    ]
+
+
+def orders():
+    return [
+        {"order_id": "o1", "user_id": "u1", "timestamp": 3},
+        {"order_id": "o1", "user_id": "u1", "timestamp": 4},
+        {"order_id": "o2", "user_id": "u2", "timestamp": 5},
+        {"order_id": "o3", "user_id": "bot", "timestamp": 6},
+    ]
+
+
+def write_jsonl(path, events):
+    path.write_text("".join(json.dumps(e) + "\n" for e in events))
+    return path
+
+
+def test_join_pipeline_to_file_sink(join_config, tmp_path):
+    out = tmp_path / "batches.jsonl"
+    dry_run = PipelineDryRun(join_config, sink=out, time_field="timestamp")
+    report = dry_run.run(
+        {
+            "user-logins": write_jsonl(tmp_path / "logins.jsonl", logins()),
+            "orders": orders(),
+        }
+    )
+
+    batches = [json.loads(line) for line in out.read_text().splitlines()]
+    assert [len(b["rows"]) for b in batches] == [2]
+    batch = batches[0]
+    assert batch["table"] == "user_orders"
+    assert batch["database"] == "default"
+    assert batch["columns"][:3] == ["session_id", "user_id", "order_id"]
+    assert batch["types"][:3] == ["String", "String", "String"]
+    assert [row[0] for row in batch["rows"]] == ["s1", "s3"]
+    assert [row[2] for row in batch["rows"]] == ["o1", "o2"]
+
+    assert report.rows == 2
+    assert report.batches == 1
+    assert report.stage("read", "orders").events_out == 4
+    assert report.stage("dedup", "orders").events_out == 3
+    assert report.stage("filter", "user-logins").events_out == 2
+    assert report.stage("join").events_in == 5
+    assert report.stage("join").events_out == 2
+    assert report.stage("sink").events_in == 2
+    assert "join" in report.to_table()
+
+
+def test_pipeline_without_join(tmp_path):
+    config = PipelineConfig(**pipeline_configs.get_valid_config_without_joins())
+    events = [
+        {"session_id": f"s{i % 3}", "user_id": "u", "timestamp": i} for i in range(6)
+    ]
+    dry_run = PipelineDryRun(config, time_field="timestamp", batch_size=4)
+    report = dry_run.run({"user-logins": iter(events)})
+
+    assert [len(b[0]["rows"]) for b in dry_run.sink.batches] == [1, 1, 1]
+    assert dry_run.sink.batches[0][0]["rows"] == [["s0", "u", 0]]
+    assert report.stage("dedup", "user-logins").events_out == 3
+    assert report.rows == 3
+
+
+def test_unknown_inputs_are_rejected(join_config):
+    with pytest.raises(ValueError, match="payments"):
+        PipelineDryRun(join_config).run({"payments": []})
+
+
+def test_file_sink_is_closed_after_each_run(join_config, tmp_path):
+    out = tmp_path / "batches.jsonl"
+    dry_run = PipelineDryRun(join_config, sink=out, time_field="timestamp")
+    inputs = {"user-logins": logins(), "orders": orders()}
+
+    dry_run.run(inputs)
+    assert dry_run.sink._file.closed
+    dry_run.run(inputs)
+    assert dry_run.sink._file.closed
+    with pytest.raises(ValueError):
+        dry_run.run({"payments": []})
+    assert dry_run.sink._file.closed
+
+    assert len(out.read_text().splitlines()) == 2
+
+
+def test_read_events_in_batches(tmp_path):
+    path = write_jsonl(tmp_path / "events.jsonl", [{"i": i} for i in range(5)])
+    assert [len(b) for b in read_events(path, batch_size=2)] == [2, 2, 1]
+    assert [len(b) for b in read_events(range(3), batch_size=5)] == [3]
+
+
+def test_pipeline_dry_run(tmp_path):
+    pipeline = Pipeline(config=pipeline_configs.get_valid_config_without_joins())
+    out = tmp_path / "batches.jsonl"
+    events = [{"session_id": "s1", "user_id": "u1", "timestamp": 0}]
+
+    report = pipeline.dry_run({"user-logins": events}, sink=str(out))
+
+    assert report.rows == 1
+    assert json.loads(out.read_text())["rows"] == [["s1", "u1", 0]]
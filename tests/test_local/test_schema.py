@@ -0,0 +1,98 @@
+import pytest
+
+from glassflow.etl.local import SchemaValidator
+from glassflow.etl.models import KafkaSource
+from tests.data import pipeline_configs
+
+SCHEMA = [
+    {"name": "id", "type": "uint8"},
+    {"name": "name", "type": "string"},
+    {"name": "score", "type": "float32"},
+    {"name": "active", "type": "bool"},
+    {"name": "user.tags", "type": "array"},
+]
+
+
+def test_valid_events():
+    validator = SchemaValidator(SCHEMA)
+    events = [
+        {"id": 1, "name": "a", "score": 1.5, "active": True, "user": {"tags": []}},
+        {"id": 255, "name": "b", "score": 2, "active": False},
+        {"id": 3.0},
+    ]
+
+    assert validator.validate(events) == [True, True, True]
+    assert validator.report.events == 3
+    assert validator.report.invalid == 0
+    assert validator.report.violations() == {}
+
+
+def test_violations_per_field_and_kind():
+    validator = SchemaValidator(SCHEMA)
+    events = [
+        {"id": 256, "name": "a"},
+        {"id": -1, "name": 5},
+        {"id": True, "score": 1e39},
+        {"id": 1.5, "user": {"tags": "x"}},
+        {"id": 7, "active": "yes"},
+    ]
+
+    assert validator.validate(events) == [False] * 5
+    report = validator.report
+    assert report.invalid == 5
+    assert report.invalid_rate == 1.0
+    violations = report.violations()
+    assert violations["id"].overflow == 2
+    assert violations["id"].mismatched == 2
+    assert violations["id"].examples == ["256", "-1", "True"]
+    assert violations["name"].mismatched == 1
+    assert violations["score"].overflow == 1
+    assert violations["user.tags"].mismatched == 1
+    assert violations["active"].mismatched == 1
+
+
+def test_not_nullable():
+    validator = SchemaValidator(SCHEMA[:2], nullable=False)
+    assert validator.validate([{"id": 1, "name": "a"}, {"id": 1}]) == [True, False]
+    assert validator.report.violations()["name"].missing == 1
+
+
+@pytest.mark.parametrize(
+    ("data_type", "value", "valid"),
+    [
+        ("int8", 127, True),
+        ("int8", -129, False),
+        ("int16", 32768, False),
+        ("int32", 2**31 - 1, True),
+        ("int64", 2**63, False),
+        ("uint32", 2**32, False),
+        ("uint64", 2**64 - 1, True),
+        ("float64", 1e300, True),
+        ("bytes", "aGk=", True),
+        ("map", {"a": 1}, True),
+        ("map", [1], False),
+    ],
+)
+def test_integer_widths_and_types(data_type, value, valid):
+    validator = SchemaValidator([{"name": "v", "type": data_type}])
+    assert validator.is_valid({"v": value}) is valid
+
+
+def test_validate_columns():
+    validator = SchemaValidator(SCHEMA[:2])
+    mask = validator.validate_columns({"id": [1, 300, 2], "name": ["a", "b", 3]})
+
+    assert mask == [True, False, False]
+    assert validator.report.invalid == 2
+    assert validator.report.violations()["id"].overflow == 1
+
+
+def test_from_kafka_source():
+    config = pipeline_configs.get_valid_pipeline_config()
+    source = KafkaSource(**config["sources"][0])
+    validator = SchemaValidator(source)
+    assert [f.name for f in validator.fields] == ["session_id", "user_id", "timestamp"]
+
+    source.schema_fields = None
+    with pytest.raises(ValueError):
+        SchemaValidator(source)
@@ -0,0 +1,136 @@
+import pytest
+
+from glassflow.etl.errors import InvalidExpressionError
+from glassflow.etl.local import StatelessEngine, kafka_coercer
+from glassflow.etl.models import KafkaDataType, StatelessTransform
+
+TRANSFORMS = [
+    {"expression": "lower(user.name)", "output_name": "name", "output_type": "string"},
+    {"expression": "amount * 100", "output_name": "cents", "output_type": "int32"},
+    {"expression": "amount > 10", "output_name": "large", "output_type": "bool"},
+    {"expression": "user.id", "output_name": "user_id", "output_type": "string"},
+]
+
+EVENTS = [
+    {"user": {"name": "Ann", "id": 7}, "amount": 12.5},
+    {"user": {"name": "Bob", "id": 8}, "amount": 3},
+    {"user": {"name": "Eve", "id": 9}, "amount": 1e12},
+    {"user": {"id": 10}, "amount": 1},
+]
+
+
+def test_apply_coerces_outputs():
+    engine = StatelessEngine(TRANSFORMS)
+    outputs = engine.apply(EVENTS[:2])
+
+    assert outputs == [
+        {"name": "ann", "cents": 1250, "large": True, "user_id": "7"},
+        {"name": "bob", "cents": 300, "large": False, "user_id": "8"},
+    ]
+    assert engine.output_schema == {
+        "name": KafkaDataType.STRING,
+        "cents": KafkaDataType.INT32,
+        "large": KafkaDataType.BOOL,
+        "user_id": KafkaDataType.STRING,
+    }
+    assert engine.fields == ("user", "amount")
+
+
+def test_failed_events_are_dropped_and_counted():
+    engine = StatelessEngine(TRANSFORMS)
+    outputs = engine.apply(EVENTS)
+
+    assert [o["user_id"] for o in outputs] == ["7", "8"]
+    assert engine.stats.evaluated == 4
+    assert engine.stats.transformed == 2
+    assert engine.stats.errors == 2
+    assert engine.stats.error_rate == pytest.approx(0.5)
+    assert engine.stats.last_error.startswith("name:")
+    assert engine.stats.throughput > 0
+
+
+def test_overflow_is_reported():
+    engine = StatelessEngine(TRANSFORMS)
+    assert engine.apply([EVENTS[2]]) == []
+    assert "out of range for int32" in engine.stats.last_error
+
+
+def test_apply_columns():
+    engine = StatelessEngine(
+        [
+            {"expression": "a + b", "output_name": "sum", "output_type": "float64"},
+            {"expression": "'x'", "output_name": "tag", "output_type": "string"},
+        ]
+    )
+    outputs = engine.apply_columns({"a": [1, 2, None], "b": [3, 4, 5]})
+
+    assert outputs == {"sum": [4.0, 6.0], "tag": ["x", "x"]}
+    assert engine.stats.errors == 1
+
+
+def test_apply_columns_without_fields():
+    engine = StatelessEngine(
+        [{"expression": "1 + 1", "output_name": "two", "output_type": "int"}]
+    )
+    assert engine.apply_columns({}, length=3) == {"two": [2, 2, 2]}
+
+
+def test_from_stateless_transform():
+    transform = StatelessTransform.model_validate(
+        {"source_id": "events", "config": {"transforms": TRANSFORMS[:1]}}
+    )
+    assert StatelessEngine(transform).apply(EVENTS[:1]) == [{"name": "ann"}]
+
+
+def test_invalid_configs():
+    with pytest.raises(InvalidExpressionError):
+        StatelessEngine(
+            [{"expression": "a +", "output_name": "x", "output_type": "int"}]
+        )
+    with pytest.raises(ValueError):
+        StatelessEngine(
+            [{"expression": "a", "output_name": "x", "output_type": "decimal"}]
+        )
+    with pytest.raises(ValueError, match="Duplicate output names: x"):
+        StatelessEngine(
+            [
+                {"expression": "a", "output_name": "x", "output_type": "int"},
+                {"expression": "b", "output_name": "x", "output_type": "int"},
+            ]
+        )
+
+
+@pytest.mark.parametrize(
+    ("data_type", "value", "expected"),
+    [
+        ("int8", "127", 127),
+        ("uint64", 2.0, 2),
+        ("int16", " 42.0 ", 42),
+        ("float32", 1, 1.0),
+        ("bool", "false", False),
+        ("string", {"a": 1}, '{"a":1}'),
+        ("bytes", "ab", b"ab"),
+        ("array", (1, 2), [1, 2]),
+        ("map", '{"a": 1}', {"a": 1}),
+        ("int64", None, None),
+    ],
+)
+def test_kafka_coercer(data_type, value, expected):
+    assert kafka_coercer(data_type)(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("data_type", "value"),
+    [
+        ("int8", 128),
+        ("uint8", -1),
+        ("int32", 1.5),
+        ("int64", float("inf")),
+        ("float32", 1e39),
+        ("bool", "maybe"),
+        ("array", 1),
+    ],
+)
+def test_kafka_coercer_rejects(data_type, value):
+    with pytest.raises((ValueError, TypeError, OverflowError)):
+        kafka_coercer(data_type)(value)
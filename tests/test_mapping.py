@@ -0,0 +1,83 @@
+import pytest
+
+from glassflow.etl import models
+from glassflow.etl.errors import InvalidDataTypeMappingError
+from glassflow.etl.mapping import (
+    check_sink_mapping,
+    check_sink_mappings,
+    sink_field_types,
+    sink_mapping_errors,
+)
+
+
+class TestSinkMapping:
+    """Tests for checking sink mappings against the upstream field types."""
+
+    def test_valid_mappings(self, valid_config, valid_config_without_joins):
+        """Test that the valid configs have no mapping errors."""
+        configs = [
+            models.PipelineConfig(**valid_config),
+            models.PipelineConfig(**valid_config_without_joins),
+        ]
+        for config in configs:
+            assert sink_mapping_errors(config) == []
+        check_sink_mappings(configs)
+
+    def test_join_output_field_types(self, valid_config):
+        """Test that join output names take the type of their source field."""
+        types = sink_field_types(models.PipelineConfig(**valid_config))
+        assert types["order_placed_at"] == models.KafkaDataType.STRING
+        assert types["upper_user_id"] == models.KafkaDataType.STRING
+
+    def test_incompatible_column_type(self, valid_config_without_joins):
+        """Test that every incompatible column type is reported."""
+        valid_config_without_joins["sink"]["mapping"][0]["column_type"] = "Int64"
+        valid_config_without_joins["sink"]["mapping"][1]["column_type"] = "Bool"
+        config = models.PipelineConfig(**valid_config_without_joins)
+
+        errors = sink_mapping_errors(config)
+        assert len(errors) == 2
+        assert "of type 'string' cannot be written" in errors[0]
+        with pytest.raises(InvalidDataTypeMappingError, match="test-pipeline"):
+            check_sink_mapping(config)
+
+    def test_stateless_output_type(self, valid_config_without_joins):
+        """Test that stateless outputs are checked with their output type."""
+        valid_config_without_joins["transforms"].append(
+            {
+                "type": "stateless",
+                "source_id": valid_config_without_joins["sink"]["source_id"],
+                "config": {
+                    "transforms": [
+                        {
+                            "expression": "1",
+                            "output_name": "session_id",
+                            "output_type": "int64",
+                        }
+                    ]
+                },
+            }
+        )
+        config = models.PipelineConfig(**valid_config_without_joins)
+        types = sink_field_types(config)
+        assert types["session_id"] == models.KafkaDataType.INT64
+
+    def test_unknown_types_are_not_checked(self, valid_otlp_logs_config):
+        """Test that mappings of sources without a schema are not checked."""
+        config = models.PipelineConfig(**valid_otlp_logs_config)
+        assert sink_field_types(config) is None
+        check_sink_mapping(config)
+
+    def test_check_sink_mappings_reports_every_pipeline(
+        self, valid_config_without_joins
+    ):
+        """Test that the bulk check reports the errors of all configs."""
+        valid_config_without_joins["sink"]["mapping"][0]["column_type"] = "Int64"
+        first = models.PipelineConfig(**valid_config_without_joins)
+        second = first.model_copy(update={"pipeline_id": "other-pipeline"})
+
+        with pytest.raises(InvalidDataTypeMappingError) as exc_info:
+            check_sink_mappings([first, second])
+        message = str(exc_info.value)
+        assert "Pipeline 'test-pipeline'" in message
+        assert "Pipeline 'other-pipeline'" in message
@@ -0,0 +1,100 @@
+import pytest
+from pydantic import ValidationError
+
+from glassflow.etl import models
+from glassflow.etl.models import ClickhouseType, parse_clickhouse_type
+from glassflow.etl.models.clickhouse_types import is_compatible
+
+
+class TestClickhouseTypes:
+    """Tests for parsing ClickHouse type strings."""
+
+    @pytest.mark.parametrize(
+        "type_string,canonical",
+        [
+            ("string", "String"),
+            ("Array( lowcardinality(uint32) )", "Array(LowCardinality(UInt32))"),
+            ("DateTime64(3,'UTC')", "DateTime64(3, 'UTC')"),
+            ("Nullable(Decimal(18,4))", "Nullable(Decimal(18, 4))"),
+            ("Map(String, Array(UInt64))", "Map(String, Array(UInt64))"),
+            ("Enum8('a'=1, 'b'=2)", "Enum8('a' = 1, 'b' = 2)"),
+            ("Tuple(a String, b Int32)", "Tuple(a String, b Int32)"),
+            ("FixedString(16)", "FixedString(16)"),
+        ],
+    )
+    def test_parse(self, type_string, canonical):
+        """Test that types are parsed to their canonical spelling."""
+        parsed = parse_clickhouse_type(type_string)
+        assert isinstance(parsed, ClickhouseType)
+        assert str(parsed) == canonical
+
+    def test_parse_interns_types(self):
+        """Test that equivalent spellings give the same object."""
+        first = parse_clickhouse_type("array(lowcardinality(string))")
+        assert first is parse_clickhouse_type("Array(LowCardinality(String))")
+        assert first.arguments[0] is parse_clickhouse_type("LowCardinality(String)")
+
+    def test_parse_enum_members(self):
+        """Test that every ClickhouseDataType member can be parsed."""
+        for member in models.ClickhouseDataType:
+            assert str(parse_clickhouse_type(member.value)) == member.value
+
+    @pytest.mark.parametrize(
+        "type_string",
+        [
+            "NotAType",
+            "Array(String",
+            "Map(String)",
+            "Int8(3)",
+            "DateTime64(12)",
+            "Decimal(100, 2)",
+            "FixedString('a')",
+        ],
+    )
+    def test_parse_invalid(self, type_string):
+        """Test that invalid types raise a ValueError."""
+        with pytest.raises(ValueError, match="Invalid ClickHouse type"):
+            parse_clickhouse_type(type_string)
+
+    def test_nullable_and_unwrapped(self):
+        """Test the modifiers of a parsed type."""
+        parsed = parse_clickhouse_type("LowCardinality(Nullable(String))")
+        assert parsed.nullable
+        assert parsed.unwrapped() is parse_clickhouse_type("String")
+        assert not parse_clickhouse_type("Array(Nullable(String))").nullable
+
+    def test_is_compatible_with_parametric_types(self):
+        """Test that modifiers and parameters do not affect compatibility."""
+        assert is_compatible("int64", "Nullable(DateTime64(6, 'UTC'))")
+        assert is_compatible("string", "LowCardinality(FixedString(3))")
+        assert is_compatible("array", "Array(Nullable(Int32))")
+        assert not is_compatible("string", "Decimal(10, 2)")
+
+    def test_sink_field_mapping_parametric_type(self):
+        """Test that mappings accept types without an enum member."""
+        mapping = models.SinkFieldMapping(
+            name="ts", column_name="ts", column_type="datetime64(6, 'UTC')"
+        )
+        assert mapping.column_type == "DateTime64(6, 'UTC')"
+        listed = models.SinkFieldMapping(
+            name="id", column_name="id", column_type="string"
+        )
+        assert listed.column_type is models.ClickhouseDataType.STRING
+
+    def test_sink_field_mapping_rejects_unmapped_types(self):
+        """Test that types no Kafka type maps to need an explicit opt-in."""
+        data = {"name": "amount", "column_name": "amount"}
+        for column_type in ("Decimal(18, 4)", "Int128", "IPv4"):
+            with pytest.raises(ValidationError, match="not supported"):
+                models.SinkFieldMapping(**data, column_type=column_type)
+        mapping = models.SinkFieldMapping.model_validate(
+            {**data, "column_type": "decimal(18, 4)"},
+            context=models.ANY_COLUMN_TYPE_CONTEXT,
+        )
+        assert mapping.column_type == "Decimal(18, 4)"
+
+    def test_sink_field_mapping_schema_lists_enum(self):
+        """Test that the JSON schema of column_type keeps the enum members."""
+        schema = models.SinkFieldMapping.model_json_schema()
+        enum = schema["properties"]["column_type"]["anyOf"][0]["enum"]
+        assert enum == [t.value for t in models.ClickhouseDataType]
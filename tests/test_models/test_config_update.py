@@ -1,5 +1,7 @@
 """Tests for config update methods."""
 
+import pytest
+
 from glassflow.etl import models
 
 
@@ -117,6 +119,65 @@ class TestPipelineConfigUpdate:
         assert updated.sources == config.sources
         assert updated.sink == config.sink
 
+    def test_update_shares_unchanged_sections(self, valid_config):
+        """Test that only the patched branches are copied."""
+        config = models.PipelineConfig(**valid_config)
+        patch = models.PipelineConfigPatch(
+            sink=models.SinkConfigPatch(table="new_table")
+        )
+
+        updated = config.update(patch)
+
+        assert updated.sink.table == "new_table"
+        assert config.sink.table != "new_table"
+        assert updated.sources is config.sources
+        assert updated.transforms is config.transforms
+        assert updated.join is config.join
+        assert updated.sink.connection_params is config.sink.connection_params
+
+    def test_update_keeps_fingerprints_of_shared_sections(self, valid_config):
+        """Test that fingerprints stay correct across updates."""
+        config = models.PipelineConfig(**valid_config)
+        config.fingerprint()
+        patch = models.PipelineConfigPatch(name="Renamed")
+
+        updated = config.update(patch)
+
+        rebuilt = models.PipelineConfig(**{**valid_config, "name": "Renamed"})
+        assert updated.fingerprint() == rebuilt.fingerprint()
+        assert updated.section_fingerprint("sources") == config.section_fingerprint(
+            "sources"
+        )
+
+    def test_update_validate(self, valid_config):
+        """Test that validate=True checks the sections set in the patch."""
+        config = models.PipelineConfig(**valid_config)
+        transforms = [t.model_copy() for t in config.transforms]
+        transforms[0] = transforms[0].model_copy(update={"source_id": "unknown"})
+        patch = models.PipelineConfigPatch(transforms=transforms)
+
+        assert config.update(patch).transforms[0].source_id == "unknown"
+        with pytest.raises(ValueError, match="Transform source_id 'unknown'"):
+            config.update(patch, validate=True)
+
+    def test_update_validate_join_fields(self, valid_config_without_joins):
+        """Test that validate=True runs the checks of a patched join."""
+        config = models.PipelineConfig(**valid_config_without_joins)
+        patch = models.PipelineConfigPatch(join=models.JoinConfigPatch(enabled=True))
+
+        with pytest.raises(ValueError, match="type is required"):
+            config.update(patch, validate=True)
+
+    def test_config_errors_scoped_to_sections(self, valid_config):
+        """Test that only the checks reading the given sections run."""
+        config = models.PipelineConfig(**valid_config)
+        config.join.left_source.source_id = "unknown"
+
+        assert config.config_errors(["sink", "name"]) == []
+        assert len(config.config_errors(["join"])) == 1
+        with pytest.raises(ValueError, match="Unknown config section"):
+            config.config_errors(["unknown"])
+
 
 class TestKafkaSourceUpdate:
     """Tests for KafkaSource.update() method."""
@@ -285,3 +346,19 @@ class TestKafkaConnectionParamsUpdate:
         assert updated.username == "new-user"
         assert updated.password == "new-pass"
         assert updated.mechanism == models.KafkaMechanism.PLAIN
+
+    def test_update_keeps_unpatched_fields(self, valid_config):
+        """Test that the update copies the params without re-validating them."""
+        conn_params = models.KafkaConnectionParams(
+            **valid_config["sources"][0]["connection_params"]
+        )
+        patch = models.KafkaConnectionParamsPatch(skip_tls_verification=True)
+
+        updated = conn_params.update(patch)
+
+        assert updated.skip_tls_verification is True
+        assert conn_params.skip_tls_verification is False
+        assert updated.brokers is conn_params.brokers
+        assert updated.model_dump(exclude={"skip_tls_verification"}) == (
+            conn_params.model_dump(exclude={"skip_tls_verification"})
+        )
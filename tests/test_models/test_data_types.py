@@ -1,6 +1,7 @@
 import pytest
 
 from glassflow.etl import models
+from glassflow.etl.models.clickhouse_types import is_compatible
 
 
 class TestDataTypeCompatibility:
@@ -31,3 +32,11 @@ class TestDataTypeCompatibility:
         """Test that invalid Kafka type raises a validation error."""
         with pytest.raises(ValueError):
             models.KafkaField(name="ts", type="not_a_type")
+
+    def test_is_compatible(self):
+        """Test lookups in the Kafka to ClickHouse compatibility matrix."""
+        assert is_compatible(models.KafkaDataType.INT64, "DateTime64")
+        assert is_compatible("STRING", "lowcardinality(string)")
+        assert not is_compatible(models.KafkaDataType.INT8, "Int64")
+        assert not is_compatible("not_a_type", "String")
+        assert not is_compatible("string", "NotAValidType")
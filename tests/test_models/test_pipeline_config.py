@@ -162,6 +162,96 @@ class TestPipelineConfig:
         assert config.resources.nats is None
         assert config.resources.transform is None
 
+    def test_model_validate_trusted(self, valid_config):
+        """Test that trusted validation builds the same config."""
+        trusted = models.PipelineConfig.model_validate_trusted(valid_config)
+        assert trusted == models.PipelineConfig.model_validate(valid_config)
+        assert trusted.name == "Test Pipeline"
+        assert isinstance(trusted.sources[0], models.KafkaSource)
+
+    def test_model_validate_trusted_skips_cross_references(self, valid_config):
+        """Test that trusted validation skips the cross-reference checks."""
+        valid_config["transforms"][0]["source_id"] = "unknown-source"
+        with pytest.raises(ValueError):
+            models.PipelineConfig.model_validate(valid_config)
+
+        config = models.PipelineConfig.model_validate_trusted(valid_config)
+        assert config.transforms[0].source_id == "unknown-source"
+
+    def test_model_validate_trusted_checks_types(self, valid_config):
+        """Test that trusted validation still validates field types."""
+        valid_config["sources"][0]["type"] = "unknown"
+        with pytest.raises(ValueError):
+            models.PipelineConfig.model_validate_trusted(valid_config)
+
+    def test_config_errors_reports_all_errors(self, valid_config):
+        """Test that every cross-reference error is reported at once."""
+        valid_config["sources"].append(dict(valid_config["sources"][0]))
+        valid_config["transforms"][0]["source_id"] = "unknown-source"
+        valid_config["join"]["left_source"]["key"] = "unknown-field"
+
+        with pytest.raises(ValueError) as exc_info:
+            models.PipelineConfig.model_validate(valid_config)
+        message = str(exc_info.value)
+        assert "3 errors in pipeline config" in message
+        assert "Duplicate source_id(s) found" in message
+        assert "Transform source_id 'unknown-source'" in message
+        assert "Join key 'unknown-field' does not exist" in message
+
+    def test_config_errors_empty_for_valid_config(self, valid_config):
+        """Test that a consistent config has no cross-reference errors."""
+        config = models.PipelineConfig.model_validate(valid_config)
+        assert config.config_errors() == []
+
+    def test_config_errors_see_in_place_changes(self, valid_config):
+        """Test that sources mutated after construction are checked again."""
+        config = models.PipelineConfig.model_validate(valid_config)
+
+        config.sources.append(config.sources[0])
+        assert any("Duplicate source_id" in e for e in config.config_errors())
+
+        config.sources.pop()
+        source_id = config.sources[0].source_id
+        config.sources[0].source_id = "renamed"
+        errors = config.config_errors()
+        assert any(f"'{source_id}'" in e for e in errors)
+
+    def test_fingerprint_is_canonical(self, valid_config):
+        """Test that equal configs have equal fingerprints."""
+        config = models.PipelineConfig.model_validate(valid_config)
+        valid_config["version"] = "V3"
+        valid_config["sources"][0]["connection_params"]["protocol"] = "sasl_ssl"
+        valid_config["metadata"] = {}
+        other = models.PipelineConfig.model_validate(valid_config)
+
+        assert other.canonical_json() == config.canonical_json()
+        assert other.fingerprint() == config.fingerprint()
+        assert other == config
+
+    def test_fingerprint_sees_in_place_changes(self, valid_config):
+        """Test that sections mutated after construction change the fingerprint."""
+        config = models.PipelineConfig.model_validate(valid_config)
+        fingerprint = config.fingerprint()
+        sink = config.section_fingerprint("sink")
+
+        config.sink.table = "other"
+
+        assert config.section_fingerprint("sink") != sink
+        assert config.fingerprint() != fingerprint
+
+    def test_fingerprint_changes_with_sections(self, valid_config):
+        """Test that assigning a section changes its fingerprint only."""
+        config = models.PipelineConfig.model_validate(valid_config)
+        fingerprint = config.fingerprint()
+        sink = config.section_fingerprint("sink")
+
+        config.name = "Renamed"
+        assert config.fingerprint() != fingerprint
+        assert config.section_fingerprint("sink") == sink
+
+        with pytest.raises(ValueError, match="Unknown config section"):
+            config.section_fingerprint("unknown")
+
 
 class TestPipelineConfigOTLP:
     """Tests for PipelineConfig with an OTLP source."""
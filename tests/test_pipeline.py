@@ -124,6 +124,30 @@ class TestPipelineGet:
             assert ("schema", "src-logins:1001") in params
             assert ("schema", "src-orders:2002") in params
 
+    def test_get_lazy(
+        self, pipeline, mock_success, get_pipeline_response, get_health_payload
+    ):
+        """get(lazy=True) builds the config on first access."""
+        with mock_success(
+            [get_pipeline_response, get_health_payload(pipeline.pipeline_id)]
+        ):
+            pipeline.get(lazy=True)
+        assert pipeline._raw_config is not None
+        assert pipeline.config.pipeline_id == get_pipeline_response["pipeline_id"]
+        assert pipeline._raw_config is None
+
+    def test_get_lazy_validates_on_access(
+        self, pipeline, mock_success, get_pipeline_response, get_health_payload
+    ):
+        """get(lazy=True) runs the cross-reference checks on first access."""
+        get_pipeline_response["transforms"][0]["source_id"] = "unknown-source"
+        with mock_success(
+            [get_pipeline_response, get_health_payload(pipeline.pipeline_id)]
+        ):
+            pipeline.get(lazy=True)
+        with pytest.raises(ValueError, match="unknown-source"):
+            _ = pipeline.config
+
     def test_get_with_empty_schema_versions(
         self, pipeline, mock_success, get_pipeline_response, get_health_payload
     ):
@@ -0,0 +1,37 @@
+"""Tests for the batch sinks."""
+
+import pytest
+
+from glassflow.etl import FileSink, InMemorySink, RedriveSink
+
+
+class TestRedriveSink:
+    """Test cases for RedriveSink class."""
+
+    def test_write_is_abstract(self):
+        with pytest.raises(TypeError):
+            RedriveSink()
+
+
+class TestInMemorySink:
+    """Test cases for InMemorySink class."""
+
+    def test_keeps_batches(self):
+        sink = InMemorySink()
+        sink.write([1, 2])
+        sink.write([3])
+
+        assert sink.batches == [[1, 2], [3]]
+        assert sink.payloads == [1, 2, 3]
+
+
+class TestFileSink:
+    """Test cases for FileSink class."""
+
+    def test_write_json_lines(self, tmp_path):
+        path = tmp_path / "out.jsonl"
+        sink = FileSink(path, fsync=False)
+        sink.write([b'{"a": 1}', {"b": 2}, "plain"])
+        sink.close()
+
+        assert path.read_bytes().splitlines() == [b'{"a": 1}', b'{"b":2}', b"plain"]
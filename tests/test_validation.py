@@ -0,0 +1,117 @@
+"""Tests for bulk validation of pipeline config files."""
+
+import json
+
+import yaml
+
+from glassflow.etl import BulkConfigValidator, ConfigValidationReport
+from glassflow.etl.validation import find_config_files, validate_config_file
+
+
+def write_config(path, config):
+    with open(path, "w") as f:
+        if path.suffix == ".json":
+            json.dump(config, f)
+        else:
+            yaml.dump(config, f)
+    return path
+
+
+class TestBulkConfigValidator:
+    """Test cases for BulkConfigValidator class."""
+
+    def test_valid_files(self, tmp_path, valid_config, valid_config_without_joins):
+        """Test that valid YAML and JSON files have no errors."""
+        write_config(tmp_path / "a.yaml", valid_config)
+        write_config(tmp_path / "b.json", valid_config_without_joins)
+
+        report = BulkConfigValidator(max_workers=1).validate([tmp_path])
+
+        assert [r.file for r in report.results] == [
+            str(tmp_path / "a.yaml"),
+            str(tmp_path / "b.json"),
+        ]
+        assert report.valid
+        assert report.results[0].pipeline_id == valid_config["pipeline_id"]
+
+    def test_field_errors_are_located(self, tmp_path, valid_config):
+        """Test that every field error is reported with its path in the file."""
+        valid_config["sources"][1]["topic"] = 5
+        valid_config["sink"]["mapping"][0]["column_type"] = "Nullable("
+        path = write_config(tmp_path / "config.yaml", valid_config)
+
+        result = validate_config_file(path)
+
+        assert not result.valid
+        assert [issue.path for issue in result.errors] == [
+            "sources.1.topic",
+            "sink.mapping.0.column_type",
+        ]
+        assert result.errors[0].loc == ["sources", 1, "topic"]
+
+    def test_reference_errors_are_located(self, tmp_path, valid_config):
+        """Test that cross-reference errors are reported with their paths."""
+        valid_config["transforms"][0]["source_id"] = "unknown"
+        valid_config["join"]["left_source"]["key"] = "unknown"
+        path = write_config(tmp_path / "config.json", valid_config)
+
+        result = validate_config_file(path)
+
+        assert {issue.path for issue in result.errors} == {
+            "transforms.0.source_id",
+            "join.left_source.key",
+        }
+        assert {issue.type for issue in result.errors} == {"reference"}
+
+    def test_unreadable_files(self, tmp_path):
+        """Test that missing and malformed files are reported, not raised."""
+        (tmp_path / "broken.json").write_text("{")
+
+        report = BulkConfigValidator().validate(
+            [tmp_path / "broken.json", tmp_path / "missing.yaml"]
+        )
+
+        assert [r.errors[0].type for r in report.results] == [
+            "parse_error",
+            "read_error",
+        ]
+        assert report.error_count == 2
+
+    def test_process_pool(self, tmp_path, valid_config, invalid_config):
+        """Test that results keep the input order when validated in parallel."""
+        paths = []
+        for i in range(40):
+            config = invalid_config if i % 5 == 0 else valid_config
+            paths.append(write_config(tmp_path / f"{i:02d}.yaml", config))
+
+        report = BulkConfigValidator(max_workers=2).validate(paths)
+
+        assert [r.file for r in report.results] == [str(p) for p in paths]
+        assert [r.valid for r in report.results] == [i % 5 != 0 for i in range(40)]
+        assert len(report.invalid) == 8
+
+    def test_machine_readable_report(self, tmp_path, valid_config):
+        """Test that the JSON report round-trips and includes the summary."""
+        valid_config["sources"][0]["topic"] = 5
+        path = write_config(tmp_path / "config.yaml", valid_config)
+
+        report = BulkConfigValidator().validate([path])
+        data = json.loads(report.model_dump_json())
+
+        assert data["valid"] is False
+        assert data["error_count"] == 1
+        assert data["results"][0]["errors"][0]["path"] == "sources.0.topic"
+        assert ConfigValidationReport.model_validate(data) == report
+        assert report.to_text().startswith(f"{path}:sources.0.topic: ")
+
+    def test_find_config_files(self, tmp_path, valid_config):
+        """Test that directories are searched recursively for config files."""
+        (tmp_path / "nested").mkdir()
+        write_config(tmp_path / "nested" / "b.yml", valid_config)
+        write_config(tmp_path / "a.json", valid_config)
+        (tmp_path / "notes.txt").write_text("")
+
+        assert find_config_files([tmp_path]) == [
+            str(tmp_path / "a.json"),
+            str(tmp_path / "nested" / "b.yml"),
+        ]